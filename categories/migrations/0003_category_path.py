@@ -0,0 +1,41 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:08
+
+from typing import Any
+
+from django.db import migrations, models
+
+
+def fill_category_paths(apps: Any, schema_editor: Any) -> None:
+    Category = apps.get_model('categories', 'Category')
+    categories = list(Category.objects.only('id', 'parent_id'))
+    parents = {category.id: category.parent_id for category in categories}
+
+    def path_of(category_id: int) -> str:
+        parent_id = parents[category_id]
+        return f'{path_of(parent_id) if parent_id else "/"}{category_id}/'
+
+    for category in categories:
+        category.path = path_of(category.id)
+        category.depth = category.path.count('/') - 2
+    Category.objects.bulk_update(categories, ['path', 'depth'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0002_alter_category_parent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='path',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=255),
+        ),
+        migrations.RunPython(fill_category_paths, migrations.RunPython.noop),
+    ]
@@ -1,15 +1,63 @@
-from django.db import models
+from typing import Any
+
+from django.db import models, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Substr
 
 from config.basemodel import BaseModel
 
 
 # Create your models here.
 class Category(BaseModel):
+    PATH_SEPARATOR = '/'
+
     name = models.CharField(max_length=100)
     parent = models.ForeignKey('self', on_delete=models.CASCADE, related_name='children', null=True, blank=True)
-    
+    # 루트부터 자신까지의 id 경로 (예: "/1/5/12/"), 하위 트리는 path 접두사 검색 한 번으로 조회한다
+    path = models.CharField(max_length=255, db_index=True, editable=False, default='')
+    depth = models.PositiveSmallIntegerField(default=0, editable=False)
+
     def __str__(self) -> str:
         return self.name
-    
+
     class Meta:
         db_table = 'categories'
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            self._sync_path()
+
+    def _sync_path(self) -> None:
+        # 메모리의 부모 인스턴스는 그 사이 옮겨졌을 수 있으므로 DB 의 경로를 기준으로 한다
+        parent_path = self.PATH_SEPARATOR
+        if self.parent_id:
+            parent_path = Category.objects.values_list('path', flat=True).get(pk=self.parent_id)
+        new_path = f'{parent_path}{self.pk}{self.PATH_SEPARATOR}'
+        if new_path == self.path:
+            return
+
+        if f'{self.PATH_SEPARATOR}{self.pk}{self.PATH_SEPARATOR}' in parent_path:
+            raise ValueError("카테고리를 자신의 하위 카테고리 아래로 옮길 수 없습니다.")
+
+        old_path, new_depth = self.path, new_path.count(self.PATH_SEPARATOR) - 2
+        if old_path:
+            # 자신과 모든 하위 카테고리의 경로 접두사를 한 번의 UPDATE 로 바꾼다
+            Category.objects.filter(path__startswith=old_path).update(
+                path=Concat(Value(new_path), Substr('path', len(old_path) + 1)),
+                depth=F('depth') + (new_depth - self.depth),
+            )
+        else:
+            Category.objects.filter(pk=self.pk).update(path=new_path, depth=new_depth)
+        self.path, self.depth = new_path, new_depth
+
+    @property
+    def ancestor_ids(self) -> list[int]:
+        return [int(pk) for pk in self.path.strip(self.PATH_SEPARATOR).split(self.PATH_SEPARATOR)[:-1] if pk]
+
+    def get_ancestors(self) -> models.QuerySet['Category']:
+        return Category.objects.filter(pk__in=self.ancestor_ids).order_by('depth')
+
+    def get_descendants(self, include_self: bool = False) -> models.QuerySet['Category']:
+        descendants = Category.objects.filter(path__startswith=self.path).order_by('path')
+        return descendants if include_self else descendants.exclude(pk=self.pk)
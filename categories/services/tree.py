@@ -0,0 +1,113 @@
+import threading
+import uuid
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max
+
+from categories.models import Category
+
+
+class CategoryNode:
+    def __init__(self, pk: int, name: str, parent_id: Optional[int], path: str, depth: int) -> None:
+        self.pk = pk
+        self.name = name
+        self.parent_id = parent_id
+        self.path = path
+        self.depth = depth
+        self.children: list['CategoryNode'] = []
+
+    def __str__(self) -> str:
+        return self.name
+
+
+class CategoryTree:
+    """네비게이션용 카테고리 트리의 프로세스 내 캐시
+
+    트리 전체를 한 번의 쿼리로 읽어 두고, 공유 캐시의 버전 토큰이 바뀌었을 때만 다시 읽는다.
+    버전은 카운터 대신 무작위 토큰이라 캐시가 비워져도 이전 트리를 잘못 재사용하지 않는다.
+    캐시가 프로세스별(locmem)이면 다른 워커의 무효화가 보이지 않으므로 카테고리 수와 마지막 수정 시각을
+    집계해 버전으로 쓴다 (트리 전체 대신 집계 한 번).
+    """
+
+    VERSION_KEY = 'category_tree:version'
+
+    _lock = threading.Lock()
+    _version: Optional[str] = None
+    _nodes: dict[int, CategoryNode] = {}
+    _roots: list[CategoryNode] = []
+
+    @classmethod
+    def _current_version(cls) -> str:
+        if not settings.CACHE_IS_SHARED:
+            stats = Category.objects.aggregate(count=Count('id'), updated_at=Max('updated_at'))
+            return f"db:{stats['count']}:{stats['updated_at']}"
+        version = cache.get(cls.VERSION_KEY)
+        if version is None:
+            cache.add(cls.VERSION_KEY, uuid.uuid4().hex, None)
+            version = cache.get(cls.VERSION_KEY)
+        return str(version)
+
+    @classmethod
+    def _load(cls) -> dict[int, CategoryNode]:
+        version = cls._current_version()
+        if version == cls._version:
+            return cls._nodes
+
+        with cls._lock:
+            if version != cls._version:
+                categories = Category.objects.order_by('path').values_list('id', 'name', 'parent_id', 'path', 'depth')
+                nodes = {row[0]: CategoryNode(*row) for row in categories}
+                roots = []
+                # path 순으로 정렬되어 있어 부모가 항상 자식보다 먼저 나온다
+                for node in nodes.values():
+                    parent = nodes.get(node.parent_id) if node.parent_id else None
+                    if parent is None:
+                        roots.append(node)
+                    else:
+                        parent.children.append(node)
+                # 문자열 path 순서는 id 자릿수에 따라 달라지므로 형제끼리는 id 순으로 맞춘다
+                roots.sort(key=lambda node: node.pk)
+                for node in nodes.values():
+                    node.children.sort(key=lambda child: child.pk)
+                cls._nodes, cls._roots, cls._version = nodes, roots, version
+        return cls._nodes
+
+    @classmethod
+    def roots(cls) -> list[CategoryNode]:
+        cls._load()
+        return cls._roots
+
+    @classmethod
+    def get(cls, category_id: int) -> Optional[CategoryNode]:
+        return cls._load().get(category_id)
+
+    @classmethod
+    def ancestors(cls, category_id: int) -> list[CategoryNode]:
+        nodes = cls._load()
+        node = nodes.get(category_id)
+        if node is None:
+            return []
+        ancestor_ids = [int(pk) for pk in node.path.strip(Category.PATH_SEPARATOR).split(Category.PATH_SEPARATOR)[:-1]]
+        return [nodes[pk] for pk in ancestor_ids if pk in nodes]
+
+    @classmethod
+    def subtree_ids(cls, category_id: int) -> list[int]:
+        nodes = cls._load()
+        node = nodes.get(category_id)
+        if node is None:
+            return []
+        return [pk for pk, other in nodes.items() if other.path.startswith(node.path)]
+
+    @classmethod
+    def invalidate(cls) -> None:
+        cache.set(cls.VERSION_KEY, uuid.uuid4().hex, None)
+
+    @classmethod
+    def invalidate_on_commit(cls) -> None:
+        # 현재 트랜잭션 안의 조회는 바로 새 트리를 보게 하고,
+        # 커밋 전에 다른 프로세스가 이전 트리를 읽어 갔을 경우를 위해 커밋 후 한 번 더 올린다
+        cls.invalidate()
+        transaction.on_commit(cls.invalidate)
@@ -0,0 +1,13 @@
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from categories.models import Category
+from categories.services.tree import CategoryTree
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_tree(sender: type[Category], instance: Category, **kwargs: Any) -> None:
+    CategoryTree.invalidate_on_commit()
@@ -0,0 +1,108 @@
+from typing import Any
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from categories.models import Category
+from categories.services.tree import CategoryTree
+from users.models import User
+
+
+@pytest.mark.django_db
+class TestCategoryTree:
+    def setup_method(self) -> None:
+        cache.clear()
+        self.outer = Category.objects.create(name="아우터")
+        self.jacket = Category.objects.create(name="자켓", parent=self.outer)
+        self.blazer = Category.objects.create(name="블레이저", parent=self.jacket)
+        self.bottom = Category.objects.create(name="하의")
+
+    def test_path_is_built_on_create(self) -> None:
+        assert self.outer.path == f"/{self.outer.pk}/"
+        assert self.blazer.path == f"/{self.outer.pk}/{self.jacket.pk}/{self.blazer.pk}/"
+        assert self.blazer.depth == 2
+        assert Category.objects.get(pk=self.blazer.pk).path == self.blazer.path
+
+    def test_moving_category_rewrites_descendant_paths(self) -> None:
+        self.jacket.parent = self.bottom
+        self.jacket.save()
+
+        blazer = Category.objects.get(pk=self.blazer.pk)
+        assert blazer.path == f"/{self.bottom.pk}/{self.jacket.pk}/{self.blazer.pk}/"
+        assert blazer.depth == 2
+        assert list(self.outer.get_descendants()) == []
+
+    def test_moving_category_under_its_descendant_is_rejected(self) -> None:
+        self.outer.parent = self.blazer
+
+        with pytest.raises(ValueError):
+            self.outer.save()
+        assert Category.objects.get(pk=self.outer.pk).parent_id is None
+
+    def test_subtree_and_ancestors_take_one_query(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            descendants = list(self.outer.get_descendants())
+            ancestors = list(self.blazer.get_ancestors())
+
+        assert len(queries) == 2
+        assert descendants == [self.jacket, self.blazer]
+        assert ancestors == [self.outer, self.jacket]
+
+    def test_tree_is_cached_in_process(self, settings: Any) -> None:
+        settings.CACHE_IS_SHARED = True
+        CategoryTree.roots()
+
+        with CaptureQueriesContext(connection) as queries:
+            roots = CategoryTree.roots()
+            subtree = CategoryTree.subtree_ids(self.outer.pk)
+            ancestors = CategoryTree.ancestors(self.blazer.pk)
+
+        assert len(queries) == 0
+        assert [node.name for node in roots] == ["아우터", "하의"]
+        assert sorted(subtree) == sorted([self.outer.pk, self.jacket.pk, self.blazer.pk])
+        assert [node.name for node in ancestors] == ["아우터", "자켓"]
+
+    def test_save_and_delete_invalidate_tree(self) -> None:
+        CategoryTree.roots()
+
+        Category.objects.create(name="신발")
+        assert [node.name for node in CategoryTree.roots()] == ["아우터", "하의", "신발"]
+
+        self.outer.delete()
+        assert [node.name for node in CategoryTree.roots()] == ["하의", "신발"]
+        assert CategoryTree.get(self.blazer.pk) is None
+
+    def test_per_process_cache_checks_database_version(self) -> None:
+        # locmem 이면 다른 워커에서 일어난 변경(여기서는 시그널 없는 INSERT)도 DB 집계로 알아챈다
+        CategoryTree.roots()
+        Category.objects.bulk_create([Category(name="신발")])
+
+        with CaptureQueriesContext(connection) as queries:
+            CategoryTree.roots()
+        with CaptureQueriesContext(connection) as cached:
+            roots = CategoryTree.roots()
+
+        assert len(queries) == 2
+        assert len(cached) == 1
+        assert [node.name for node in roots] == ["아우터", "하의", "신발"]
+
+    def test_list_view_renders_tree(self) -> None:
+        client = Client()
+        admin_user = User.objects.create_user(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="create_test_user",
+            personal_info_consent=True,
+            terms_of_use=True
+        )
+        client.force_login(admin_user)
+
+        response = client.get(reverse('category-list'))
+
+        assert response.status_code == 200
+        assert "자켓" in response.content.decode()
@@ -3,7 +3,7 @@ from django.shortcuts import redirect, render
 from django.views import View
 
 from categories.forms.category import CategoryForm
-from categories.models import Category
+from categories.services.tree import CategoryTree
 from users.utils.permission import AdminPermission
 
 
@@ -11,7 +11,7 @@ class CategoryListView(AdminPermission, View):
     def get(self, request: HttpRequest) -> HttpResponse:
         form = CategoryForm()
         # 모든 대분류 카테고리들과 그 하위 카테고리들 조회
-        main_categories = Category.objects.filter(parent=None).prefetch_related('children')
+        main_categories = CategoryTree.roots()
         context = {
             'form': form,
             'main_categories': main_categories,
@@ -27,7 +27,7 @@ class CategoryListView(AdminPermission, View):
             return redirect('category-list')
         
         # 폼이 유효하지 않으면 에러와 함께 다시 렌더링
-        main_categories = Category.objects.filter(parent=None).prefetch_related('children')
+        main_categories = CategoryTree.roots()
         context = {
             'form': form,
             'main_categories': main_categories,
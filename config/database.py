@@ -0,0 +1,31 @@
+from typing import Any
+
+from django.db import connections
+from django.http import HttpRequest, JsonResponse
+from django.views import View
+
+from users.utils.permission import AdminPermission
+
+
+def connection_stats() -> dict[str, dict[str, Any]]:
+    """DB 별칭별 커넥션 재사용 설정과, 풀을 쓰는 경우 psycopg_pool 통계 (워커 프로세스 단위)"""
+    stats: dict[str, dict[str, Any]] = {}
+    for alias in connections:
+        connection = connections[alias]
+        # postgresql 백엔드만 pool 속성이 있고, 풀 설정이 없으면 None 이다
+        pool = getattr(connection, 'pool', None)
+        stats[alias] = {
+            'vendor': connection.vendor,
+            'conn_max_age': connection.settings_dict['CONN_MAX_AGE'],
+            'health_checks': connection.settings_dict['CONN_HEALTH_CHECKS'],
+            'pooled': pool is not None,
+            'connected': connection.connection is not None,
+        }
+        if pool is not None:
+            stats[alias]['pool'] = pool.get_stats()
+    return stats
+
+
+class DatabaseStatsView(AdminPermission, View):
+    def get(self, request: HttpRequest) -> JsonResponse:
+        return JsonResponse(connection_stats())
@@ -0,0 +1,154 @@
+import random
+import time
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Model
+from django.http import HttpRequest, HttpResponse
+
+# 복제본에서 읽어도 되는 앱 (사용자/세션은 로그인 직후 바로 읽어야 하므로 항상 primary)
+REPLICA_APP_LABELS = frozenset({'products'})
+PIN_COOKIE_NAME = 'db_pin'
+
+ViewFunc = TypeVar('ViewFunc', bound=Callable[..., Any])
+
+
+class RoutingState:
+    def __init__(self, pinned: bool = False) -> None:
+        self.pinned = pinned
+        self.replica_reads = False
+        self.wrote = False
+
+
+# 요청마다 미들웨어가 새 상태를 넣는다 (요청 밖의 명령/워커 스레드에서는 None 이라 항상 primary)
+_state: ContextVar[Optional[RoutingState]] = ContextVar('db_routing_state', default=None)
+
+
+class ReplicaRouter:
+    """스토어프런트 조회만 읽기 전용 복제본으로 보내는 라우터
+
+    replica_reads 로 표시한 뷰 안의 products 앱 조회만 복제본으로 가고, 쓰기와 트랜잭션 안의 조회,
+    그리고 최근에 쓰기를 한 브라우저(db_pin 쿠키)의 조회는 primary 로 간다.
+    """
+
+    def db_for_read(self, model: type[Model], **hints: Any) -> Optional[str]:
+        state = _state.get()
+        if (
+            state is None
+            or not state.replica_reads
+            or state.pinned
+            or not settings.DATABASE_REPLICAS
+            or model._meta.app_label not in REPLICA_APP_LABELS
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return None
+        return random.choice(settings.DATABASE_REPLICAS)
+
+    def db_for_write(self, model: type[Model], **hints: Any) -> str:
+        state = _state.get()
+        if state is not None and model._meta.app_label in REPLICA_APP_LABELS:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints: Any) -> bool:
+        # 복제본은 primary 와 같은 데이터이므로 어느 쪽에서 읽은 객체끼리도 연결할 수 있다
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, **hints: Any) -> bool:
+        return db not in settings.DATABASE_REPLICAS
+
+
+class ReplicaPinningMiddleware:
+    """쓰기를 한 브라우저는 DATABASE_REPLICA_PIN_SECONDS 동안 primary 에서 읽게 한다 (read-your-writes)"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def _pinned_until(request: HttpRequest) -> float:
+        try:
+            return float(request.COOKIES.get(PIN_COOKIE_NAME, 0))
+        except ValueError:
+            return 0
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if self.is_async:
+            return self.__acall__(request)
+        state = RoutingState(pinned=self._pinned_until(request) > time.time())
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self._pin_after_write(state, response)
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        # sync_to_async 로 넘어간 ORM 호출도 컨텍스트 복사본에서 같은 상태 객체를 본다
+        state = RoutingState(pinned=self._pinned_until(request) > time.time())
+        token = _state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _state.reset(token)
+        return self._pin_after_write(state, response)
+
+    @staticmethod
+    def _pin_after_write(state: RoutingState, response: HttpResponse) -> HttpResponse:
+        if state.wrote and settings.DATABASE_REPLICAS:
+            pin_seconds = settings.DATABASE_REPLICA_PIN_SECONDS
+            response.set_cookie(
+                PIN_COOKIE_NAME, str(int(time.time() + pin_seconds)), max_age=pin_seconds, httponly=True, samesite='Lax'
+            )
+        return response
+
+
+@contextmanager
+def _replica_reads_enabled(enabled: bool) -> Iterator[None]:
+    state = _state.get()
+    if state is None:
+        yield
+        return
+    previous, state.replica_reads = state.replica_reads, enabled
+    try:
+        yield
+    finally:
+        state.replica_reads = previous
+
+
+def replica_reads(view: ViewFunc) -> ViewFunc:
+    """이 뷰 안의 products 조회는 복제본에서 읽어도 된다고 표시한다"""
+    if iscoroutinefunction(view):
+        @wraps(view)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with _replica_reads_enabled(True):
+                return await view(*args, **kwargs)
+        return async_wrapper  # type: ignore[return-value]
+
+    @wraps(view)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with _replica_reads_enabled(True):
+            return view(*args, **kwargs)
+    return wrapper  # type: ignore[return-value]
+
+
+def mark_written() -> None:
+    """응답을 돌려준 뒤에 쓰는 스트리밍 뷰는 미들웨어가 쓰기를 볼 수 없으므로 미리 표시해 db_pin 쿠키를 받게 한다"""
+    state = _state.get()
+    if state is not None:
+        state.wrote = True
+
+
+def primary_reads() -> AbstractContextManager[None]:
+    """공유 캐시에 저장할 응답처럼 복제 지연이 오래 남으면 안 되는 조회를 primary 로 보낸다"""
+    return _replica_reads_enabled(False)
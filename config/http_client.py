@@ -0,0 +1,108 @@
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Optional
+
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class HttpClient:
+    """외부 API 호출용 공유 HTTP 클라이언트
+
+    프로세스마다 requests.Session 하나를 두고 호스트별 커넥션을 keep-alive 로 재사용한다.
+    모든 요청에 연결/읽기 timeout 을 걸고, 연결 실패는 메서드와 관계없이, 읽기 실패와
+    502/503/504 응답은 GET 같은 멱등 요청만 지수 백오프로 재시도한다.
+    a* 메서드는 같은 세션을 스레드에서 호출해 이벤트 루프를 막지 않는다.
+    """
+
+    RETRY_STATUSES = (502, 503, 504)
+
+    def __init__(
+        self,
+        *,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        backoff_factor: Optional[float] = None,
+        pool_maxsize: Optional[int] = None,
+    ) -> None:
+        # None 이면 settings 의 HTTP_CLIENT_* 값을 쓴다
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.pool_maxsize = pool_maxsize
+        self._lock = threading.Lock()
+        self._session: Optional[requests.Session] = None
+        self._pid = 0
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        return (
+            settings.HTTP_CLIENT_CONNECT_TIMEOUT if self.connect_timeout is None else self.connect_timeout,
+            settings.HTTP_CLIENT_READ_TIMEOUT if self.read_timeout is None else self.read_timeout,
+        )
+
+    def _build_session(self) -> requests.Session:
+        retries = settings.HTTP_CLIENT_RETRIES if self.retries is None else self.retries
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=settings.HTTP_CLIENT_BACKOFF_FACTOR if self.backoff_factor is None else self.backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False,
+        )
+        pool_maxsize = settings.HTTP_CLIENT_POOL_MAXSIZE if self.pool_maxsize is None else self.pool_maxsize
+        adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        # 여러 사용자의 요청이 세션을 공유하므로 응답 쿠키를 저장하지 않는다
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        # gunicorn preload 로 fork 된 워커는 부모의 소켓을 물려받지 않도록 세션을 새로 만든다
+        if self._session is None or self._pid != os.getpid():
+            with self._lock:
+                if self._session is None or self._pid != os.getpid():
+                    self._session = self._build_session()
+                    self._pid = os.getpid()
+        return self._session
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    async def arequest(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        response: requests.Response = await sync_to_async(self.request, thread_sensitive=False)(method, url, **kwargs)
+        return response
+
+    async def aget(self, url: str, **kwargs: Any) -> requests.Response:
+        return await self.arequest('GET', url, **kwargs)
+
+    async def apost(self, url: str, **kwargs: Any) -> requests.Response:
+        return await self.arequest('POST', url, **kwargs)
+
+
+http_client = HttpClient()
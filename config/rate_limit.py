@@ -0,0 +1,93 @@
+import ipaddress
+import math
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest
+
+
+def is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in ipaddress.ip_network(network, strict=False) for network in settings.RATE_LIMIT_TRUSTED_PROXIES)
+
+
+def client_ip(request: HttpRequest) -> str:
+    # nginx 가 X-Real-IP 를 $remote_addr 로 덮어쓰므로 프록시 뒤에서는 이 헤더가 실제 클라이언트 주소다
+    # 프록시를 거치지 않고 들어온 요청은 헤더를 마음대로 보낼 수 있으므로 신뢰하는 프록시에서 온 것만 쓴다
+    remote_addr = str(request.META.get('REMOTE_ADDR', ''))
+    header = settings.RATE_LIMIT_CLIENT_IP_HEADER
+    address = request.META.get(header, '') if header and is_trusted_proxy(remote_addr) else ''
+    return str(address or remote_addr or 'unknown')
+
+
+class RateLimiter:
+    """키별 요청 제한 (sliding window)
+
+    capacity / rate 초 길이의 창마다 허용한 요청 수를 캐시에 cache.add/incr 로 원자적으로 세고,
+    직전 창의 수를 지난 비율만큼 줄여 더한 값이 capacity 를 넘으면 거부한다. 평균 초당 rate 개,
+    연달아 최대 capacity 개를 허용해 토큰 버킷처럼 동작하고, 동시에 들어온 요청도 더 허용하지 않는다.
+    """
+
+    KEY_PREFIX = 'ratelimit'
+
+    def __init__(self, name: str, rate: float, capacity: int) -> None:
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+
+    @property
+    def window(self) -> float:
+        return self.capacity / self.rate
+
+    def _keys(self, identity: str, now: float) -> tuple[str, str, float]:
+        index, elapsed = divmod(now, self.window)
+        prefix = f'{self.KEY_PREFIX}:{self.name}:{identity}'
+        return f'{prefix}:{int(index)}', f'{prefix}:{int(index) - 1}', elapsed
+
+    def _timeout(self) -> int:
+        # 다음 창에서 직전 창으로 한 번 더 읽으므로 창 두 개 길이만큼 둔다 (창 안에서는 만료되지 않는다)
+        return math.ceil(self.window * 2) + 1
+
+    def _retry_after(self, previous: int, current: int, elapsed: float) -> float:
+        """이번 요청을 포함한 수(current)로 판단해 허용되면 0, 아니면 다음 요청까지 기다릴 초"""
+        if previous * (1 - elapsed / self.window) + current <= self.capacity:
+            return 0.0
+        allowed = current - 1
+        if allowed < self.capacity:
+            # 직전 창의 몫이 줄어들어 한 자리가 날 때까지
+            return (1 - (self.capacity - allowed - 1) / previous) * self.window - elapsed
+        # 이번 창이 가득 찼으면 다음 창에서 이번 창의 몫이 줄어들 때까지
+        return self.window - elapsed + max(0.0, 1 - (self.capacity - 1) / allowed) * self.window
+
+    def take(self, identity: str) -> float:
+        """요청 하나를 센다. 허용되면 0, 아니면 다음 요청까지 기다릴 초를 돌려준다"""
+        current_key, previous_key, elapsed = self._keys(identity, time.time())
+        cache.add(current_key, 0, self._timeout())
+        try:
+            current = cache.incr(current_key)
+        except ValueError:
+            # 값을 저장하지 않는 캐시(dummy)나 방금 밀려난 키는 제한하지 않는다
+            return 0.0
+        retry_after = self._retry_after(cache.get(previous_key, 0), current, elapsed)
+        if retry_after:
+            # 거부한 요청은 세지 않는다
+            cache.decr(current_key)
+        return retry_after
+
+    async def atake(self, identity: str) -> float:
+        current_key, previous_key, elapsed = self._keys(identity, time.time())
+        await cache.aadd(current_key, 0, self._timeout())
+        try:
+            current = await cache.aincr(current_key)
+        except ValueError:
+            return 0.0
+        previous: Any = await cache.aget(previous_key, 0)
+        retry_after = self._retry_after(previous, current, elapsed)
+        if retry_after:
+            await cache.adecr(current_key)
+        return retry_after
@@ -0,0 +1,30 @@
+from typing import Any, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.sessions.backends.db import SessionStore as DBStore
+from django.utils import timezone
+
+
+def clear_expired_in_batches(model: Any, batch_size: Optional[int] = None) -> int:
+    # 만료 세션을 한 번에 지우면 큰 테이블에서 긴 잠금과 WAL 폭증이 생기므로 나눠서 지운다
+    batch_size = batch_size or settings.SESSION_CLEANUP_BATCH_SIZE
+    now = timezone.now()
+    deleted = 0
+    while True:
+        keys = list(model.objects.filter(expire_date__lt=now).values_list('pk', flat=True)[:batch_size])
+        if not keys:
+            return deleted
+        deleted += model.objects.filter(pk__in=keys).delete()[0]
+
+
+class SessionStore(DBStore):
+    """기본 DB 세션 저장소에 만료 세션 일괄 삭제(clearsessions)만 나눠서 하도록 바꾼 것"""
+
+    @classmethod
+    def clear_expired(cls) -> None:
+        clear_expired_in_batches(cls.get_model_class())
+
+    @classmethod
+    async def aclear_expired(cls) -> None:
+        await sync_to_async(cls.clear_expired)()
@@ -0,0 +1,101 @@
+import hashlib
+import json
+from typing import Any, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import SessionStore as CachedDBStore
+from django.core.cache import BaseCache, caches
+from django_session_timeout.middleware import SESSION_TIMEOUT_KEY
+
+from config.session_db import clear_expired_in_batches
+
+KEY_PREFIX = 'config.session_store'
+
+
+class SessionStore(CachedDBStore):
+    """캐시에 먼저 쓰고 DB 에는 필요할 때만 쓰는 세션 저장소 (write-behind)
+
+    SessionTimeoutMiddleware 가 갱신하는 마지막 활동 시각만 바뀐 저장은 캐시에만 쓰고,
+    DB 에 마지막으로 쓴 시각보다 SESSION_PERSIST_INTERVAL 초 이상 지났을 때 DB 에도 쓴다.
+    로그인/로그아웃처럼 다른 값이 바뀐 저장은 바로 DB 에 쓴다. 캐시가 비워지면 DB 에서 읽으므로
+    최악의 경우 활동 시각이 그 간격만큼 예전 값으로 돌아간다.
+    워커끼리 세션을 공유해야 하므로 SESSION_CACHE_ALIAS 가 locmem/dummy 이면 설정을 불러올 때 거부한다.
+    """
+
+    cache_key_prefix = KEY_PREFIX
+
+    @property
+    def store(self) -> BaseCache:
+        return caches[settings.SESSION_CACHE_ALIAS]
+
+    @property
+    def persisted_key(self) -> str:
+        return f'{self.cache_key}:persisted'
+
+    @staticmethod
+    def _signature(data: dict[str, Any]) -> str:
+        # 활동 시각을 뺀 나머지 값의 지문
+        rest = {key: value for key, value in data.items() if key != SESSION_TIMEOUT_KEY}
+        return hashlib.sha256(json.dumps(rest, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _mark_persisted(self, data: dict[str, Any]) -> None:
+        self.store.set(
+            self.persisted_key, (self._signature(data), data.get(SESSION_TIMEOUT_KEY)), self.get_expiry_age()
+        )
+
+    def _only_activity_moved(self, data: dict[str, Any]) -> bool:
+        persisted: Optional[tuple[str, Optional[float]]] = self.store.get(self.persisted_key)
+        if persisted is None:
+            return False
+        signature, persisted_activity = persisted
+        activity = data.get(SESSION_TIMEOUT_KEY)
+        return (
+            signature == self._signature(data)
+            and activity is not None
+            and persisted_activity is not None
+            and activity - persisted_activity < settings.SESSION_PERSIST_INTERVAL
+        )
+
+    def load(self) -> dict[str, Any]:
+        cached: Optional[dict[str, Any]] = self.store.get(self.cache_key)
+        if cached is not None:
+            return cached
+        # 캐시에 없으면 DB 에서 읽은 값이 곧 DB 에 저장된 값이다
+        data: dict[str, Any] = super().load()
+        if data:
+            self._mark_persisted(data)
+        return data
+
+    def save(self, must_create: bool = False) -> None:
+        if not must_create and self.session_key is not None:
+            data = dict(self.items())
+            if self._only_activity_moved(data):
+                self.store.set(self.cache_key, data, self.get_expiry_age())
+                return
+        super().save(must_create)
+        self._mark_persisted(dict(self.items()))
+
+    async def aload(self) -> dict[str, Any]:
+        data: dict[str, Any] = await sync_to_async(self.load)()
+        return data
+
+    async def asave(self, must_create: bool = False) -> None:
+        await sync_to_async(self.save)(must_create)
+
+    def delete(self, session_key: Optional[str] = None) -> None:
+        key = session_key or self.session_key
+        super().delete(session_key)
+        if key:
+            self.store.delete(f'{self.cache_key_prefix}{key}:persisted')
+
+    async def adelete(self, session_key: Optional[str] = None) -> None:
+        await sync_to_async(self.delete)(session_key)
+
+    @classmethod
+    def clear_expired(cls) -> None:
+        clear_expired_in_batches(cls.get_model_class())
+
+    @classmethod
+    async def aclear_expired(cls) -> None:
+        await sync_to_async(cls.clear_expired)()
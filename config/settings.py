@@ -9,9 +9,11 @@ https://docs.djangoproject.com/en/5.2/topics/settings/
 For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
+import copy
 import os
 
 import environ
+from django.core.exceptions import ImproperlyConfigured
 
 env = environ.Env(
     # set casting, default value
@@ -57,6 +59,7 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'config.db_router.ReplicaPinningMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django_session_timeout.middleware.SessionTimeoutMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -79,6 +82,7 @@ TEMPLATES = [
             'context_processors': [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
+                'users.context_processors.principal',
                 'django.contrib.messages.context_processors.messages',
             ],
         },
@@ -91,6 +95,20 @@ WSGI_APPLICATION = 'config.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# gunicorn 이 uvicorn 워커로 ASGI 앱을 띄우는지 (gunicorn.conf.py 와 같은 환경 변수)
+SERVING_ASGI = 'uvicorn' in env('GUNICORN_WORKER_CLASS', default='gthread').lower()
+# DB 커넥션 재사용 (초), 0 이면 요청마다 새로 연결하고 끊는다.
+# ASGI 에서는 요청마다 sync_to_async 스레드에 커넥션이 따로 생겨 재사용하면 워커마다 쌓이므로 기본값이 0 이다
+# (재사용하려면 DB_POOL_ENABLED 를 켠다)
+DB_CONN_MAX_AGE = env.int('DB_CONN_MAX_AGE', default=0 if SERVING_ASGI else 60)
+# 재사용하는 커넥션이 끊겼는지 쓰기 전에 확인한다
+DB_CONN_HEALTH_CHECKS = env.bool('DB_CONN_HEALTH_CHECKS', default=True)
+# psycopg3 커넥션 풀 (켜면 워커 스레드가 풀에서 커넥션을 빌려 쓰고 DB_CONN_MAX_AGE 는 쓰지 않는다)
+DB_POOL_ENABLED = env.bool('DB_POOL_ENABLED', default=False)
+DB_POOL_MIN_SIZE = env.int('DB_POOL_MIN_SIZE', default=2)
+DB_POOL_MAX_SIZE = env.int('DB_POOL_MAX_SIZE', default=10)  # 워커 프로세스당, gunicorn 스레드 수 이상
+DB_POOL_TIMEOUT = env.float('DB_POOL_TIMEOUT', default=10.0)  # 풀이 비었을 때 기다리는 최대 시간 (초)
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -99,8 +117,28 @@ DATABASES = {
         'PASSWORD': env('POSTGRES_PASSWORD'),
         'HOST': env('POSTGRES_HOST'),
         'PORT': env('POSTGRES_PORT'),
+        'CONN_MAX_AGE': 0 if DB_POOL_ENABLED else DB_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
+        'OPTIONS': {},
     }
 }
+if DB_POOL_ENABLED:
+    # CONN_HEALTH_CHECKS 가 켜져 있으면 풀에서 꺼낼 때마다 커넥션 상태를 확인한다
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {'min_size': DB_POOL_MIN_SIZE, 'max_size': DB_POOL_MAX_SIZE, 'timeout': DB_POOL_TIMEOUT},
+    }
+
+# 읽기 전용 복제본 호스트 (쉼표로 여러 개), 비어 있으면 모든 쿼리가 default 로 간다
+# 스토어프런트 조회만 복제본으로 보낸다 (config/db_router.py)
+DATABASE_REPLICAS: list[str] = []
+for replica_number, replica_host in enumerate(env.list('POSTGRES_REPLICA_HOSTS', default=[]), start=1):
+    replica = copy.deepcopy(DATABASES['default'])
+    replica.update(HOST=replica_host, TEST={'MIRROR': 'default'})
+    DATABASES[f'replica{replica_number}'] = replica
+    DATABASE_REPLICAS.append(f'replica{replica_number}')
+DATABASE_ROUTERS = ['config.db_router.ReplicaRouter']
+# 쓰기 직후 이 시간(초) 동안은 같은 브라우저의 조회를 primary 로 보낸다 (복제 지연 대비)
+DATABASE_REPLICA_PIN_SECONDS = env.int('DATABASE_REPLICA_PIN_SECONDS', default=5)
 
 AUTH_USER_MODEL = "users.User"
 
@@ -147,12 +185,41 @@ STATICFILES_DIRS = [os.path.join(BASE_DIR, "static")]
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+# gc_media 체크포인트, nginx 가 /media/ 로 공개하지 않도록 MEDIA_ROOT 밖에 둔다
+GC_MEDIA_CHECKPOINT = env('GC_MEDIA_CHECKPOINT', default=os.path.join(BASE_DIR, '.gc_media_checkpoint'))
 
 # 배포환경에서 파일 업로드 설정
-FILE_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
-DATA_UPLOAD_MAX_MEMORY_SIZE = 10 * 1024 * 1024  # 10MB
+# 업로드 파일은 메모리에 올리지 않고 청크 단위로 임시 파일에 바로 쓴다 (해시, 이미지 헤더 검사 포함)
+FILE_UPLOAD_HANDLERS = ['products.upload_handlers.StreamingImageUploadHandler']
+FILE_UPLOAD_MAX_MEMORY_SIZE = 256 * 1024  # 256KB
+DATA_UPLOAD_MAX_MEMORY_SIZE = 2 * 1024 * 1024  # 2MB, 파일을 제외한 폼 데이터
+UPLOAD_MAX_REQUEST_SIZE = env.int('UPLOAD_MAX_REQUEST_SIZE', default=100 * 1024 * 1024)  # 100MB
+PRODUCT_IMAGE_MAX_FILE_SIZE = env.int('PRODUCT_IMAGE_MAX_FILE_SIZE', default=20 * 1024 * 1024)  # 20MB
 FILE_UPLOAD_PERMISSIONS = 0o644
 
+# 캐시 설정
+# 기본은 프로세스 로컬 메모리, CACHE_URL 로 공유 캐시 지정 가능 (예: redis://redis:6379/1, redis 패키지 필요)
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://seoseung-soo'),
+}
+# 워커끼리 공유되지 않는 캐시 백엔드 (locmem/dummy 는 프로세스마다 따로다)
+LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+# 기본 캐시를 워커끼리 공유하는지, 캐시로 무효화를 전하는 기능은 이 값이 거짓이면 DB 로 확인하거나 꺼진다
+CACHE_IS_SHARED = CACHES['default']['BACKEND'] not in LOCAL_CACHE_BACKENDS
+
+# 상품 카드 HTML 조각 캐시 유지 시간 (초)
+PRODUCT_CARD_CACHE_TIMEOUT = env.int('PRODUCT_CARD_CACHE_TIMEOUT', default=60 * 60 * 24)
+
+# 비로그인 방문자용 스토어프런트 전체 페이지 캐시 (기본 비활성)
+STOREFRONT_PAGE_CACHE_ENABLED = env.bool('STOREFRONT_PAGE_CACHE_ENABLED', default=False)
+STOREFRONT_PAGE_CACHE_TIMEOUT = env.int('STOREFRONT_PAGE_CACHE_TIMEOUT', default=60 * 10)
+
+# 상품 이미지 파생본(리사이즈) 생성, 기본은 요청 밖 워커 스레드에서 비동기로 처리
+PRODUCT_IMAGE_VARIANTS_SYNC = env.bool('PRODUCT_IMAGE_VARIANTS_SYNC', default=False)
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -160,11 +227,50 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 SESSION_EXPIRE_SECONDS = 3600  # 1 hour
 SESSION_EXPIRE_AFTER_LAST_ACTIVITY = True
+# 마지막 활동 시각은 이 간격(초) 이상 지났을 때만 갱신해 요청마다 세션을 다시 쓰지 않는다
+SESSION_EXPIRE_AFTER_LAST_ACTIVITY_GRACE_PERIOD = env.int('SESSION_ACTIVITY_GRANULARITY', default=60)
+
+# 세션을 공유 캐시에 먼저 쓰고 DB 에는 값이 바뀌었거나 SESSION_PERSIST_INTERVAL 초가 지났을 때만 쓴다 (기본 비활성)
+# 워커끼리 세션을 공유해야 하므로 SESSION_CACHE_ALIAS 캐시가 redis/memcached 일 때만 켤 수 있다
+SESSION_CACHE_ENABLED = env.bool('SESSION_CACHE_ENABLED', default=False)
+SESSION_PERSIST_INTERVAL = env.int('SESSION_PERSIST_INTERVAL', default=60 * 5)
+# clearsessions 가 만료 세션을 이 개수씩 나눠 지운다 (두 세션 저장소 모두)
+SESSION_CLEANUP_BATCH_SIZE = env.int('SESSION_CLEANUP_BATCH_SIZE', default=1000)
+SESSION_CACHE_ALIAS = env('SESSION_CACHE_ALIAS', default='default')
+if SESSION_CACHE_ENABLED and CACHES.get(SESSION_CACHE_ALIAS, {}).get('BACKEND') in LOCAL_CACHE_BACKENDS:
+    # 워커마다 다른 세션을 보게 되어 로그인이 풀리고, 캐시에만 쓴 활동 시각은 다른 워커가 모른다
+    raise ImproperlyConfigured(
+        f"SESSION_CACHE_ENABLED 는 워커끼리 공유하는 캐시가 필요합니다 ('{SESSION_CACHE_ALIAS}' 캐시가 locmem/dummy 입니다)."
+    )
+SESSION_ENGINE = 'config.session_store' if SESSION_CACHE_ENABLED else 'config.session_db'
+
+# 사용자 권한 요약(AdminPermission)을 세션에 저장해 users 조회를 건너뛴다
+# 버전 토큰을 워커끼리 공유해야 role 변경이 바로 반영되므로 공유 캐시(CACHE_URL)일 때만 기본으로 켠다
+USER_PRINCIPAL_CACHE_ENABLED = env.bool('USER_PRINCIPAL_CACHE_ENABLED', default=CACHE_IS_SHARED)
+# 시그널 없이 바뀐 값(queryset.update 등)에 대비해 요약을 DB 로 다시 확인하는 최대 간격 (초)
+USER_PRINCIPAL_MAX_AGE = env.int('USER_PRINCIPAL_MAX_AGE', default=60 * 5)
 
 # Google OAuth 설정
 GOOGLE_OAUTH2_CLIENT_ID = env('GOOGLE_OAUTH2_CLIENT_ID')
 GOOGLE_OAUTH2_CLIENT_SECRET = env('GOOGLE_OAUTH2_CLIENT_SECRET', default='')
 
+# 외부 API(소셜 로그인 등) 호출용 공유 HTTP 클라이언트
+HTTP_CLIENT_CONNECT_TIMEOUT = env.float('HTTP_CLIENT_CONNECT_TIMEOUT', default=3.0)  # 초
+HTTP_CLIENT_READ_TIMEOUT = env.float('HTTP_CLIENT_READ_TIMEOUT', default=5.0)  # 초
+HTTP_CLIENT_RETRIES = env.int('HTTP_CLIENT_RETRIES', default=2)
+HTTP_CLIENT_BACKOFF_FACTOR = env.float('HTTP_CLIENT_BACKOFF_FACTOR', default=0.3)
+HTTP_CLIENT_POOL_MAXSIZE = env.int('HTTP_CLIENT_POOL_MAXSIZE', default=10)  # 호스트별, gunicorn 스레드 수 이상
+
+# 회원가입 아이디/이메일 중복 확인: 조회 결과 캐시 시간(초)과 IP 별 허용량 (초당 평균 요청 수, 최대 연속 요청 수)
+# 요청 수는 기본 캐시에 세므로 워커별 locmem 이면(CACHE_IS_SHARED 가 아니면) 워커 프로세스 수만큼 곱해서 허용된다
+USER_AVAILABILITY_CACHE_SECONDS = env.int('USER_AVAILABILITY_CACHE_SECONDS', default=60)
+CHECK_DUPLICATE_RATE = env.float('CHECK_DUPLICATE_RATE', default=2.0)
+CHECK_DUPLICATE_BURST = env.int('CHECK_DUPLICATE_BURST', default=20)
+# 요청 제한에 쓸 클라이언트 IP 헤더 (nginx 가 설정하는 X-Real-IP), 비우면 REMOTE_ADDR 만 쓴다
+RATE_LIMIT_CLIENT_IP_HEADER = env('RATE_LIMIT_CLIENT_IP_HEADER', default='HTTP_X_REAL_IP')
+# 위 헤더를 믿을 프록시 주소/대역 (REMOTE_ADDR 기준), 그 밖에서 온 요청은 REMOTE_ADDR 를 쓴다
+RATE_LIMIT_TRUSTED_PROXIES = env.list('RATE_LIMIT_TRUSTED_PROXIES', default=['127.0.0.1', '::1'])
+
 # 카카오 로그인 설정
 KAKAO_REST_API_KEY = env('KAKAO_REST_API_KEY', default='')
 KAKAO_CLIENT_SECRET = env('KAKAO_CLIENT_SECRET', default='')
@@ -14,26 +14,34 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from asgiref.sync import sync_to_async
 from django.conf.urls.static import static
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
 from django.urls import include, path
 
 from config import settings
+from config.database import DatabaseStatsView
+from config.db_router import replica_reads
+from products.services.page_cache import StorefrontPageCache, storefront_page_cache
 from users import urls as users_urls
 
 
-def home(request: HttpRequest) -> HttpResponse:
-    from products.models import Product
-    products = Product.objects.filter(is_live=True, is_sold=False).order_by('-created_at')
-    context = {'products': products}
-    return render(request, 'home.html', context)
+@replica_reads
+@storefront_page_cache(StorefrontPageCache.home_key)
+async def home(request: HttpRequest) -> HttpResponse:
+    from products.services.storefront import StorefrontService
+    page = await StorefrontService.alive_products_page(request.GET.get('cursor'))
+    context = {'products': page.items, 'page': page}
+    # 템플릿이 request.user(세션 조회)를 읽으므로 렌더링은 스레드에서 한다
+    return await sync_to_async(render)(request, 'home.html', context)
 
 urlpatterns = [
     path('', home, name='home'),
     path("users/", include(users_urls), name='users'),
     path("products/", include("products.urls"), name='products'),
     path("categories/", include("categories.urls"), name='categories'),
+    path("admin/db-stats/", DatabaseStatsView.as_view(), name='db-stats'),
     ] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
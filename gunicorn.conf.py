@@ -0,0 +1,83 @@
+"""gunicorn 설정
+
+CPU 수로 워커/스레드 수를 정하고 환경 변수로 덮어쓸 수 있다.
+
+- GUNICORN_WORKER_CLASS: 기본 gthread, ASGI 배포는 uvicorn_worker.UvicornWorker
+- GUNICORN_WORKERS (또는 WEB_CONCURRENCY), GUNICORN_THREADS, GUNICORN_MAX_WORKERS
+- GUNICORN_PRELOAD, GUNICORN_MAX_REQUESTS, GUNICORN_MAX_REQUESTS_JITTER
+- GUNICORN_TIMEOUT, GUNICORN_KEEPALIVE
+"""
+import os
+from typing import Any
+
+import environ
+
+env = environ.Env()
+
+ASYNC_WORKER_CLASSES = ('uvicorn_worker.UvicornWorker', 'uvicorn_worker.UvicornH11Worker')
+
+
+def cpu_count() -> int:
+    # 컨테이너에 CPU 가 제한돼 있으면 호스트 전체가 아니라 이 프로세스가 쓸 수 있는 수를 센다
+    return os.process_cpu_count() or 1
+
+
+def default_workers(cores: int, async_worker: bool) -> int:
+    # 이벤트 루프 워커는 코어당 하나, 동기 워커는 DB/네트워크 대기를 감안해 코어 * 2 + 1
+    return cores if async_worker else cores * 2 + 1
+
+
+bind = env('GUNICORN_BIND', default='0.0.0.0:8000')
+
+worker_class = env('GUNICORN_WORKER_CLASS', default='gthread')
+_async_worker = worker_class in ASYNC_WORKER_CLASSES
+workers = env.int(
+    'GUNICORN_WORKERS',
+    default=env.int('WEB_CONCURRENCY', default=min(
+        default_workers(cpu_count(), _async_worker), env.int('GUNICORN_MAX_WORKERS', default=12)
+    )),
+)
+# gthread 워커의 스레드 수 (워커당 DB 커넥션 수의 상한, DB_POOL_MAX_SIZE 이하로 둔다)
+threads = 1 if _async_worker else env.int('GUNICORN_THREADS', default=4)
+
+# 앱을 마스터에서 한 번 읽고 fork 해 메모리를 공유하고 워커 기동을 빠르게 한다
+preload_app = env.bool('GUNICORN_PRELOAD', default=True)
+
+# 요청 수가 차면 워커를 새로 띄워 메모리 증가를 끊는다. jitter 로 워커들이 한꺼번에 재시작하지 않게 한다
+max_requests = env.int('GUNICORN_MAX_REQUESTS', default=1000)
+max_requests_jitter = env.int('GUNICORN_MAX_REQUESTS_JITTER', default=max_requests // 10)
+
+timeout = env.int('GUNICORN_TIMEOUT', default=30)
+graceful_timeout = env.int('GUNICORN_GRACEFUL_TIMEOUT', default=30)
+# nginx 가 유휴 upstream 커넥션을 먼저 닫도록 nginx 의 keepalive_timeout(65초) 보다 길게 둔다.
+# 반대면 gunicorn 이 닫는 순간 nginx 가 같은 커넥션에 요청을 보내 502 가 날 수 있다
+keepalive = env.int('GUNICORN_KEEPALIVE', default=75)
+
+# 워커 heartbeat 파일을 컨테이너 overlay 파일시스템 대신 메모리에 둔다
+if os.path.isdir('/dev/shm'):
+    worker_tmp_dir = '/dev/shm'
+
+accesslog = env('GUNICORN_ACCESS_LOG', default='-')
+errorlog = '-'
+
+
+def _close_db_connections() -> None:
+    from django.db import connections
+
+    for connection in connections.all(initialized_only=True):
+        connection.close()
+        # psycopg3 풀의 커넥션과 관리 스레드는 fork 후 자식에서 쓸 수 없다
+        if hasattr(connection, 'close_pool'):
+            connection.close_pool()
+
+
+def when_ready(server: Any) -> None:
+    # preload 중 마스터가 연 DB 커넥션(앱 로딩 시 조회 등)을 fork 전에 닫아 워커끼리 소켓을 공유하지 않게 한다
+    if server.cfg.preload_app:
+        _close_db_connections()
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    # 워커는 첫 요청에서 자기 커넥션을 새로 연다
+    if server.cfg.preload_app:
+        _close_db_connections()
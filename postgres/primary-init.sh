@@ -0,0 +1,11 @@
+#!/bin/bash
+# primary 최초 초기화 때 한 번 실행된다 (docker-entrypoint-initdb.d)
+# 스트리밍 복제용 계정과 접속 허용 규칙을 만든다. 이미 만들어진 볼륨에는 적용되지 않으므로
+# 기존 DB 에서는 같은 SQL 과 pg_hba.conf 규칙을 직접 추가한 뒤 설정을 다시 읽는다.
+set -euo pipefail
+
+psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$POSTGRES_DB" <<-SQL
+    CREATE ROLE replicator WITH REPLICATION LOGIN PASSWORD '${POSTGRES_REPLICATION_PASSWORD:-replicator}';
+SQL
+
+echo "host replication replicator all scram-sha-256" >> "$PGDATA/pg_hba.conf"
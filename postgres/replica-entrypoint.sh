@@ -0,0 +1,19 @@
+#!/bin/bash
+# 로컬 스트리밍 복제본: 데이터 디렉터리가 비어 있으면 primary 에서 기본 백업을 받아 standby 로 시작한다
+set -euo pipefail
+
+PRIMARY_HOST="${POSTGRES_PRIMARY_HOST:-db}"
+
+if [ ! -s "$PGDATA/PG_VERSION" ]; then
+    until pg_isready -h "$PRIMARY_HOST" -U replicator; do
+        echo "primary($PRIMARY_HOST) 대기 중..."
+        sleep 2
+    done
+    export PGPASSWORD="${POSTGRES_REPLICATION_PASSWORD:-replicator}"
+    # -R: standby.signal 과 primary_conninfo 를 만들어 복제본으로 뜨게 한다
+    # -C -S: 복제 슬롯을 만들어 복제본이 따라잡기 전에 WAL 이 지워지지 않게 한다
+    pg_basebackup -h "$PRIMARY_HOST" -U replicator -D "$PGDATA" -X stream -R -C -S replica_slot --no-password
+    chmod 0700 "$PGDATA"
+fi
+
+exec postgres -c hot_standby=on
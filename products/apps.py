@@ -1,7 +1,9 @@
-
 from django.apps import AppConfig
 
 
 class ProductsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'products'
\ No newline at end of file
+    name = 'products'
+
+    def ready(self) -> None:
+        from products import signals  # noqa: F401
@@ -1,9 +1,12 @@
 from typing import Any, List, Union, cast
 
 from django import forms
+from django.conf import settings
 from django.core.files.uploadedfile import UploadedFile
 
 from products.models import Product
+from products.upload_handlers import sniff_image_type
+from products.validators import validate_price, validate_sale_price, validate_stock
 
 
 class MultipleFileInput(forms.ClearableFileInput):
@@ -27,12 +30,15 @@ class MultipleFileField(forms.FileField):
 class ProductForm(forms.ModelForm):  # type: ignore[type-arg]
     class Meta:
         model = Product
-        fields = ['name', 'description', 'price', 'sale_price', 'stock', 'is_live', 'is_sold']
+        fields = ['name', 'category', 'description', 'price', 'sale_price', 'stock', 'is_live', 'is_sold']
         widgets = {
             'name': forms.TextInput(attrs={
                 'class': 'form-input',
                 'placeholder': '상품명을 입력하세요'
             }),
+            'category': forms.Select(attrs={
+                'class': 'form-input'
+            }),
             'description': forms.Textarea(attrs={
                 'class': 'form-textarea',
                 'placeholder': '상품 설명을 입력하세요',
@@ -65,24 +71,17 @@ class ProductForm(forms.ModelForm):  # type: ignore[type-arg]
 
     def clean_price(self) -> float:
         price = cast(float, self.cleaned_data.get('price'))
-        if price <= 0:
-            raise forms.ValidationError("가격은 0보다 커야 합니다.")
+        validate_price(price)
         return price
 
     def clean_stock(self) -> int:
         stock = cast(int, self.cleaned_data.get('stock'))
-        if stock < 0:
-            raise forms.ValidationError("재고는 0 이상이어야 합니다.")
+        validate_stock(stock)
         return stock
 
     def clean_sale_price(self) -> Union[float, None]:
         sale_price = self.cleaned_data.get('sale_price')
-        if sale_price is not None:
-            if sale_price <= 0:
-                raise forms.ValidationError("할인가격은 0보다 커야 합니다.")
-            price = self.cleaned_data.get('price')
-            if price and sale_price >= price:
-                raise forms.ValidationError("할인가격은 정가보다 낮아야 합니다.")
+        validate_sale_price(sale_price, self.cleaned_data.get('price'))
         return sale_price
 
 
@@ -96,3 +95,13 @@ class ProductImageForm(forms.Form):
         })
     )
 
+    def clean_image(self) -> List[UploadedFile]:
+        images = self.cleaned_data.get('image') or []
+        if not isinstance(images, list):
+            images = [images]
+        for image in images:
+            if sniff_image_type(image) is None:
+                raise forms.ValidationError(f"{image.name}: JPEG, PNG, GIF, WebP 이미지만 업로드할 수 있습니다.")
+            if image.size and image.size > settings.PRODUCT_IMAGE_MAX_FILE_SIZE:
+                raise forms.ValidationError(f"{image.name}: 이미지 한 장의 크기가 너무 큽니다.")
+        return images
@@ -0,0 +1,114 @@
+import statistics
+import time
+from typing import Any, Callable, Optional
+from wsgiref.util import setup_testing_defaults
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection
+from django.db.backends.signals import connection_created
+
+MODES = ('direct', 'persistent', 'pool')
+
+
+class Command(BaseCommand):
+    help = 'DB 커넥션 방식(매 요청 연결 / 영구 연결 / psycopg3 풀)별 요청당 응답 시간을 측정합니다'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--path', default='/', help='요청할 경로')
+        parser.add_argument('--requests', type=int, default=200)
+        parser.add_argument('--warmup', type=int, default=10)
+        parser.add_argument('--mode', action='append', choices=MODES, dest='modes', help='기본은 가능한 방식 전부')
+        parser.add_argument('--conn-max-age', type=int, default=60, help='persistent 방식의 CONN_MAX_AGE')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        # 테스트 클라이언트는 요청 끝에 커넥션을 닫지 않으므로 실제 WSGI 핸들러로 요청 시작/종료 신호를 그대로 보낸다
+        self.handler = WSGIHandler()
+        self.host = next((host for host in settings.ALLOWED_HOSTS if '*' not in host), 'localhost').lstrip('.')
+        self.opened = 0
+        connection_created.connect(self._count_connection)
+
+        settings_dict = connection.settings_dict
+        original = (settings_dict['CONN_MAX_AGE'], dict(settings_dict['OPTIONS']))
+        pool_options = original[1].get('pool') or {'min_size': 1, 'max_size': 4}
+        try:
+            for mode in options['modes'] or MODES:
+                if mode == 'pool' and not self._pool_available():
+                    self.stdout.write('pool: postgresql + psycopg3 환경에서만 측정할 수 있어 건너뜁니다')
+                    continue
+                self._configure(mode, options['conn_max_age'], pool_options)
+                self._measure(mode, options['path'], options['requests'], options['warmup'])
+        finally:
+            connection_created.disconnect(self._count_connection)
+            self._reset()
+            settings_dict['CONN_MAX_AGE'], settings_dict['OPTIONS'] = original
+
+    def _count_connection(self, sender: Any, **kwargs: Any) -> None:
+        self.opened += 1
+
+    @staticmethod
+    def _pool_available() -> bool:
+        if connection.vendor != 'postgresql':
+            return False
+        from django.db.backends.postgresql.psycopg_any import is_psycopg3
+        return is_psycopg3
+
+    @staticmethod
+    def _reset() -> None:
+        connection.close()
+        # 풀은 OPTIONS 에 pool 설정이 남아 있을 때만 닫을 수 있다
+        if hasattr(connection, 'close_pool'):
+            connection.close_pool()
+
+    def _configure(self, mode: str, conn_max_age: int, pool_options: dict[str, Any]) -> None:
+        self._reset()
+        settings_dict = connection.settings_dict
+        settings_dict['OPTIONS'].pop('pool', None)
+        settings_dict['CONN_MAX_AGE'] = conn_max_age if mode == 'persistent' else 0
+        if mode == 'pool':
+            settings_dict['OPTIONS']['pool'] = pool_options
+
+    def _request(self, path: str) -> int:
+        environ: dict[str, Any] = {'PATH_INFO': path, 'HTTP_HOST': self.host}
+        setup_testing_defaults(environ)
+        status: Optional[str] = None
+
+        def start_response(
+            response_status: str, headers: list[tuple[str, str]], exc_info: Any = None
+        ) -> Callable[[bytes], object]:
+            nonlocal status
+            status = response_status
+            return lambda data: None
+
+        response = self.handler(environ, start_response)
+        for _ in response:
+            pass
+        # WSGI 서버처럼 close() 를 불러 request_finished (커넥션 정리) 를 보낸다
+        response.close()
+        return int(str(status).split()[0])
+
+    def _measure(self, mode: str, path: str, count: int, warmup: int) -> None:
+        for _ in range(warmup):
+            self._request(path)
+        self.opened = 0
+        timings = []
+        statuses = set()
+        for _ in range(count):
+            started = time.perf_counter()
+            statuses.add(self._request(path))
+            timings.append((time.perf_counter() - started) * 1000)
+
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        self.stdout.write(
+            f'{mode:<10} 평균 {statistics.mean(timings):6.2f}ms  p50 {statistics.median(timings):6.2f}ms  '
+            f'p95 {p95:6.2f}ms  새 연결 {self.opened}회  상태 {sorted(statuses)}'
+        )
+        pool = getattr(connection, 'pool', None)
+        if pool is not None:
+            stats = pool.get_stats()
+            self.stdout.write(
+                f'{"":<10} 풀 크기 {stats.get("pool_size")}  대기 요청 {stats.get("requests_waiting")}  '
+                f'누적 연결 {stats.get("connections_num")}'
+            )
@@ -0,0 +1,83 @@
+import random
+import statistics
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+
+from products.models import Product
+from products.services.search import ProductSearchService
+from users.models import User
+
+ADJECTIVES = ['오버핏', '슬림', '빈티지', '캐주얼', 'basic', 'classic', 'wide', '린넨', '울', '데님']
+ITEMS = ['자켓', '셔츠', '니트', '코트', '팬츠', '스커트', 'hoodie', 'sweatshirt', '가디건', '원피스']
+COLORS = ['블랙', '화이트', '네이비', '베이지', '그레이', 'khaki', 'ivory', '브라운']
+DEFAULT_QUERIES = ['자켓', '블랙 셔츠', '린넨 팬츠', 'hoodie', 'classic coat', '가디', '스웨트셔츠']
+
+
+class Command(BaseCommand):
+    help = '가상 상품 카탈로그를 만들어 상품 검색 응답 시간을 측정합니다 (기본적으로 측정 후 롤백)'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--products', type=int, default=100_000)
+        parser.add_argument('--batch-size', type=int, default=5_000)
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--query', action='append', dest='queries')
+        parser.add_argument('--keep', action='store_true', help='생성한 상품을 롤백하지 않고 남긴다')
+        parser.add_argument('--seed', type=int, default=7)
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        random.seed(options['seed'])
+        with transaction.atomic():
+            self._seed(options['products'], options['batch_size'])
+            self._measure(options['queries'] or DEFAULT_QUERIES, options['repeat'])
+            if not options['keep']:
+                transaction.set_rollback(True)
+
+    def _seed(self, count: int, batch_size: int) -> None:
+        owner, _ = User.objects.get_or_create(
+            username='bench_search',
+            defaults={
+                'email': 'bench_search@example.com',
+                'role': User.Role.ADMIN,
+                'personal_info_consent': True,
+                'terms_of_use': True,
+            },
+        )
+        started = time.perf_counter()
+        for offset in range(0, count, batch_size):
+            # bulk_create 는 save() 를 거치지 않으므로 slug 를 직접 채운다
+            Product.objects.bulk_create([
+                self._product(owner, number) for number in range(offset, min(offset + batch_size, count))
+            ])
+        self.stdout.write(f'{count}개 상품 생성: {time.perf_counter() - started:.1f}s ({connection.vendor})')
+
+    @staticmethod
+    def _product(owner: User, number: int) -> Product:
+        name = f'{random.choice(ADJECTIVES)} {random.choice(COLORS)} {random.choice(ITEMS)} {number}'
+        return Product(
+            user=owner,
+            name=name,
+            slug=f'bench-search-{number}',
+            description=f'{random.choice(ADJECTIVES)} 소재의 {random.choice(ITEMS)} 입니다. {random.choice(COLORS)}',
+            price=random.randrange(10_000, 300_000, 1_000),
+            stock=random.randint(0, 50),
+            is_live=random.random() < 0.9,
+            is_sold=False,
+        )
+
+    def _measure(self, queries: list[str], repeat: int) -> None:
+        for query in queries:
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                results = list(ProductSearchService.search(query)[:ProductSearchService.PAGE_SIZE])
+                ProductSearchService.search(query).count()
+                timings.append((time.perf_counter() - started) * 1000)
+            timings.sort()
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            self.stdout.write(
+                f'{query!r}: {len(results)}건 첫 페이지, '
+                f'median {statistics.median(timings):.1f}ms, p95 {p95:.1f}ms'
+            )
@@ -0,0 +1,28 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from products.services.bulk_import import FORMATS, export_rows
+
+
+class Command(BaseCommand):
+    help = '상품 전체를 CSV 또는 JSONL 로 내보냅니다'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('path', help="저장할 파일 경로 ('-' 이면 표준 출력)")
+        parser.add_argument('--format', choices=FORMATS, default='csv')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options['path'] == '-':
+            for line in export_rows(options['format']):
+                self.stdout.write(line, ending='')
+            return
+
+        count = 0
+        with open(options['path'], 'w', encoding='utf-8', newline='') as output:
+            for line in export_rows(options['format']):
+                output.write(line)
+                count += 1
+        if options['format'] == 'csv':
+            count -= 1
+        self.stdout.write(f'{count}개 상품을 {options["path"]} 에 저장했습니다')
@@ -0,0 +1,58 @@
+import os
+from datetime import timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandParser
+
+from products.services.media_gc import MediaGarbageCollector
+
+
+class Command(BaseCommand):
+    help = '상품에 연결되지 않은 이미지 행과 참조되지 않는 미디어 파일을 정리합니다'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--dry-run', action='store_true', help='삭제하지 않고 대상만 출력한다')
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help='한 번에 DB 와 비교하고 지우는 행/파일 수',
+        )
+        parser.add_argument(
+            '--listing-chunk', type=int, default=10000,
+            help='큰 디렉터리를 이름순으로 나눠 읽을 때 한 번에 메모리에 두는 항목 수',
+        )
+        parser.add_argument('--grace-hours', type=float, default=24, help='이보다 최근 파일과 행은 건드리지 않는다')
+        parser.add_argument('--rate', type=float, default=0, help='초당 최대 파일 삭제 수 (0 이면 제한 없음)')
+        parser.add_argument(
+            '--checkpoint',
+            default=settings.GC_MEDIA_CHECKPOINT,
+            help='중단된 파일 순회를 이어서 하기 위한 체크포인트 파일',
+        )
+        parser.add_argument('--reset', action='store_true', help='체크포인트를 지우고 처음부터 순회한다')
+        parser.add_argument('--skip-rows', action='store_true', help='이미지 행 정리를 건너뛰고 파일만 정리한다')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        collector = MediaGarbageCollector(
+            default_storage,
+            batch_size=options['batch_size'],
+            listing_chunk=options['listing_chunk'],
+            grace=timedelta(hours=options['grace_hours']),
+            dry_run=options['dry_run'],
+            max_deletes_per_second=options['rate'],
+            checkpoint=options['checkpoint'],
+            log=self.stdout.write,
+        )
+        if options['reset'] and os.path.exists(options['checkpoint']):
+            os.remove(options['checkpoint'])
+
+        if not options['skip_rows']:
+            collector.collect_rows()
+        collector.collect_files()
+
+        prefix = '[dry-run] ' if options['dry_run'] else ''
+        self.stdout.write(
+            f'{prefix}이미지 행 {collector.deleted_rows}개, '
+            f'파일 {collector.deleted_files}/{collector.scanned_files}개 삭제 '
+            f'({collector.freed_bytes / 1024 / 1024:.1f}MB)'
+        )
@@ -0,0 +1,24 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from products.models import ProductImage
+from products.services.image_variants import ImageVariantService
+
+
+class Command(BaseCommand):
+    help = '파생 이미지가 없는 상품 이미지의 리사이즈 WebP/JPEG 를 생성합니다'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--all', action='store_true', help='이미 파생 이미지가 있는 것도 다시 만든다')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        product_images = ProductImage.objects.order_by('id')
+        if not options['all']:
+            product_images = product_images.filter(variants={})
+
+        count = 0
+        for product_image_id in product_images.values_list('id', flat=True).iterator():
+            ImageVariantService.generate(product_image_id)
+            count += 1
+        self.stdout.write(f'{count}개 이미지 처리 완료')
@@ -0,0 +1,45 @@
+import os
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from products.services.bulk_import import FORMATS, ProductImportService, read_rows
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = 'CSV(헤더 포함) 또는 JSONL 파일의 상품을 일괄 등록합니다'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('path', help='가져올 파일 경로')
+        parser.add_argument('--owner', required=True, help='상품을 등록할 관리자 이메일')
+        parser.add_argument('--format', choices=FORMATS, help='생략하면 파일 확장자로 판단한다')
+        parser.add_argument('--batch-size', type=int, default=ProductImportService.BATCH_SIZE)
+        parser.add_argument('--no-copy', action='store_true', help='Postgres 에서도 COPY 대신 bulk_create 를 쓴다')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        owner = User.objects.filter(email=options['owner']).first()
+        if owner is None:
+            raise CommandError(f"{options['owner']} 사용자를 찾을 수 없습니다.")
+        fmt = options['format'] or ('jsonl' if os.path.splitext(options['path'])[1] in ('.jsonl', '.ndjson') else 'csv')
+
+        service = ProductImportService(
+            owner,
+            batch_size=options['batch_size'],
+            use_copy=False if options['no_copy'] else None,
+        )
+        try:
+            with open(options['path'], encoding='utf-8-sig', newline='') as stream:
+                for progress in service.iter_batches(read_rows(stream, fmt)):
+                    self.stdout.write(
+                        f'처리 {progress.processed}행, 등록 {progress.created}개, 실패 {progress.failed}행'
+                    )
+        except OSError as error:
+            raise CommandError(str(error))
+
+        result = service.result
+        for row_error in result.errors:
+            self.stderr.write(f'{row_error.line}행: {row_error.message}')
+        if result.failed > len(result.errors):
+            self.stderr.write(f'... 외 {result.failed - len(result.errors)}행 실패')
+        self.stdout.write(f'완료: 처리 {result.processed}행, 등록 {result.created}개, 실패 {result.failed}행')
@@ -0,0 +1,113 @@
+import asyncio
+import statistics
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+
+class Command(BaseCommand):
+    help = (
+        '느린 클라이언트가 요청을 조금씩 보내는 동안 일반 요청의 응답 시간을 측정합니다. '
+        'WSGI(gunicorn sync) 와 ASGI(uvicorn 워커) 배포에 각각 실행해 워커당 동시 처리량을 비교합니다'
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--url', default='http://localhost:8000/', help='측정할 서버의 주소 (http 만 지원)')
+        parser.add_argument('--slow-clients', type=int, default=20, help='요청을 조금씩 보내는 연결 수')
+        parser.add_argument('--slow-seconds', type=float, default=10.0, help='느린 연결 하나가 요청을 다 보내는 데 걸리는 시간')
+        parser.add_argument('--probes', type=int, default=5, help='동시에 일반 요청을 보내는 연결 수')
+        parser.add_argument('--duration', type=float, default=10.0, help='일반 요청을 보내는 시간(초)')
+        parser.add_argument('--timeout', type=float, default=30.0, help='일반 요청 하나의 제한 시간(초)')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        url = urlsplit(options['url'])
+        if url.scheme != 'http' or not url.hostname:
+            raise CommandError('http://호스트[:포트]/경로 형식의 주소만 지원합니다.')
+        self.host = url.hostname
+        self.port = url.port or 80
+        path = url.path or '/'
+        if url.query:
+            path = f'{path}?{url.query}'
+        self.request = (
+            f'GET {path} HTTP/1.1\r\nHost: {url.netloc}\r\nUser-Agent: loadtest-slow-clients\r\n'
+            'Connection: close\r\n\r\n'
+        ).encode()
+        asyncio.run(self._run(options))
+
+    async def _run(self, options: dict[str, Any]) -> None:
+        self.latencies: list[float] = []
+        self.statuses: dict[str, int] = {}
+        self.failures = 0
+        self.slow_finished = 0
+
+        slow_tasks = [
+            asyncio.create_task(self._slow_client(options['slow_seconds'])) for _ in range(options['slow_clients'])
+        ]
+        # 느린 연결들이 먼저 자리를 잡도록 잠깐 기다린다
+        await asyncio.sleep(min(1.0, options['slow_seconds'] / 2))
+        deadline = time.monotonic() + options['duration']
+        started = time.monotonic()
+        await asyncio.gather(*(self._probe(deadline, options['timeout']) for _ in range(options['probes'])))
+        elapsed = time.monotonic() - started
+        await asyncio.gather(*slow_tasks, return_exceptions=True)
+        self._report(options, elapsed)
+
+    async def _slow_client(self, seconds: float) -> None:
+        try:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+        except OSError:
+            return
+        try:
+            # 요청 헤더를 한 바이트씩 나눠 보내 서버가 그동안 이 연결을 붙잡고 있게 한다
+            interval = seconds / len(self.request)
+            for index in range(len(self.request)):
+                writer.write(self.request[index:index + 1])
+                await writer.drain()
+                await asyncio.sleep(interval)
+            await reader.read()
+            self.slow_finished += 1
+        except OSError:
+            pass
+        finally:
+            writer.close()
+
+    async def _fetch(self) -> str:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(self.request)
+            await writer.drain()
+            status_line = await reader.readline()
+            await reader.read()
+        finally:
+            writer.close()
+        parts = status_line.split()
+        return parts[1].decode() if len(parts) > 1 else '?'
+
+    async def _probe(self, deadline: float, timeout: float) -> None:
+        while time.monotonic() < deadline:
+            started = time.perf_counter()
+            try:
+                status = await asyncio.wait_for(self._fetch(), timeout)
+            except (OSError, asyncio.TimeoutError):
+                self.failures += 1
+                continue
+            self.latencies.append((time.perf_counter() - started) * 1000)
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def _report(self, options: dict[str, Any], elapsed: float) -> None:
+        self.stdout.write(
+            f'느린 연결 {options["slow_clients"]}개 (요청 전송 {options["slow_seconds"]:.0f}초, 완료 {self.slow_finished}개)'
+            f'  일반 연결 {options["probes"]}개'
+        )
+        if not self.latencies:
+            self.stdout.write(f'완료된 일반 요청이 없습니다  실패/시간 초과 {self.failures}회')
+            return
+        latencies = sorted(self.latencies)
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        self.stdout.write(
+            f'일반 요청 {len(latencies)}회 ({len(latencies) / elapsed:.1f} req/s)  '
+            f'p50 {statistics.median(latencies):.1f}ms  p95 {p95:.1f}ms  최대 {latencies[-1]:.1f}ms  '
+            f'실패/시간 초과 {self.failures}회  상태 {dict(sorted(self.statuses.items()))}'
+        )
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:57
+
+from typing import Any
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_gallery_positions(apps: Any, schema_editor: Any) -> None:
+    # 기존 이미지는 등록 순서(id)대로 position 을 매기고 첫 이미지를 대표 이미지로 지정
+    Product = apps.get_model('products', 'Product')
+    ProductGallery = apps.get_model('products', 'ProductGallery')
+    for product in Product.objects.all().iterator():
+        links = list(ProductGallery.objects.filter(product_id=product.pk).order_by('productimage_id'))
+        for position, link in enumerate(links):
+            link.position = position
+        ProductGallery.objects.bulk_update(links, ['position'])
+        if links:
+            Product.objects.filter(pk=product.pk).update(primary_image_id=links[0].productimage_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0004_alter_productimage_image'),
+    ]
+
+    operations = [
+        # 자동 생성된 product_image_cdt 테이블을 그대로 두고 명시적인 through 모델로 전환
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='ProductGallery',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='products.product')),
+                        ('productimage', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='products.productimage')),
+                    ],
+                    options={
+                        'db_table': 'product_image_cdt',
+                        'unique_together': {('product', 'productimage')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='product',
+                    name='image',
+                    field=models.ManyToManyField(blank=True, through='products.ProductGallery', to='products.productimage'),
+                ),
+            ],
+        ),
+        migrations.AddField(
+            model_name='productgallery',
+            name='position',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AlterModelOptions(
+            name='productgallery',
+            options={'ordering': ['position', 'id']},
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='primary_image',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='products.productimage'),
+        ),
+        migrations.RunPython(fill_gallery_positions, migrations.RunPython.noop),
+    ]
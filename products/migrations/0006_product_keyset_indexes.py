@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-18 12:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0005_product_gallery_primary_image'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['-created_at', '-id'], name='products_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('is_live', True), ('is_sold', False)), fields=['-created_at', '-id'], name='products_live_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:05
+
+from typing import Any
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def fill_product_slugs(apps: Any, schema_editor: Any) -> None:
+    # 기존 상품은 이름으로 slug 를 만들고, 이름이 겹치면 등록 순서대로 번호를 붙인다
+    Product = apps.get_model('products', 'Product')
+    taken: set[str] = set()
+    for product in Product.objects.order_by('id').iterator():
+        base_slug = slugify(product.name, allow_unicode=True)[:100] or 'product'
+        slug = base_slug
+        counter = 2
+        while slug in taken:
+            slug = f"{base_slug}-{counter}"
+            counter += 1
+        taken.add(slug)
+        Product.objects.filter(pk=product.pk).update(slug=slug)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0006_product_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='slug',
+            field=models.SlugField(allow_unicode=True, max_length=120, null=True),
+        ),
+        migrations.RunPython(fill_product_slugs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:40
+
+from typing import Any
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# 한국어 형태소 사전이 없으므로 'simple' 설정으로 공백 단위 토큰을 만들고,
+# 부분 일치와 오타는 pg_trgm 인덱스로 보완한다
+SEARCH_VECTOR_SQL = """
+ALTER TABLE products ADD COLUMN search_vector tsvector;
+
+CREATE FUNCTION products_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER products_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF name, description ON products
+    FOR EACH ROW EXECUTE FUNCTION products_search_vector_update();
+
+UPDATE products SET name = name;
+
+CREATE INDEX products_search_vector_idx ON products USING gin (search_vector);
+CREATE INDEX products_name_trgm_idx ON products USING gin (name gin_trgm_ops);
+CREATE INDEX products_description_trgm_idx ON products USING gin (description gin_trgm_ops);
+"""
+
+DROP_SEARCH_VECTOR_SQL = """
+DROP INDEX IF EXISTS products_description_trgm_idx;
+DROP INDEX IF EXISTS products_name_trgm_idx;
+DROP INDEX IF EXISTS products_search_vector_idx;
+DROP TRIGGER IF EXISTS products_search_vector_trigger ON products;
+DROP FUNCTION IF EXISTS products_search_vector_update();
+ALTER TABLE products DROP COLUMN IF EXISTS search_vector;
+"""
+
+
+def create_search_vector(apps: Any, schema_editor: Any) -> None:
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(SEARCH_VECTOR_SQL)
+
+
+def drop_search_vector(apps: Any, schema_editor: Any) -> None:
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(DROP_SEARCH_VECTOR_SQL)
+
+
+class PostgresTrigramExtension(TrigramExtension):
+    # SQLite 등 다른 DB 에서는 확장 설치를 건너뛴다
+    def database_forwards(self, app_label: str, schema_editor: Any, from_state: Any, to_state: Any) -> None:
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label: str, schema_editor: Any, from_state: Any, to_state: Any) -> None:
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0008_alter_product_slug'),
+    ]
+
+    operations = [
+        PostgresTrigramExtension(),
+        migrations.RunPython(create_search_vector, drop_search_vector),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:16
+
+import hashlib
+from typing import Any
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_image_hashes(apps: Any, schema_editor: Any) -> None:
+    # 기존 이미지의 내용 해시를 채우고, 같은 내용의 중복 행은 먼저 등록된 행으로 합친다
+    # 기존 파일 경로는 그대로 두며 합쳐진 중복 파일은 미디어 정리 때 지운다
+    Product = apps.get_model('products', 'Product')
+    ProductImage = apps.get_model('products', 'ProductImage')
+    ProductGallery = apps.get_model('products', 'ProductGallery')
+
+    canonical: dict[str, int] = {}
+    for product_image in ProductImage.objects.order_by('id').iterator():
+        digest = hashlib.sha256()
+        try:
+            with product_image.image.open('rb') as image_file:
+                for chunk in image_file.chunks():
+                    digest.update(chunk)
+        except (OSError, ValueError):
+            continue
+
+        sha256 = digest.hexdigest()
+        keep_id = canonical.setdefault(sha256, product_image.pk)
+        if keep_id == product_image.pk:
+            ProductImage.objects.filter(pk=product_image.pk).update(sha256=sha256)
+            continue
+
+        for link in ProductGallery.objects.filter(productimage_id=product_image.pk):
+            if ProductGallery.objects.filter(product_id=link.product_id, productimage_id=keep_id).exists():
+                link.delete()
+            else:
+                link.productimage_id = keep_id
+                link.save(update_fields=['productimage'])
+        Product.objects.filter(primary_image_id=product_image.pk).update(primary_image_id=keep_id)
+        product_image.delete()
+
+    link_counts = (
+        ProductGallery.objects.filter(productimage_id=OuterRef('pk'))
+        .values('productimage_id').annotate(count=Count('id')).values('count')
+    )
+    ProductImage.objects.update(ref_count=Coalesce(Subquery(link_counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0011_productimage_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productimage',
+            name='ref_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='productimage',
+            name='sha256',
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True),
+        ),
+        migrations.RunPython(fill_image_hashes, migrations.RunPython.noop),
+    ]
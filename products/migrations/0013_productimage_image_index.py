@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-18 13:18
+
+from django.db import migrations, models
+
+import products.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0012_productimage_sha256'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='productimage',
+            name='image',
+            field=models.ImageField(db_index=True, upload_to=products.models.product_image_upload_path),
+        ),
+    ]
@@ -1,31 +1,74 @@
 
 import os
+import re
+import secrets
 import uuid
+from typing import Any
 
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import BigIntegerField, Case, Count, Max, Q, When
+from django.db.models.functions import Cast, Substr
+from django.utils.text import slugify
 
 from config.basemodel import BaseModel
 from users.models import User
 
 
 def product_image_upload_path(instance: 'ProductImage', filename: str) -> str:
-    ext = filename.split('.')[-1]
+    ext = filename.split('.')[-1].lower()
+    if instance.sha256:
+        # 내용 해시 기반 경로 (products/images/ab/cd/abcd....jpg), 같은 내용은 같은 파일을 가리킨다
+        return os.path.join('products', 'images', instance.sha256[:2], instance.sha256[2:4], f"{instance.sha256}.{ext}")
     filename = f"{uuid.uuid4()}.{ext}"
     return os.path.join('products', 'images', filename)
 
 
 class ProductImage(BaseModel):
-    image = models.ImageField(upload_to=product_image_upload_path)
-    
+    # 미디어 정리(gc_media) 때 파일 이름으로 배치 조회하므로 인덱스를 둔다
+    image = models.ImageField(upload_to=product_image_upload_path, db_index=True)
+    sha256 = models.CharField(max_length=64, unique=True, null=True, blank=True, editable=False)
+    # 이 이미지를 갤러리에 연결한 상품 수 (product_image_cdt 행 수)
+    ref_count = models.PositiveIntegerField(default=0, editable=False)
+    # 포맷별 리사이즈 파생 이미지 목록 (예: {"webp": [{"width": 320, "name": "..."}], "jpeg": [...]})
+    variants = models.JSONField(default=dict, blank=True, editable=False)
+
     class Meta:
         db_table = 'products_image'
 
+    def _srcset(self, fmt: str) -> str:
+        return ', '.join(
+            f"{self.image.storage.url(variant['name'])} {variant['width']}w" for variant in self.variants.get(fmt, [])
+        )
+
+    @property
+    def webp_srcset(self) -> str:
+        return self._srcset('webp')
+
+    @property
+    def jpeg_srcset(self) -> str:
+        return self._srcset('jpeg')
+
+    @property
+    def thumbnail_url(self) -> str:
+        # 가장 작은 JPEG 파생 이미지, 아직 없으면 원본
+        jpeg_variants = self.variants.get('jpeg')
+        if jpeg_variants:
+            return self.image.storage.url(jpeg_variants[0]['name'])
+        return self.image.url
+
 # Create your models here.
 class Product(BaseModel):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
+    # 단일 컬럼 인덱스 대신 category 가 맨 앞인 products_category_live_idx 를 함께 쓴다
+    category = models.ForeignKey(
+        'categories.Category', on_delete=models.SET_NULL, null=True, blank=True, related_name='products',
+        db_index=False,
+    )
     name = models.CharField(max_length=100)
+    slug = models.SlugField(max_length=120, unique=True, allow_unicode=True)
     description = models.TextField()
-    image = models.ManyToManyField(ProductImage, blank=True, db_table='product_image_cdt')
+    image = models.ManyToManyField(ProductImage, blank=True, through='ProductGallery')
+    primary_image = models.ForeignKey(ProductImage, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
     price = models.DecimalField(max_digits=10, decimal_places=2)
     sale_price = models.DecimalField(max_digits=10, decimal_places=2, blank=True, null=True)
     stock = models.IntegerField()
@@ -33,6 +76,99 @@ class Product(BaseModel):
     is_sold = models.BooleanField(default=False)
     class Meta:
         db_table = 'products'
+        indexes = [
+            # 커서 페이지네이션 (created_at, id) 정렬용
+            models.Index(fields=['-created_at', '-id'], name='products_created_id_idx'),
+            models.Index(
+                fields=['-created_at', '-id'],
+                name='products_live_created_id_idx',
+                condition=models.Q(is_live=True, is_sold=False),
+            ),
+            # 카테고리 페이지의 노출 상품 필터와 최신순 정렬을 인덱스만으로 처리
+            models.Index(
+                fields=['category', 'is_live', 'is_sold', '-created_at', '-id'],
+                name='products_category_live_idx',
+            ),
+            # 예전 상품명 URL 리다이렉트 조회 (같은 이름이면 먼저 등록된 상품)
+            models.Index(fields=['name', 'id'], name='products_name_id_idx'),
+        ]
+
+    SLUG_MAX_ATTEMPTS = 5
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        if self.slug:
+            super().save(*args, **kwargs)
+            return
+        # 같은 이름으로 동시에 등록하면 같은 slug 를 고를 수 있으므로 부딪히면 다시 골라 저장한다
+        attempts = 0
+        while True:
+            self.slug = self._generate_unique_slug(self.name)
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                attempts += 1
+                if attempts >= self.SLUG_MAX_ATTEMPTS or not Product.objects.filter(slug=self.slug).exists():
+                    self.slug = ''
+                    raise
+
+    SLUG_SUFFIX_DIGITS = 9
+
+    @staticmethod
+    def _generate_unique_slug(name: str) -> str:
+        base_slug = Product.base_slug(name)
+        prefix = f'{base_slug}-'
+        digits = Product.SLUG_SUFFIX_DIGITS
+        suffix = Cast(Substr('slug', len(prefix) + 1), BigIntegerField())
+        # base 와 base-<숫자> 만 한 번에 집계해 가장 큰 번호 + 1 을 쓴다 (slug 인덱스로 접두사 검색)
+        counts = Product.objects.filter(
+            Q(slug=base_slug)
+            | Q(slug__startswith=prefix, slug__regex=rf'^{re.escape(prefix)}[0-9]{{1,{digits}}}$')
+        ).aggregate(
+            base_taken=Count('pk', filter=Q(slug=base_slug)),
+            max_suffix=Max(Case(When(~Q(slug=base_slug), then=suffix))),
+        )
+        if not counts['base_taken']:
+            return base_slug
+        number = max(counts['max_suffix'] or 0, 1) + 1
+        if number >= 10 ** digits:
+            # 가장 큰 번호를 누군가 선점하면 다음 번호는 집계에 잡히지 않으므로 임의 번호를 쓴다
+            number = secrets.randbelow(10 ** digits)
+        return f'{prefix}{number}'
+
+    @staticmethod
+    def base_slug(name: str) -> str:
+        return slugify(name, allow_unicode=True)[:100] or 'product'
+
+    @staticmethod
+    def next_free_slug(base_slug: str, taken: set[str]) -> str:
+        slug = base_slug
+        counter = 2
+        while slug in taken:
+            slug = f"{base_slug}-{counter}"
+            counter += 1
+        return slug
+
+    @property
+    def gallery_images(self) -> list[ProductImage]:
+        # position 순서대로 정렬된 상품 이미지 목록 (대표 이미지가 맨 앞)
+        links = getattr(self, 'gallery_links', None)
+        if links is None:
+            links = ProductGallery.objects.filter(product=self).select_related('productimage')
+        return [link.productimage for link in links]
+
+
+class ProductGallery(models.Model):
+    product = models.ForeignKey(Product, on_delete=models.CASCADE)
+    productimage = models.ForeignKey(ProductImage, on_delete=models.CASCADE)
+    position = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'product_image_cdt'
+        ordering = ['position', 'id']
+        unique_together = [('product', 'productimage')]
+
 
 class WishList(BaseModel):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
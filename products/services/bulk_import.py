@@ -0,0 +1,301 @@
+import csv
+import io
+import json
+from decimal import Decimal
+from typing import IO, Any, Iterable, Iterator, Optional
+
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DataError, IntegrityError, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from categories.models import Category
+from products.models import Product
+from products.services.page_cache import StorefrontPageCache
+from products.validators import validate_price, validate_sale_price, validate_stock
+from users.models import User
+
+FORMATS = ('csv', 'jsonl')
+EXPORT_FIELDS = (
+    'id', 'name', 'slug', 'category_id', 'description', 'price', 'sale_price', 'stock', 'is_live', 'is_sold',
+    'created_at',
+)
+# COPY 로 넣는 컬럼 순서 (products 테이블)
+COPY_COLUMNS = (
+    'user_id', 'category_id', 'name', 'slug', 'description', 'price', 'sale_price', 'stock', 'is_live', 'is_sold',
+    'primary_image_id', 'created_at', 'updated_at',
+)
+# 모든 값을 따옴표로 감싸므로 빈 값을 NULL 로 읽을 컬럼
+COPY_NULL_COLUMNS = ('category_id', 'sale_price', 'primary_image_id')
+TRUE_VALUES = {'1', 't', 'true', 'y', 'yes', 'on'}
+FALSE_VALUES = {'', '0', 'f', 'false', 'n', 'no', 'off'}
+
+
+class ImportRowError:
+    def __init__(self, line: int, message: str) -> None:
+        self.line = line
+        self.message = message
+
+    def as_dict(self) -> dict[str, Any]:
+        return {'line': self.line, 'message': self.message}
+
+
+class ImportBatchError:
+    def __init__(self, first_line: int, last_line: int, rows: int, message: str) -> None:
+        self.first_line = first_line
+        self.last_line = last_line
+        self.rows = rows
+        self.message = message
+
+    def as_dict(self) -> dict[str, Any]:
+        return {'first_line': self.first_line, 'last_line': self.last_line, 'rows': self.rows, 'message': self.message}
+
+
+class ImportResult:
+    MAX_REPORTED_ERRORS = 100
+
+    def __init__(self) -> None:
+        self.processed = 0
+        self.created = 0
+        self.failed = 0
+        self.errors: list[ImportRowError] = []
+        self.batch_errors: list[ImportBatchError] = []
+
+    def add_error(self, line: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < self.MAX_REPORTED_ERRORS:
+            self.errors.append(ImportRowError(line, message))
+
+    def add_batch_error(self, error: ImportBatchError) -> None:
+        self.failed += error.rows
+        if len(self.batch_errors) < self.MAX_REPORTED_ERRORS:
+            self.batch_errors.append(error)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            'processed': self.processed,
+            'created': self.created,
+            'failed': self.failed,
+            'errors': [error.as_dict() for error in self.errors],
+            'batch_errors': [error.as_dict() for error in self.batch_errors],
+        }
+
+
+def read_rows(stream: IO[str], fmt: str) -> Iterator[tuple[int, dict[str, Any]]]:
+    """CSV(헤더 포함) 또는 JSONL 을 한 줄씩 읽어 (줄 번호, 행) 으로 돌려준다"""
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for line_number, line in enumerate(stream, start=1):
+        if line.strip():
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError:
+                yield line_number, {'__error__': "JSON 형식이 올바르지 않습니다."}
+
+
+class ProductImportService:
+    """대량 상품 등록
+
+    행마다 폼을 만들지 않고 모델 필드의 clean() 과 ProductForm 과 같은 검증 함수로 검사한 뒤,
+    batch_size 개씩 모아 Postgres 에서는 COPY, 그 밖에는 bulk_create 로 넣는다.
+    잘못된 행은 건너뛰고 줄 번호와 함께 결과에 남긴다. DB 가 배치를 거부하면(IntegrityError/DataError)
+    그 배치만 되돌리고 줄 범위와 함께 결과에 남긴 뒤 다음 배치를 계속한다.
+    """
+
+    BATCH_SIZE = 1000
+    SLUG_LOOKUP_CHUNK = 100
+
+    def __init__(
+        self,
+        owner: User,
+        *,
+        batch_size: int = BATCH_SIZE,
+        use_copy: Optional[bool] = None,
+    ) -> None:
+        self.owner = owner
+        self.batch_size = batch_size
+        self.use_copy = connection.vendor == 'postgresql' if use_copy is None else use_copy
+        self.result = ImportResult()
+        self.category_ids = set(Category.objects.values_list('id', flat=True))
+        self._taken_slugs: set[str] = set()
+        self._looked_up_bases: set[str] = set()
+
+    @staticmethod
+    def _optional(value: Any) -> Any:
+        return None if value is None or (isinstance(value, str) and not value.strip()) else value
+
+    @staticmethod
+    def _parse_bool(value: Any) -> bool:
+        if isinstance(value, bool):
+            return value
+        text = str(value if value is not None else '').strip().lower()
+        if text in TRUE_VALUES:
+            return True
+        if text in FALSE_VALUES:
+            return False
+        raise ValidationError(f"'{value}' 은(는) 참/거짓 값이 아닙니다.")
+
+    def clean_row(self, row: dict[str, Any]) -> tuple[Product, bool]:
+        """행을 검증해 (저장 전 Product, slug 를 직접 지정했는지) 를 돌려준다"""
+        if '__error__' in row:
+            raise ValidationError(row['__error__'])
+
+        def clean_field(name: str, value: Any) -> Any:
+            field = Product._meta.get_field(name)
+            try:
+                return field.clean(value, None)  # type: ignore[union-attr]
+            except ValidationError as error:
+                raise ValidationError(f"{name}: {' '.join(error.messages)}")
+
+        name = clean_field('name', (row.get('name') or '').strip())
+        description = clean_field('description', (row.get('description') or '').strip())
+        price: Decimal = clean_field('price', row.get('price'))
+        sale_price: Optional[Decimal] = clean_field('sale_price', self._optional(row.get('sale_price')))
+        stock: int = clean_field('stock', row.get('stock'))
+        validate_price(price)
+        validate_stock(stock)
+        validate_sale_price(sale_price, price)
+
+        category_id = self._optional(row.get('category_id'))
+        if category_id is not None:
+            category_id = int(category_id)
+            if category_id not in self.category_ids:
+                raise ValidationError(f"category_id: {category_id} 카테고리가 없습니다.")
+
+        explicit_slug = self._optional(row.get('slug'))
+        product = Product(
+            user=self.owner,
+            category_id=category_id,
+            name=name,
+            slug=Product.base_slug(explicit_slug or name),
+            description=description,
+            price=price,
+            sale_price=sale_price,
+            stock=stock,
+            is_live=self._parse_bool(row.get('is_live')),
+            is_sold=self._parse_bool(row.get('is_sold')),
+        )
+        return product, explicit_slug is not None
+
+    def _reserve_slugs(self, bases: set[str]) -> None:
+        # 배치에 나온 slug 접두사별 기존 slug 를 묶어서 한 번에 조회한다
+        pending = sorted(bases - self._looked_up_bases)
+        for start in range(0, len(pending), self.SLUG_LOOKUP_CHUNK):
+            chunk = pending[start:start + self.SLUG_LOOKUP_CHUNK]
+            prefixes = Q()
+            for base in chunk:
+                prefixes |= Q(slug__startswith=base)
+            self._taken_slugs.update(Product.objects.filter(prefixes).values_list('slug', flat=True))
+        self._looked_up_bases.update(pending)
+
+    def _assign_slugs(self, batch: list[tuple[int, Product, bool]]) -> list[Product]:
+        self._reserve_slugs({product.slug for _, product, _ in batch})
+        products = []
+        for line, product, explicit_slug in batch:
+            if explicit_slug and product.slug in self._taken_slugs:
+                self.result.add_error(line, f"slug: '{product.slug}' 은(는) 이미 사용 중입니다.")
+                continue
+            product.slug = Product.next_free_slug(product.slug, self._taken_slugs)
+            self._taken_slugs.add(product.slug)
+            products.append(product)
+        return products
+
+    @staticmethod
+    def copy_buffer(products: list[Product]) -> io.StringIO:
+        now = timezone.now()
+        buffer = io.StringIO()
+        # 줄에 \. 만 있으면 COPY 가 데이터 끝으로 읽으므로 모든 값을 따옴표로 감싸고,
+        # 빈 값은 FORCE_NULL 컬럼에서만 NULL 로 읽게 한다
+        writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+        for product in products:
+            writer.writerow([
+                product.user_id, product.category_id if product.category_id is not None else '',
+                product.name, product.slug, product.description, product.price,
+                product.sale_price if product.sale_price is not None else '', product.stock,
+                't' if product.is_live else 'f', 't' if product.is_sold else 'f', '',
+                now.isoformat(), now.isoformat(),
+            ])
+        buffer.seek(0)
+        return buffer
+
+    def _copy(self, products: list[Product]) -> None:
+        buffer = self.copy_buffer(products)
+        sql = (
+            f"COPY {Product._meta.db_table} ({', '.join(COPY_COLUMNS)}) FROM STDIN "
+            f"WITH (FORMAT csv, FORCE_NULL ({', '.join(COPY_NULL_COLUMNS)}))"
+        )
+        # 드라이버 커서를 직접 쓰므로 예외를 Django 의 IntegrityError/DataError 로 바꿔 받는다
+        with connection.cursor() as cursor, connection.wrap_database_errors:
+            raw_cursor = cursor.cursor
+            if hasattr(raw_cursor, 'copy_expert'):
+                raw_cursor.copy_expert(sql, buffer)
+            else:
+                with raw_cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+
+    def _flush(self, batch: list[tuple[int, Product, bool]]) -> None:
+        if not batch:
+            return
+        failed_before = self.result.failed
+        try:
+            with transaction.atomic():
+                products = self._assign_slugs(batch)
+                if self.use_copy:
+                    self._copy(products)
+                else:
+                    Product.objects.bulk_create(products, batch_size=self.batch_size)
+        except (IntegrityError, DataError) as error:
+            # slug 충돌로 이미 실패 처리한 행을 빼고 나머지 행을 실패로 센다
+            rows = len(batch) - (self.result.failed - failed_before)
+            self.result.add_batch_error(ImportBatchError(batch[0][0], batch[-1][0], rows, str(error).strip()))
+            return
+        self.result.created += len(products)
+
+    def iter_batches(self, rows: Iterable[tuple[int, dict[str, Any]]]) -> Iterator[ImportResult]:
+        """배치를 하나 저장할 때마다 누적 결과를 돌려준다 (진행 상황 출력용)"""
+        batch: list[tuple[int, Product, bool]] = []
+        try:
+            for line, row in rows:
+                self.result.processed += 1
+                try:
+                    batch.append((line, *self.clean_row(row)))
+                except (ValidationError, ValueError, TypeError) as error:
+                    messages = error.messages if isinstance(error, ValidationError) else [str(error)]
+                    self.result.add_error(line, ' '.join(messages))
+                if len(batch) >= self.batch_size:
+                    self._flush(batch)
+                    batch = []
+                    yield self.result
+            self._flush(batch)
+            yield self.result
+        finally:
+            if self.result.created:
+                # 새 상품이 홈 목록에 보이도록 페이지 캐시 세대를 올린다
+                StorefrontPageCache.purge_slugs([])
+
+    def run(self, rows: Iterable[tuple[int, dict[str, Any]]]) -> ImportResult:
+        for _ in self.iter_batches(rows):
+            pass
+        return self.result
+
+
+class _Echo:
+    def write(self, value: str) -> str:
+        return value
+
+
+def export_rows(fmt: str, chunk_size: int = 2000) -> Iterator[str]:
+    """상품 전체를 id 순으로 CSV 또는 JSONL 한 줄씩 내보낸다"""
+    rows = Product.objects.order_by('id').values_list(*EXPORT_FIELDS).iterator(chunk_size=chunk_size)
+    if fmt == 'csv':
+        writer = csv.writer(_Echo())
+        yield writer.writerow(EXPORT_FIELDS)
+        for row in rows:
+            yield writer.writerow(row)
+        return
+    for row in rows:
+        yield json.dumps(dict(zip(EXPORT_FIELDS, row)), cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
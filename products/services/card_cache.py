@@ -0,0 +1,63 @@
+from datetime import datetime
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from products.models import Product
+
+
+class ProductCardCache:
+    """상품 카드 HTML 조각 캐시
+
+    키에 상품 id 와 updated_at 이 들어가므로 상품이 바뀌면 자연히 새 키가 쓰이고,
+    이미지나 갤러리 변경은 시그널에서 touch() 로 updated_at 을 올려 무효화한다.
+    """
+
+    TEMPLATES = {
+        'storefront': 'products/partials/storefront_card.html',
+        'admin': 'products/partials/admin_card.html',
+    }
+
+    @staticmethod
+    def make_key(variant: str, product_id: int, updated_at: datetime) -> str:
+        return f"product_card:{variant}:{product_id}:{updated_at.timestamp()}"
+
+    @classmethod
+    def render_many(cls, products: Iterable[Product], variant: str) -> str:
+        template_name = cls.TEMPLATES[variant]
+        products = list(products)
+        keys = {product.pk: cls.make_key(variant, product.pk, product.updated_at) for product in products}
+        # 한 페이지의 카드를 캐시 왕복 한 번으로 가져온다
+        cached: dict[str, Any] = cache.get_many(keys.values())
+
+        cards = []
+        missing = {}
+        for product in products:
+            key = keys[product.pk]
+            card = cached.get(key)
+            if card is None:
+                card = render_to_string(template_name, {'product': product})
+                missing[key] = card
+            cards.append(card)
+
+        if missing:
+            cache.set_many(missing, settings.PRODUCT_CARD_CACHE_TIMEOUT)
+        return ''.join(cards)
+
+    @classmethod
+    def delete(cls, product_id: int, updated_at: datetime) -> None:
+        cache.delete_many([cls.make_key(variant, product_id, updated_at) for variant in cls.TEMPLATES])
+
+    @classmethod
+    def touch(cls, product_ids: Iterable[int]) -> None:
+        product_ids = set(product_ids)
+        if not product_ids:
+            return
+        stale = Product.objects.filter(pk__in=product_ids).values_list('pk', 'updated_at')
+        cache.delete_many([
+            cls.make_key(variant, pk, updated_at) for pk, updated_at in stale for variant in cls.TEMPLATES
+        ])
+        Product.objects.filter(pk__in=product_ids).update(updated_at=timezone.now())
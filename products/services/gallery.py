@@ -0,0 +1,169 @@
+import os
+from typing import Iterable
+
+from django.core.files.storage import Storage
+from django.core.files.uploadedfile import UploadedFile
+from django.db import IntegrityError, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from products.models import (
+    Product,
+    ProductGallery,
+    ProductImage,
+    product_image_upload_path,
+)
+from products.services.card_cache import ProductCardCache
+from products.services.image_variants import ImageVariantService
+from products.services.page_cache import StorefrontPageCache
+from products.upload_handlers import content_sha256
+
+
+class ProductGalleryService:
+
+    @staticmethod
+    def sync_primary_image(product: Product) -> None:
+        # 갤러리의 첫 번째 이미지를 대표 이미지로 맞춘다
+        first_image_id = (
+            ProductGallery.objects.filter(product=product)
+            .order_by('position', 'id')
+            .values_list('productimage_id', flat=True)
+            .first()
+        )
+        if product.primary_image_id != first_image_id:
+            product.primary_image_id = first_image_id
+            product.save(update_fields=['primary_image', 'updated_at'])
+
+    @staticmethod
+    def refresh_ref_counts(product_image_ids: Iterable[int]) -> None:
+        link_counts = (
+            ProductGallery.objects.filter(productimage_id=OuterRef('pk'))
+            .values('productimage_id').annotate(count=Count('id')).values('count')
+        )
+        ProductImage.objects.filter(pk__in=set(product_image_ids)).update(
+            ref_count=Coalesce(Subquery(link_counts), 0)
+        )
+
+    @staticmethod
+    def _touch(storage: Storage, name: str) -> None:
+        # 다시 쓰는 파일의 수정 시각을 갱신해 gc_media 의 grace 기간 안에 들게 한다
+        try:
+            path = storage.path(name)
+        except NotImplementedError:
+            return
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    @classmethod
+    def _store_file(cls, file: UploadedFile, sha256: str) -> ProductImage:
+        product_image = ProductImage(sha256=sha256)
+        name = product_image_upload_path(product_image, file.name or '')
+        storage = product_image.image.storage
+        # 이전에 같은 내용이 저장된 적이 있으면 파일을 다시 쓰지 않는다
+        if storage.exists(name):
+            product_image.image.name = name
+            cls._touch(storage, name)
+        else:
+            product_image.image.save(name, file, save=False)
+        return product_image
+
+    @staticmethod
+    def _save_one(product_image: ProductImage) -> tuple[ProductImage, bool]:
+        try:
+            with transaction.atomic():
+                product_image.save()
+        except IntegrityError:
+            # 동시에 같은 이미지가 올라온 경우 먼저 저장된 행을 쓴다
+            return ProductImage.objects.get(sha256=product_image.sha256), False
+        return product_image, True
+
+    @classmethod
+    def get_or_create_images(cls, files: list[UploadedFile]) -> tuple[list[ProductImage], list[ProductImage]]:
+        """업로드 파일을 내용 해시로 중복 제거해 (전체 이미지, 새로 만든 이미지) 를 돌려준다
+
+        없는 이미지는 파일을 먼저 저장한 뒤 한 번의 INSERT 로 행을 만든다.
+        """
+        hashes = [content_sha256(file) for file in files]
+        by_hash = {image.sha256: image for image in ProductImage.objects.filter(sha256__in=hashes)}
+
+        pending: dict[str, ProductImage] = {}
+        for file, sha256 in zip(files, hashes):
+            if sha256 not in by_hash and sha256 not in pending:
+                pending[sha256] = cls._store_file(file, sha256)
+
+        created: list[ProductImage] = []
+        if pending:
+            try:
+                with transaction.atomic():
+                    created = ProductImage.objects.bulk_create(pending.values())
+            except IntegrityError:
+                # 다른 요청이 같은 이미지를 먼저 넣었다면 한 장씩 저장하며 기존 행을 찾아 쓴다
+                for product_image in pending.values():
+                    product_image, is_new = cls._save_one(product_image)
+                    pending[str(product_image.sha256)] = product_image
+                    if is_new:
+                        created.append(product_image)
+            by_hash.update(pending)
+
+        images: list[ProductImage] = []
+        for sha256 in hashes:
+            if by_hash[sha256] not in images:
+                images.append(by_hash[sha256])
+        return images, created
+
+    @classmethod
+    def attach_images(cls, product: Product, files: list[UploadedFile]) -> list[ProductImage]:
+        """이미지 행과 갤러리 연결을 묶음 INSERT 로 한 트랜잭션 안에서 만든다
+
+        중간에 실패하면 행과 연결이 모두 롤백되어 갤러리가 반쯤 붙은 상태로 남지 않는다.
+        이미 저장된 파일은 gc_media 가 정리한다.
+        """
+        if not files:
+            return []
+
+        with transaction.atomic():
+            images, created = cls.get_or_create_images(files)
+            # 기존 연결과 마지막 순번을 한 번에 읽는다
+            positions = dict(ProductGallery.objects.filter(product=product).values_list('productimage_id', 'position'))
+            next_position = max(positions.values(), default=-1) + 1
+
+            new_images = [image for image in images if image.pk not in positions]
+            ProductGallery.objects.bulk_create([
+                ProductGallery(product=product, productimage=product_image, position=next_position + offset)
+                for offset, product_image in enumerate(new_images)
+            ])
+
+            cls.refresh_ref_counts(image.pk for image in new_images)
+            cls.sync_primary_image(product)
+            if new_images:
+                # bulk_create 는 post_save 시그널을 보내지 않으므로 캐시를 직접 무효화한다.
+                # 커밋 전에 비우면 다른 요청이 이전 갤러리를 다시 캐시할 수 있으므로 커밋 후에 비운다
+                product_id, slug = product.pk, product.slug
+                transaction.on_commit(lambda: cls._invalidate_caches(product_id, slug))
+            ImageVariantService.schedule(image.pk for image in created)
+        return images
+
+    @staticmethod
+    def _invalidate_caches(product_id: int, slug: str) -> None:
+        ProductCardCache.touch([product_id])
+        StorefrontPageCache.purge_slugs([slug])
+
+    @classmethod
+    def unlink_image(cls, product: Product, product_image: ProductImage) -> None:
+        # 이 상품에서만 이미지를 떼어내고, 더 이상 쓰는 상품이 없을 때만 이미지 행을 지운다
+        with transaction.atomic():
+            ProductGallery.objects.filter(product=product, productimage=product_image).delete()
+            cls.refresh_ref_counts([product_image.pk])
+            if not ProductGallery.objects.filter(productimage=product_image).exists():
+                product_image.delete()
+            cls.sync_primary_image(product)
+
+    @classmethod
+    def delete_image(cls, product_image: ProductImage) -> None:
+        with transaction.atomic():
+            products = list(Product.objects.filter(image=product_image))
+            product_image.delete()
+            for product in products:
+                cls.sync_primary_image(product)
@@ -0,0 +1,147 @@
+import io
+import logging
+import os
+import queue
+import threading
+from typing import Any, Iterable, Optional
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import close_old_connections, transaction
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from products.models import ProductImage
+
+logger = logging.getLogger(__name__)
+
+
+class ImageVariantService:
+    """업로드 원본에서 그리드/상세용 리사이즈 이미지(WebP, JPEG)를 만든다"""
+
+    WIDTHS = (320, 640, 1024)
+    FORMATS: dict[str, tuple[str, dict[str, Any]]] = {
+        'webp': ('WEBP', {'quality': 80, 'method': 4}),
+        'jpeg': ('JPEG', {'quality': 82, 'optimize': True, 'progressive': True}),
+    }
+    VARIANT_DIR = os.path.join('products', 'images', 'variants')
+
+    @classmethod
+    def variant_name(cls, original_name: str, width: int, fmt: str) -> str:
+        stem = os.path.splitext(os.path.basename(original_name))[0]
+        return os.path.join(cls.VARIANT_DIR, f"{stem}-{width}w.{fmt}")
+
+    @classmethod
+    def target_widths(cls, original_width: int) -> list[int]:
+        # 원본보다 큰 크기로는 늘리지 않고, 원본이 아주 작으면 원본 폭 하나만 만든다
+        return [width for width in cls.WIDTHS if width <= original_width] or [original_width]
+
+    @staticmethod
+    def normalize(image: Image.Image, pil_format: str) -> Image.Image:
+        # CMYK, 팔레트, 흑백+알파 등은 인코더가 받지 않으므로 RGB/RGBA 로 맞춘다
+        has_alpha = image.mode in ('RGBA', 'LA', 'PA') or (image.mode == 'P' and 'transparency' in image.info)
+        if not has_alpha:
+            return image if image.mode == 'RGB' else image.convert('RGB')
+        rgba = image if image.mode == 'RGBA' else image.convert('RGBA')
+        if pil_format != 'JPEG':
+            return rgba
+        # JPEG 는 알파가 없으므로 흰 배경에 합친다
+        background = Image.new('RGB', rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel('A'))
+        return background
+
+    @classmethod
+    def _encode(cls, original: Image.Image, pil_format: str, options: dict[str, Any]) -> list[tuple[int, bytes]]:
+        # 모든 폭을 먼저 인코딩해 실패하면 저장소에 일부만 남지 않게 한다
+        source = cls.normalize(original, pil_format)
+        encoded = []
+        for width in cls.target_widths(original.width):
+            resized = source.copy()
+            resized.thumbnail((width, original.height), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            resized.save(buffer, pil_format, **options)
+            encoded.append((width, buffer.getvalue()))
+        return encoded
+
+    @classmethod
+    def generate(cls, product_image_id: int) -> None:
+        product_image = ProductImage.objects.filter(pk=product_image_id).first()
+        if product_image is None or not product_image.image.name:
+            return
+
+        original_name, storage = product_image.image.name, product_image.image.storage
+        try:
+            with storage.open(original_name, 'rb') as original_file:
+                with Image.open(original_file) as opened:
+                    original = ImageOps.exif_transpose(opened)
+                    original.load()
+        except (UnidentifiedImageError, OSError, ValueError, Image.DecompressionBombError):
+            logger.warning("파생 이미지를 만들 수 없는 파일입니다: %s", original_name)
+            return
+
+        variants: dict[str, list[dict[str, Any]]] = {}
+        for fmt, (pil_format, options) in cls.FORMATS.items():
+            try:
+                encoded = cls._encode(original, pil_format, options)
+            except (OSError, ValueError, Image.DecompressionBombError):
+                # 한 포맷이 실패해도 상품 저장은 계속되고 나머지 포맷은 만든다
+                logger.warning("%s 파생 이미지를 만들 수 없습니다: %s", fmt, original_name, exc_info=True)
+                continue
+            variants[fmt] = []
+            for width, content in encoded:
+                name = cls.variant_name(original_name, width, fmt)
+                if storage.exists(name):
+                    storage.delete(name)
+                variants[fmt].append({'width': width, 'name': storage.save(name, ContentFile(content))})
+
+        product_image.variants = variants
+        # post_save 시그널로 이 이미지를 쓰는 상품 카드와 페이지 캐시가 무효화된다
+        product_image.save(update_fields=['variants', 'updated_at'])
+
+    @classmethod
+    def schedule(cls, product_image_ids: Iterable[int]) -> None:
+        product_image_ids = list(product_image_ids)
+        if settings.PRODUCT_IMAGE_VARIANTS_SYNC:
+            for product_image_id in product_image_ids:
+                cls.generate(product_image_id)
+            return
+        # 커밋 전에는 워커 스레드의 커넥션에서 새 행이 보이지 않으므로 커밋 후에 넣는다
+        transaction.on_commit(lambda: _worker.submit(product_image_ids))
+
+
+class _VariantWorker:
+    """요청 스레드 밖에서 파생 이미지를 만드는 프로세스 내 작업 큐
+
+    gunicorn 의 preload 이후 fork 된 워커마다 처음 작업이 들어올 때 스레드를 띄운다.
+    프로세스가 종료되며 남은 작업은 generate_image_variants 명령으로 다시 채운다.
+    """
+
+    def __init__(self) -> None:
+        self._queue: queue.Queue[int] = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, product_image_ids: Iterable[int]) -> None:
+        self._ensure_thread()
+        for product_image_id in product_image_ids:
+            self._queue.put(product_image_id)
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='image-variants', daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            product_image_id = self._queue.get()
+            close_old_connections()
+            try:
+                ImageVariantService.generate(product_image_id)
+            except Exception:
+                logger.exception("파생 이미지 생성 실패: ProductImage %s", product_image_id)
+            finally:
+                close_old_connections()
+                self._queue.task_done()
+
+
+_worker = _VariantWorker()
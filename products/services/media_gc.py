@@ -0,0 +1,201 @@
+import heapq
+import os
+import re
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, Optional
+
+from django.core.files.storage import Storage
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from products.models import ProductGallery, ProductImage
+from products.services.gallery import ProductGalleryService
+from products.services.image_variants import ImageVariantService
+
+MEDIA_IMAGE_ROOT = os.path.join('products', 'images')
+VARIANT_NAME_RE = re.compile(r'^(?P<stem>.+)-\d+w\.[a-z]+$')
+SHA256_RE = re.compile(r'^[0-9a-f]{64}$')
+
+
+class MediaGarbageCollector:
+    """상품에 연결되지 않은 ProductImage 행과 DB 가 참조하지 않는 미디어 파일을 정리한다
+
+    파일은 디렉터리 단위로 이름순 순회하면서 batch_size 개씩 DB 와 비교한다. 로컬 저장소에서는
+    디렉터리를 os.scandir 로 여러 번 훑으며 다음 listing_chunk 개씩만 골라 정렬하므로, 예전 uuid 파일이
+    모인 큰 products/images/ 도 메모리 사용량이 listing_chunk 로 제한된다 (대신 디렉터리 크기 / listing_chunk
+    번 다시 읽는다). 경로를 지원하지 않는 저장소는 listdir 결과를 통째로 정렬한다.
+    순회 순서가 항상 같아 체크포인트(마지막 처리 경로) 이후부터 다시 시작할 수 있다.
+    업로드 직후나 파생 이미지 생성 중인 파일을 지우지 않도록 grace 기간보다 최근에 바뀐 파일과 행은
+    건드리지 않고, 원본은 지우기 직전에 배치마다 다시 참조 여부를 확인한다.
+    """
+
+    def __init__(
+        self,
+        storage: Storage,
+        *,
+        batch_size: int = 500,
+        listing_chunk: int = 10000,
+        grace: timedelta = timedelta(hours=24),
+        dry_run: bool = False,
+        max_deletes_per_second: float = 0,
+        checkpoint: Optional[str] = None,
+        log: Callable[[str], None] = lambda message: None,
+    ) -> None:
+        self.storage = storage
+        self.batch_size = batch_size
+        self.listing_chunk = max(listing_chunk, 1)
+        self.cutoff = timezone.now() - grace
+        self.dry_run = dry_run
+        self.delete_interval = 1 / max_deletes_per_second if max_deletes_per_second > 0 else 0
+        self.checkpoint = checkpoint
+        self.log = log
+        self.deleted_rows = 0
+        self.scanned_files = 0
+        self.deleted_files = 0
+        self.freed_bytes = 0
+
+    # 1단계: 어떤 상품에도 연결되지 않은 이미지 행
+
+    def collect_rows(self) -> None:
+        linked = ProductGallery.objects.filter(productimage_id=OuterRef('pk'))
+        orphans = ProductImage.objects.filter(~Exists(linked), created_at__lt=self.cutoff).order_by('id')
+        last_id = 0
+        while True:
+            batch = list(orphans.filter(id__gt=last_id).values_list('id', flat=True)[:self.batch_size])
+            if not batch:
+                break
+            last_id = batch[-1]
+            self.deleted_rows += len(batch)
+            if self.dry_run:
+                self.log(f"[dry-run] 연결 없는 이미지 행 {len(batch)}개 삭제 예정 (id {batch[0]}~{last_id})")
+                continue
+            with transaction.atomic():
+                # 그 사이 다시 연결된 이미지는 남기고 참조 수를 맞춘다
+                ProductGalleryService.refresh_ref_counts(batch)
+                ProductImage.objects.filter(~Exists(linked), id__in=batch).delete()
+
+    # 2단계: DB 가 참조하지 않는 파일
+
+    def _load_checkpoint(self) -> tuple[str, ...]:
+        if not self.checkpoint or not os.path.exists(self.checkpoint):
+            return ()
+        with open(self.checkpoint, encoding='utf-8') as checkpoint_file:
+            last_name = checkpoint_file.read().strip()
+        return tuple(last_name.split('/')) if last_name else ()
+
+    def _save_checkpoint(self, name: str) -> None:
+        if self.checkpoint and not self.dry_run:
+            with open(self.checkpoint, 'w', encoding='utf-8') as checkpoint_file:
+                checkpoint_file.write(name)
+
+    def clear_checkpoint(self) -> None:
+        if self.checkpoint and not self.dry_run and os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+
+    def _entries(self, directory: str) -> Iterator[tuple[str, bool]]:
+        """디렉터리의 (이름, 디렉터리 여부) 를 이름순으로 돌려준다"""
+        try:
+            path = self.storage.path(directory)
+        except NotImplementedError:
+            directories, files = self.storage.listdir(directory)
+            yield from sorted([(name, True) for name in directories] + [(name, False) for name in files])
+            return
+        after: Optional[str] = None
+        while True:
+            # 한 번에 listing_chunk 개만 들고 있도록 매번 처음부터 훑어 직전 이름 다음 것들만 고른다
+            with os.scandir(path) as scan:
+                chunk = heapq.nsmallest(
+                    self.listing_chunk,
+                    ((entry.name, entry.is_dir()) for entry in scan if after is None or entry.name > after),
+                )
+            yield from chunk
+            if len(chunk) < self.listing_chunk:
+                return
+            after = chunk[-1][0]
+
+    def _walk(self, directory: str, resume_after: tuple[str, ...]) -> Iterator[str]:
+        # 이름순 깊이 우선 순회라 경로를 구성요소 튜플로 비교한 순서와 같다
+        parts = tuple(directory.split('/'))
+        for name, is_directory in self._entries(directory):
+            entry_parts = parts + (name,)
+            path = '/'.join(entry_parts)
+            if is_directory:
+                if entry_parts >= resume_after[:len(entry_parts)]:
+                    yield from self._walk(path, resume_after)
+            elif entry_parts > resume_after:
+                yield path
+
+    def _batches(self) -> Iterator[list[str]]:
+        root = MEDIA_IMAGE_ROOT.replace(os.sep, '/')
+        if not self.storage.exists(root):
+            return
+        batch: list[str] = []
+        for name in self._walk(root, self._load_checkpoint()):
+            batch.append(name)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _original_prefix(stem: str) -> str:
+        if SHA256_RE.match(stem):
+            return '/'.join([MEDIA_IMAGE_ROOT, stem[:2], stem[2:4], f'{stem}.'])
+        return '/'.join([MEDIA_IMAGE_ROOT, f'{stem}.'])
+
+    def _referenced(self, names: list[str]) -> set[str]:
+        variant_dir = ImageVariantService.VARIANT_DIR.replace(os.sep, '/') + '/'
+        originals = [name for name in names if not name.startswith(variant_dir)]
+        referenced = set(ProductImage.objects.filter(image__in=originals).values_list('image', flat=True))
+
+        stems = set()
+        for name in names:
+            if name.startswith(variant_dir):
+                match = VARIANT_NAME_RE.match(name[len(variant_dir):])
+                if match:
+                    stems.add(match.group('stem'))
+        if stems:
+            owners = Q()
+            for stem in stems:
+                owners |= Q(image__startswith=self._original_prefix(stem))
+            for variants in ProductImage.objects.filter(owners).values_list('variants', flat=True):
+                referenced.update(variant['name'] for entries in variants.values() for variant in entries)
+        return referenced
+
+    @staticmethod
+    def _referenced_now(names: list[str]) -> set[str]:
+        # 배치 조회 뒤에 같은 내용이 다시 올라와 예전 파일을 다시 쓰게 된 원본
+        variant_dir = ImageVariantService.VARIANT_DIR.replace(os.sep, '/') + '/'
+        originals = [name for name in names if not name.startswith(variant_dir)]
+        if not originals:
+            return set()
+        return set(ProductImage.objects.filter(image__in=originals).values_list('image', flat=True))
+
+    def _is_recent(self, name: str) -> bool:
+        modified: datetime = self.storage.get_modified_time(name)
+        return modified >= self.cutoff
+
+    def collect_files(self) -> None:
+        for batch in self._batches():
+            self.scanned_files += len(batch)
+            referenced = self._referenced(batch)
+            candidates = [name for name in batch if name not in referenced and not self._is_recent(name)]
+            # 지우기 직전에 한 번 더 확인하고, 그 뒤에 다시 쓰인 파일은 수정 시각 갱신으로 아래에서 거른다
+            referenced_now = self._referenced_now(candidates)
+            for name in candidates:
+                if name in referenced_now or self._is_recent(name):
+                    continue
+                size = self.storage.size(name)
+                self.deleted_files += 1
+                self.freed_bytes += size
+                if self.dry_run:
+                    self.log(f"[dry-run] {name} ({size} bytes) 삭제 예정")
+                    continue
+                self.storage.delete(name)
+                if self.delete_interval:
+                    time.sleep(self.delete_interval)
+            self._save_checkpoint(batch[-1])
+        self.clear_checkpoint()
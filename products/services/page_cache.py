@@ -0,0 +1,139 @@
+import hashlib
+from functools import wraps
+from typing import Any, Callable, Iterable, Optional
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+from django.utils.cache import patch_vary_headers
+
+from config.db_router import primary_reads
+from products.models import Product
+
+# 동기/비동기 뷰 모두 받는다
+ViewFunc = Callable[..., Any]
+
+
+class StorefrontPageCache:
+    """비로그인 방문자용 스토어프런트 전체 응답 캐시
+
+    세션 쿠키가 없는 GET 요청만 캐시에서 응답하고, 상품이 바뀌면 해당 상세 페이지 키와
+    홈 목록 세대(generation)만 골라서 무효화한다.
+    """
+
+    KEY_PREFIX = 'storefront_page'
+    HOME_GENERATION_KEY = f'{KEY_PREFIX}:home:generation'
+    HITS_KEY = f'{KEY_PREFIX}:stats:hits'
+    MISSES_KEY = f'{KEY_PREFIX}:stats:misses'
+
+    @staticmethod
+    def is_cacheable_request(request: HttpRequest) -> bool:
+        return (
+            settings.STOREFRONT_PAGE_CACHE_ENABLED
+            and request.method in ('GET', 'HEAD')
+            and settings.SESSION_COOKIE_NAME not in request.COOKIES
+        )
+
+    @staticmethod
+    def is_cacheable_response(response: HttpResponseBase) -> bool:
+        return response.status_code == 200 and not response.streaming and not response.cookies
+
+    @classmethod
+    def home_key(cls, request: HttpRequest) -> str:
+        generation = cache.get(cls.HOME_GENERATION_KEY, 0)
+        cursor = hashlib.sha256(request.GET.get('cursor', '').encode()).hexdigest()
+        return f'{cls.KEY_PREFIX}:home:{generation}:{cursor}'
+
+    @classmethod
+    def detail_key(cls, slug: str) -> str:
+        return f'{cls.KEY_PREFIX}:detail:{hashlib.sha256(slug.encode()).hexdigest()}'
+
+    @staticmethod
+    def _increment(key: str) -> None:
+        cache.add(key, 0, None)
+        cache.incr(key)
+
+    @classmethod
+    def record_hit(cls) -> None:
+        cls._increment(cls.HITS_KEY)
+
+    @classmethod
+    def record_miss(cls) -> None:
+        cls._increment(cls.MISSES_KEY)
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        counters = cache.get_many([cls.HITS_KEY, cls.MISSES_KEY])
+        return {'hits': counters.get(cls.HITS_KEY, 0), 'misses': counters.get(cls.MISSES_KEY, 0)}
+
+    @classmethod
+    def purge_products(cls, product_ids: Iterable[int]) -> None:
+        slugs = Product.objects.filter(pk__in=set(product_ids)).values_list('slug', flat=True)
+        cls.purge_slugs(slugs)
+
+    @classmethod
+    def purge_slugs(cls, slugs: Iterable[str]) -> None:
+        cache.delete_many([cls.detail_key(slug) for slug in slugs])
+        # 홈 목록은 커서마다 키가 다르므로 세대를 올려 한 번에 무효화한다
+        cls._increment(cls.HOME_GENERATION_KEY)
+
+
+def _cached_response(
+    key_func: Callable[..., str], request: HttpRequest, *args: Any, **kwargs: Any
+) -> tuple[str, Optional[HttpResponseBase]]:
+    key = key_func(request, *args, **kwargs)
+    response: Optional[HttpResponseBase] = cache.get(key)
+    if response is not None:
+        StorefrontPageCache.record_hit()
+    else:
+        StorefrontPageCache.record_miss()
+    return key, response
+
+
+def _store_response(key: str, response: HttpResponseBase) -> None:
+    # 로그인 사용자 응답과 섞이지 않도록 하위 캐시에도 쿠키 기준으로 구분하게 한다
+    patch_vary_headers(response, ('Cookie',))
+    if StorefrontPageCache.is_cacheable_response(response):
+        cache.set(key, response, settings.STOREFRONT_PAGE_CACHE_TIMEOUT)
+
+
+def storefront_page_cache(key_func: Callable[..., str]) -> Callable[[ViewFunc], ViewFunc]:
+    def decorator(view: ViewFunc) -> ViewFunc:
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def async_wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+                response: Optional[HttpResponseBase]
+                if not StorefrontPageCache.is_cacheable_request(request):
+                    response = await view(request, *args, **kwargs)
+                    return response
+
+                # 캐시 백엔드 호출은 블로킹 I/O 라 이벤트 루프 밖에서 한다
+                key, response = await sync_to_async(_cached_response)(key_func, request, *args, **kwargs)
+                if response is not None:
+                    return response
+                # 공유 캐시에 저장될 응답은 복제 지연된 데이터가 캐시 유지 시간 동안 남지 않도록 primary 에서 읽는다
+                with primary_reads():
+                    response = await view(request, *args, **kwargs)
+                await sync_to_async(_store_response)(key, response)
+                return response
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+            response: Optional[HttpResponseBase]
+            if not StorefrontPageCache.is_cacheable_request(request):
+                response = view(request, *args, **kwargs)
+                return response
+
+            key, response = _cached_response(key_func, request, *args, **kwargs)
+            if response is not None:
+                return response
+            # 공유 캐시에 저장될 응답은 복제 지연된 데이터가 캐시 유지 시간 동안 남지 않도록 primary 에서 읽는다
+            with primary_reads():
+                response = view(request, *args, **kwargs)
+            _store_response(key, response)
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,76 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Generic, Optional, Tuple, TypeVar
+
+from django.db.models import Model, Q, QuerySet
+
+ModelT = TypeVar('ModelT', bound=Model)
+
+MAX_PK = 2 ** 63 - 1
+
+
+class KeysetPage(Generic[ModelT]):
+    def __init__(self, items: list[ModelT], next_cursor: Optional[str]) -> None:
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+class KeysetPaginator(Generic[ModelT]):
+    """(created_at, id) 내림차순 기준 커서 페이지네이션
+
+    OFFSET 대신 마지막으로 본 행의 키 이후만 조회하므로 몇 번째 페이지든 비용이 같다.
+    """
+
+    def __init__(self, queryset: QuerySet[ModelT], per_page: int) -> None:
+        self.queryset = queryset.order_by('-created_at', '-id')
+        self.per_page = per_page
+
+    @staticmethod
+    def encode_cursor(created_at: datetime, pk: int) -> str:
+        raw = json.dumps([created_at.isoformat(), pk]).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Optional[Tuple[datetime, int]]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            created_at, pk = json.loads(raw)
+            position = datetime.fromisoformat(created_at), int(pk)
+        except (binascii.Error, ValueError, TypeError, OverflowError):
+            return None
+        # 조작된 커서: 시간대 없는 시각이나 bigint 범위를 벗어난 id 는 쿼리 오류가 되므로 받지 않는다
+        if position[0].tzinfo is None or not 0 < position[1] <= MAX_PK:
+            return None
+        return position
+
+    def _window(self, cursor: Optional[str]) -> QuerySet[ModelT]:
+        queryset = self.queryset
+        position = self.decode_cursor(cursor) if cursor else None
+        if position:
+            created_at, pk = position
+            # created_at <= ? 범위 조건을 앞에 두어 (created_at, id) 인덱스를 그대로 탈 수 있게 한다
+            queryset = queryset.filter(
+                Q(created_at__lte=created_at) & (Q(created_at__lt=created_at) | Q(id__lt=pk))
+            )
+        # 다음 페이지가 있는지 알기 위해 한 건 더 가져온다
+        return queryset[:self.per_page + 1]
+
+    def page(self, cursor: Optional[str] = None) -> KeysetPage[ModelT]:
+        return self._to_page(list(self._window(cursor)))
+
+    async def apage(self, cursor: Optional[str] = None) -> KeysetPage[ModelT]:
+        return self._to_page([item async for item in self._window(cursor)])
+
+    def _to_page(self, items: list[ModelT]) -> KeysetPage[ModelT]:
+        if len(items) <= self.per_page:
+            return KeysetPage(items, None)
+
+        items = items[:self.per_page]
+        last = items[-1]
+        return KeysetPage(items, self.encode_cursor(getattr(last, 'created_at'), last.pk))
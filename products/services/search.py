@@ -0,0 +1,66 @@
+from django.db import connections
+from django.db.models import BooleanField, Case, FloatField, Q, QuerySet, Value, When
+from django.db.models.expressions import RawSQL
+
+from products.models import Product
+from products.services.storefront import StorefrontService
+
+# search_vector 컬럼은 0009 마이그레이션의 트리거가 관리하므로 모델 필드로 두지 않는다
+FULL_TEXT_QUERY = "websearch_to_tsquery('simple', %s)"
+MATCH_SQL = (
+    f"products.search_vector @@ {FULL_TEXT_QUERY}"
+    " OR products.name ILIKE %s OR products.description ILIKE %s"
+    " OR %s <%% products.name"
+)
+RANK_SQL = (
+    f"ts_rank_cd(products.search_vector, {FULL_TEXT_QUERY})"
+    " + word_similarity(%s, products.name)"
+)
+
+
+class ProductSearchService:
+    PAGE_SIZE = 24
+    MAX_QUERY_LENGTH = 100
+
+    @classmethod
+    def normalize(cls, query: str) -> str:
+        return ' '.join(query.split())[:cls.MAX_QUERY_LENGTH]
+
+    @staticmethod
+    def _like_pattern(query: str) -> str:
+        escaped = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        return f'%{escaped}%'
+
+    @classmethod
+    def search(cls, query: str) -> QuerySet[Product]:
+        query = cls.normalize(query)
+        products = StorefrontService.live_products()
+        if not query:
+            return products.none()
+
+        if connections[products.db].vendor == 'postgresql':
+            return cls._full_text_search(products, query)
+        return cls._fallback_search(products, query)
+
+    @classmethod
+    def _full_text_search(cls, products: QuerySet[Product], query: str) -> QuerySet[Product]:
+        # 단어 단위는 tsvector GIN 인덱스로, 한글 부분 일치와 오타는 pg_trgm GIN 인덱스로 찾는다
+        pattern = cls._like_pattern(query)
+        return products.filter(
+            RawSQL(MATCH_SQL, (query, pattern, pattern, query), output_field=BooleanField())
+        ).annotate(
+            rank=RawSQL(RANK_SQL, (query, query), output_field=FloatField()),
+        ).order_by('-rank', '-created_at', '-id')
+
+    @staticmethod
+    def _fallback_search(products: QuerySet[Product], query: str) -> QuerySet[Product]:
+        # SQLite 등 Postgres 가 아닌 환경에서는 이름 일치를 설명 일치보다 앞에 둔다
+        return products.filter(
+            Q(name__icontains=query) | Q(description__icontains=query)
+        ).annotate(
+            rank=Case(
+                When(name__icontains=query, then=Value(1.0)),
+                default=Value(0.5),
+                output_field=FloatField(),
+            ),
+        ).order_by('-rank', '-created_at', '-id')
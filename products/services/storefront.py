@@ -0,0 +1,45 @@
+from typing import Optional
+
+from django.db.models import Prefetch, QuerySet
+
+from categories.services.tree import CategoryTree
+from products.models import Product, ProductGallery
+from products.services.pagination import KeysetPage, KeysetPaginator
+
+
+class StorefrontService:
+    PAGE_SIZE = 24
+
+    @staticmethod
+    def with_primary_image(queryset: QuerySet[Product]) -> QuerySet[Product]:
+        # 대표 이미지를 JOIN 으로 함께 가져와 카드마다 추가 쿼리가 나가지 않도록 한다
+        return queryset.select_related('primary_image')
+
+    @classmethod
+    def with_gallery(cls, queryset: QuerySet[Product]) -> QuerySet[Product]:
+        # 상세 페이지의 갤러리 전체를 position 순서로 한 번에 가져온다
+        links = Prefetch(
+            'productgallery_set',
+            queryset=ProductGallery.objects.select_related('productimage'),
+            to_attr='gallery_links',
+        )
+        return cls.with_primary_image(queryset).prefetch_related(links)
+
+    @classmethod
+    def live_products(cls) -> QuerySet[Product]:
+        products = Product.objects.filter(is_live=True, is_sold=False).order_by('-created_at', '-id')
+        return cls.with_primary_image(products)
+
+    @classmethod
+    def live_products_page(cls, cursor: Optional[str] = None) -> KeysetPage[Product]:
+        return KeysetPaginator(cls.live_products(), cls.PAGE_SIZE).page(cursor)
+
+    @classmethod
+    async def alive_products_page(cls, cursor: Optional[str] = None) -> KeysetPage[Product]:
+        return await KeysetPaginator(cls.live_products(), cls.PAGE_SIZE).apage(cursor)
+
+    @classmethod
+    def category_products_page(cls, category_id: int, cursor: Optional[str] = None) -> KeysetPage[Product]:
+        # 하위 트리 id 는 프로세스 내 트리에서 가져오므로 상품 조회 한 번으로 끝난다
+        products = cls.live_products().filter(category_id__in=CategoryTree.subtree_ids(category_id))
+        return KeysetPaginator(products, cls.PAGE_SIZE).page(cursor)
@@ -0,0 +1,92 @@
+from typing import Any, Iterable
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from products.models import Product, ProductGallery, ProductImage
+from products.services.card_cache import ProductCardCache
+from products.services.gallery import ProductGalleryService
+from products.services.page_cache import StorefrontPageCache
+
+
+def _invalidate_products(product_ids: Iterable[int]) -> None:
+    product_ids = set(product_ids)
+    if not product_ids:
+        return
+    StorefrontPageCache.purge_products(product_ids)
+    ProductCardCache.touch(product_ids)
+
+
+@receiver(pre_save, sender=Product)
+def drop_stale_product_card(sender: type[Product], instance: Product, **kwargs: Any) -> None:
+    # 저장 직전의 updated_at 이 아직 이전 값이므로 이전 카드 조각을 바로 지울 수 있다
+    if instance.pk and instance.updated_at:
+        ProductCardCache.delete(instance.pk, instance.updated_at)
+
+
+@receiver(post_save, sender=Product)
+def purge_saved_product_pages(sender: type[Product], instance: Product, **kwargs: Any) -> None:
+    StorefrontPageCache.purge_slugs([instance.slug])
+
+
+@receiver(post_delete, sender=Product)
+def drop_deleted_product_caches(sender: type[Product], instance: Product, **kwargs: Any) -> None:
+    if instance.updated_at:
+        ProductCardCache.delete(instance.pk, instance.updated_at)
+    StorefrontPageCache.purge_slugs([instance.slug])
+
+
+@receiver(post_save, sender=ProductImage)
+def invalidate_products_of_image(sender: type[ProductImage], instance: ProductImage, created: bool, **kwargs: Any) -> None:
+    if not created:
+        _invalidate_products(
+            ProductGallery.objects.filter(productimage=instance).values_list('product_id', flat=True)
+        )
+
+
+@receiver(post_save, sender=ProductGallery)
+@receiver(post_delete, sender=ProductGallery)
+def invalidate_product_of_gallery(sender: type[ProductGallery], instance: ProductGallery, **kwargs: Any) -> None:
+    _invalidate_products([instance.product_id])
+
+
+@receiver(post_save, sender=ProductGallery)
+@receiver(post_delete, sender=ProductGallery)
+def refresh_ref_count_of_gallery(sender: type[ProductGallery], instance: ProductGallery, **kwargs: Any) -> None:
+    # 상품 삭제로 연결이 함께 지워질 때도 이미지의 ref_count 를 맞춘다
+    ProductGalleryService.refresh_ref_counts([instance.productimage_id])
+
+
+@receiver(m2m_changed, sender=Product.image.through)
+def refresh_ref_counts_of_m2m(
+    sender: type[ProductGallery],
+    instance: Product | ProductImage,
+    action: str,
+    reverse: bool,
+    pk_set: set[int] | None,
+    **kwargs: Any,
+) -> None:
+    # add 는 연결 행을 묶음 INSERT 로 만들어 post_save 가 오지 않는다 (remove/clear 는 post_delete 가 온다)
+    if action == 'post_add':
+        ProductGalleryService.refresh_ref_counts([instance.pk] if reverse else pk_set or [])
+
+
+@receiver(m2m_changed, sender=Product.image.through)
+def invalidate_products_of_m2m(
+    sender: type[ProductGallery],
+    instance: Product | ProductImage,
+    action: str,
+    reverse: bool,
+    pk_set: set[int] | None,
+    **kwargs: Any,
+) -> None:
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+    if not reverse:
+        _invalidate_products([instance.pk])
+    elif action == 'pre_clear':
+        _invalidate_products(
+            ProductGallery.objects.filter(productimage_id=instance.pk).values_list('product_id', flat=True)
+        )
+    else:
+        _invalidate_products(pk_set or [])
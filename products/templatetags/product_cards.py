@@ -0,0 +1,13 @@
+from typing import Iterable
+
+from django import template
+from django.utils.safestring import SafeString, mark_safe
+
+from products.models import Product
+from products.services.card_cache import ProductCardCache
+
+register = template.Library()
+
+@register.simple_tag
+def product_cards(products: Iterable[Product], variant: str) -> SafeString:
+    return mark_safe(ProductCardCache.render_many(products, variant))
@@ -0,0 +1,68 @@
+from typing import Any
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from products.models import Product
+from products.services.page_cache import StorefrontPageCache
+from users.models import User
+
+
+@pytest.mark.django_db
+class TestAsyncStorefrontViews:
+    def setup_method(self) -> None:
+        cache.clear()
+        self.client = AsyncClient()
+        self.user = User.objects.create_user(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="create_test_user",
+            personal_info_consent=True,
+            terms_of_use=True
+        )
+        self.product = Product.objects.create(
+            user=self.user, name="async_product", description="설명", is_live=True, is_sold=False,
+            stock=10, price=10000,
+        )
+
+    def get(self, path: str, data: Any = None) -> Any:
+        return async_to_sync(self.client.get)(path, data)
+
+    def test_home_over_asgi(self) -> None:
+        response = self.get(reverse('home'))
+        assert response.status_code == 200
+        assert [product.pk for product in response.context['products']] == [self.product.pk]
+
+    def test_product_detail_over_asgi(self) -> None:
+        response = self.get(reverse('products-detail', kwargs={'slug': self.product.slug}))
+        assert response.status_code == 200
+        assert response.context['products'] == self.product
+
+    def test_product_detail_not_found_over_asgi(self) -> None:
+        response = self.get(reverse('products-detail', kwargs={'slug': 'missing'}))
+        assert response.status_code == 404
+
+    def test_check_duplicate_over_asgi(self) -> None:
+        response = self.get('/users/check-duplicate/', {'username': 'create_test_user', 'email': 'new@example.com'})
+        assert response.status_code == 200
+        data = response.json()
+        assert data['username']['available'] is False
+        assert data['email']['available'] is True
+
+    def test_page_cache_serves_async_view(self, settings: Any) -> None:
+        settings.STOREFRONT_PAGE_CACHE_ENABLED = True
+        url = reverse('products-detail', kwargs={'slug': self.product.slug})
+        first = self.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            second = self.get(url)
+
+        assert len(queries) == 0
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert StorefrontPageCache.stats() == {'hits': 1, 'misses': 1}
@@ -0,0 +1,269 @@
+import csv
+import io
+import json
+import time
+from decimal import Decimal
+from io import StringIO
+from pathlib import Path
+from typing import Any
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from categories.models import Category
+from config.db_router import PIN_COOKIE_NAME
+from products.models import Product
+from products.services.bulk_import import ProductImportService, export_rows, read_rows
+from users.models import User
+
+CSV_HEADER = "name,description,price,sale_price,stock,is_live,is_sold,category_id,slug\n"
+
+
+@pytest.mark.django_db
+class TestProductImportService:
+    def setup_method(self) -> None:
+        self.admin_user = User.objects.create(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="admin_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01012345678"
+        )
+        self.category = Category.objects.create(name="의류")
+
+    def _run(self, text: str, fmt: str = 'csv', **kwargs: int) -> ProductImportService:
+        service = ProductImportService(self.admin_user, use_copy=False, **kwargs)
+        service.run(read_rows(io.StringIO(text), fmt))
+        return service
+
+    def test_import_csv_creates_products_in_batches(self) -> None:
+        rows = "".join(f"상품 {i},설명,{1000 + i},,5,true,false,{self.category.id},\n" for i in range(25))
+        progress = []
+        service = ProductImportService(self.admin_user, use_copy=False, batch_size=10)
+        for result in service.iter_batches(read_rows(io.StringIO(CSV_HEADER + rows), 'csv')):
+            progress.append(result.created)
+
+        assert progress == [10, 20, 25]
+        assert Product.objects.count() == 25
+        product = Product.objects.get(name="상품 3")
+        assert product.price == Decimal("1003")
+        assert product.sale_price is None
+        assert product.is_live is True
+        assert product.category_id == self.category.id
+        assert product.slug == "상품-3"
+
+    def test_import_jsonl(self) -> None:
+        lines = [
+            {"name": "JSON 상품", "description": "설명", "price": 5000, "sale_price": 4000, "stock": 3,
+             "is_live": True, "is_sold": False},
+            {"name": "두번째", "description": "설명", "price": "1200.50", "stock": 0},
+        ]
+        service = self._run("\n".join(json.dumps(line, ensure_ascii=False) for line in lines) + "\n", 'jsonl')
+
+        assert service.result.created == 2
+        assert Product.objects.get(name="JSON 상품").sale_price == Decimal("4000")
+        assert Product.objects.get(name="두번째").is_live is False
+
+    def test_invalid_rows_are_reported_with_line_numbers(self) -> None:
+        rows = (
+            "정상,설명,1000,,1,1,0,,\n"
+            "음수 가격,설명,-1,,1,1,0,,\n"
+            "할인 오류,설명,1000,2000,1,1,0,,\n"
+            "재고 오류,설명,1000,,-3,1,0,,\n"
+            "카테고리 없음,설명,1000,,1,1,0,9999,\n"
+            ",설명,1000,,1,1,0,,\n"
+        )
+        result = self._run(CSV_HEADER + rows).result
+
+        assert result.processed == 6
+        assert result.created == 1
+        assert result.failed == 5
+        messages = {error.line: error.message for error in result.errors}
+        assert "가격은 0보다 커야 합니다." in messages[3]
+        assert "할인가격은 정가보다 낮아야 합니다." in messages[4]
+        assert "재고는 0 이상이어야 합니다." in messages[5]
+        assert "category_id" in messages[6]
+        assert messages[7].startswith("name:")
+
+    def test_invalid_json_line_is_skipped(self) -> None:
+        text = '{"name": "정상", "description": "d", "price": 1000, "stock": 1}\n{broken\n'
+        result = self._run(text, 'jsonl').result
+
+        assert result.created == 1
+        assert result.errors[0].line == 2
+
+    def test_slug_collisions_are_numbered_across_batches(self) -> None:
+        Product.objects.create(user=self.admin_user, name="같은 이름", description="d", price=1000, stock=1)
+        rows = "같은 이름,설명,1000,,1,1,0,,\n" * 3
+        self._run(CSV_HEADER + rows, batch_size=2)
+
+        slugs = set(Product.objects.filter(name="같은 이름").values_list('slug', flat=True))
+        assert slugs == {"같은-이름", "같은-이름-2", "같은-이름-3", "같은-이름-4"}
+
+    def test_explicit_slug_that_is_taken_is_rejected(self) -> None:
+        Product.objects.create(user=self.admin_user, name="기존", description="d", price=1000, stock=1, slug="fixed")
+        result = self._run(CSV_HEADER + "새 상품,설명,1000,,1,1,0,,fixed\n새 상품2,설명,1000,,1,1,0,,own\n").result
+
+        assert result.created == 1
+        assert "fixed" in result.errors[0].message
+        assert Product.objects.filter(slug="own").exists()
+
+    def test_rejected_batch_is_reported_and_import_continues(self, monkeypatch: Any) -> None:
+        copied: list[list[str]] = []
+
+        def fake_copy(service: ProductImportService, products: list[Product]) -> None:
+            if not copied:
+                copied.append([])
+                raise IntegrityError("duplicate key value")
+            copied.append([product.name for product in products])
+
+        monkeypatch.setattr(ProductImportService, '_copy', fake_copy)
+        rows = "".join(f"상품 {i},설명,1000,,1,1,0,,\n" for i in range(5))
+        service = ProductImportService(self.admin_user, use_copy=True, batch_size=2)
+        service.run(read_rows(io.StringIO(CSV_HEADER + rows), 'csv'))
+
+        result = service.result
+        assert copied[1:] == [["상품 2", "상품 3"], ["상품 4"]]
+        assert (result.processed, result.created, result.failed) == (5, 3, 2)
+        assert result.batch_errors[0].as_dict() == {
+            'first_line': 2, 'last_line': 3, 'rows': 2, 'message': "duplicate key value",
+        }
+
+    def test_copy_buffer_quotes_end_of_data_marker(self) -> None:
+        product = Product(user=self.admin_user, name="이름", slug="이름", description="\\.", price=1000, stock=1)
+
+        row = next(csv.reader(ProductImportService.copy_buffer([product])))
+        line = ProductImportService.copy_buffer([product]).getvalue()
+
+        assert row[4] == "\\."
+        assert '"\\."' in line
+        assert not any(part == "\\." for part in line.splitlines())
+
+    def test_export_round_trip(self) -> None:
+        self._run(CSV_HEADER + f"왕복 상품,\"쉼표, 포함\",1500,1000,2,1,0,{self.category.id},\n")
+        exported = "".join(export_rows('csv'))
+        Product.objects.all().delete()
+
+        result = self._run(exported).result
+
+        assert result.created == 1
+        product = Product.objects.get()
+        assert product.description == "쉼표, 포함"
+        assert product.sale_price == Decimal("1000")
+        assert product.slug == "왕복-상품"
+
+        jsonl = "".join(export_rows('jsonl'))
+        assert json.loads(jsonl.splitlines()[0])["name"] == "왕복 상품"
+
+
+@pytest.mark.django_db
+class TestProductBulkCommands:
+    def setup_method(self) -> None:
+        self.admin_user = User.objects.create(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="admin_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01012345678"
+        )
+
+    def test_import_and_export_commands(self, tmp_path: Path) -> None:
+        source = tmp_path / "products.csv"
+        source.write_text(CSV_HEADER + "명령 상품,설명,1000,,1,1,0,,\n잘못된 상품,설명,0,,1,1,0,,\n", encoding="utf-8")
+        out, err = StringIO(), StringIO()
+
+        call_command('import_products', str(source), owner=self.admin_user.email, stdout=out, stderr=err)
+
+        assert "처리 2행, 등록 1개, 실패 1행" in out.getvalue()
+        assert "3행:" in err.getvalue()
+
+        target = tmp_path / "export.jsonl"
+        call_command('export_products', str(target), format='jsonl', stdout=StringIO())
+        assert json.loads(target.read_text(encoding="utf-8"))["name"] == "명령 상품"
+
+
+@pytest.mark.django_db
+class TestProductBulkViews:
+    def setup_method(self) -> None:
+        self.client = Client()
+        self.admin_user = User.objects.create(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="admin_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01012345678"
+        )
+        self.customer_user = User.objects.create(
+            role="consumer",
+            email="customer@customer.com",
+            password="create_test_customer",
+            username="customer_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01087654321"
+        )
+
+    def test_import_streams_progress(self) -> None:
+        self.client.force_login(self.admin_user)
+        upload = SimpleUploadedFile(
+            "products.csv", (CSV_HEADER + "업로드 상품,설명,1000,,1,1,0,,\n").encode("utf-8-sig"), content_type="text/csv"
+        )
+        response = self.client.post(reverse('product-import'), {'file': upload})
+
+        assert response.status_code == 200
+        events = [json.loads(line) for line in response.getvalue().decode().splitlines()]
+        assert events[-1]["done"] is True
+        assert events[-1]["created"] == 1
+        assert Product.objects.filter(name="업로드 상품").exists()
+
+    def test_rejected_batch_is_streamed(self, monkeypatch: Any) -> None:
+        def reject(*args: Any, **kwargs: Any) -> None:
+            raise IntegrityError("rejected")
+
+        monkeypatch.setattr(Product.objects, 'bulk_create', reject)
+        self.client.force_login(self.admin_user)
+        upload = SimpleUploadedFile("products.csv", (CSV_HEADER + "상품,설명,1000,,1,1,0,,\n").encode(), content_type="text/csv")
+        response = self.client.post(reverse('product-import'), {'file': upload})
+
+        events = [json.loads(line) for line in response.getvalue().decode().splitlines()]
+        assert events[0] == {'batch_error': {'first_line': 2, 'last_line': 2, 'rows': 1, 'message': "rejected"}}
+        assert events[-1]["done"] is True
+        assert (events[-1]["created"], events[-1]["failed"]) == (0, 1)
+        assert not Product.objects.exists()
+
+    @override_settings(DATABASE_REPLICAS=['replica1'], DATABASE_REPLICA_PIN_SECONDS=30)
+    def test_import_pins_browser_to_primary(self) -> None:
+        self.client.force_login(self.admin_user)
+        upload = SimpleUploadedFile("products.csv", (CSV_HEADER + "상품,설명,1000,,1,1,0,,\n").encode(), content_type="text/csv")
+        response = self.client.post(reverse('product-import'), {'file': upload})
+
+        assert float(response.cookies[PIN_COOKIE_NAME].value) > time.time()
+
+    def test_import_without_file(self) -> None:
+        self.client.force_login(self.admin_user)
+        response = self.client.post(reverse('product-import'))
+        assert response.status_code == 400
+
+    def test_export_download(self) -> None:
+        Product.objects.create(user=self.admin_user, name="내보낼 상품", description="d", price=1000, stock=1)
+        self.client.force_login(self.admin_user)
+        response = self.client.get(reverse('product-export'), {'format': 'csv'})
+
+        assert response.status_code == 200
+        assert 'attachment' in response['Content-Disposition']
+        assert "내보낼 상품" in response.getvalue().decode()
+
+    def test_bulk_endpoints_require_admin(self) -> None:
+        self.client.force_login(self.customer_user)
+        assert self.client.get(reverse('product-import')).status_code == 403
+        assert self.client.get(reverse('product-export')).status_code == 403
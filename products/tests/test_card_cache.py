@@ -0,0 +1,85 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client
+from django.urls import reverse
+
+from products.models import Product, ProductImage
+from products.services.card_cache import ProductCardCache
+from products.services.gallery import ProductGalleryService
+from users.models import User
+
+
+@pytest.mark.django_db
+class TestProductCardCache:
+    def setup_method(self) -> None:
+        cache.clear()
+        self.client = Client()
+        self.admin_user = User.objects.create(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="admin_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01012345678"
+        )
+        self.product = Product.objects.create(
+            user=self.admin_user,
+            name="캐시 상품",
+            description="상품 설명",
+            price=10000,
+            stock=10,
+            is_live=True,
+            is_sold=False
+        )
+
+    def _home(self) -> str:
+        response = self.client.get(reverse('home'))
+        assert response.status_code == 200
+        return response.content.decode()
+
+    def test_cards_are_rendered_once(self) -> None:
+        self._home()
+
+        with patch('products.services.card_cache.render_to_string') as render:
+            html = self._home()
+
+        render.assert_not_called()
+        assert "캐시 상품" in html
+
+    def test_product_save_invalidates_card(self) -> None:
+        self._home()
+        old_key = ProductCardCache.make_key('storefront', self.product.pk, self.product.updated_at)
+        assert cache.get(old_key) is not None
+
+        self.product.name = "이름 변경"
+        self.product.save()
+
+        assert cache.get(old_key) is None
+        assert "이름 변경" in self._home()
+
+    def test_gallery_change_invalidates_card(self) -> None:
+        assert "picsum.photos" in self._home()
+
+        image, = ProductGalleryService.attach_images(self.product, [
+            SimpleUploadedFile("card.jpg", b"file_content", content_type="image/jpeg")
+        ])
+        assert image.image.url in self._home()
+
+        ProductGalleryService.delete_image(image)
+        assert image.image.url not in self._home()
+
+    def test_m2m_add_touches_product(self) -> None:
+        self._home()
+        before = Product.objects.get(pk=self.product.pk).updated_at
+
+        image = ProductImage.objects.create(
+            image=SimpleUploadedFile("m2m.jpg", b"file_content", content_type="image/jpeg")
+        )
+        self.product.image.add(image)
+
+        assert Product.objects.get(pk=self.product.pk).updated_at > before
+        assert cache.get(ProductCardCache.make_key('storefront', self.product.pk, before)) is None
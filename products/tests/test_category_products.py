@@ -0,0 +1,100 @@
+from typing import Any
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from categories.models import Category
+from products.models import Product
+from products.services.storefront import StorefrontService
+from users.models import User
+
+
+@pytest.mark.django_db
+class TestCategoryProducts:
+    def setup_method(self) -> None:
+        cache.clear()
+        self.client = Client()
+        self.admin_user = User.objects.create(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="admin_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01012345678"
+        )
+        self.outer = Category.objects.create(name="아우터")
+        self.jacket = Category.objects.create(name="자켓", parent=self.outer)
+        self.bottom = Category.objects.create(name="하의")
+
+    def _create_product(self, name: str, category: Category, **kwargs: bool) -> Product:
+        fields = {'is_live': True, 'is_sold': False, **kwargs}
+        return Product.objects.create(
+            user=self.admin_user,
+            category=category,
+            name=name,
+            description="상품 설명",
+            price=10000,
+            stock=10,
+            **fields
+        )
+
+    def test_page_includes_whole_subtree(self) -> None:
+        coat = self._create_product("코트", self.outer)
+        jacket = self._create_product("자켓", self.jacket)
+        self._create_product("바지", self.bottom)
+        self._create_product("숨김 코트", self.outer, is_live=False)
+        self._create_product("품절 자켓", self.jacket, is_sold=True)
+
+        page = StorefrontService.category_products_page(self.outer.pk)
+
+        assert page.items == [jacket, coat]
+
+    def test_subtree_page_takes_one_query(self, settings: Any) -> None:
+        settings.CACHE_IS_SHARED = True
+        self._create_product("자켓", self.jacket)
+        StorefrontService.category_products_page(self.outer.pk)
+
+        with CaptureQueriesContext(connection) as queries:
+            StorefrontService.category_products_page(self.outer.pk)
+
+        assert len(queries) == 1
+
+    def test_subtree_page_adds_version_check_without_shared_cache(self) -> None:
+        self._create_product("자켓", self.jacket)
+        StorefrontService.category_products_page(self.outer.pk)
+        # 다른 워커에서 추가된 하위 카테고리
+        Category.objects.bulk_create([Category(name="코트", parent=self.outer, path=f"{self.outer.path}999/", depth=1)])
+
+        with CaptureQueriesContext(connection) as queries:
+            StorefrontService.category_products_page(self.outer.pk)
+
+        # 트리 버전 집계 + 트리 다시 읽기 + 상품 조회
+        assert len(queries) == 3
+
+    def test_category_view_renders_products(self) -> None:
+        self._create_product("오버핏 자켓", self.jacket)
+
+        response = self.client.get(reverse('products-category', kwargs={'category_id': self.outer.pk}))
+
+        assert response.status_code == 200
+        content = response.content.decode()
+        assert "오버핏 자켓" in content
+        assert reverse('products-category', kwargs={'category_id': self.jacket.pk}) in content
+
+    def test_unknown_category_returns_404(self) -> None:
+        response = self.client.get(reverse('products-category', kwargs={'category_id': 999}))
+
+        assert response.status_code == 404
+
+    def test_deleting_category_keeps_products(self) -> None:
+        product = self._create_product("자켓", self.jacket)
+
+        self.jacket.delete()
+
+        product.refresh_from_db()
+        assert product.category is None
@@ -0,0 +1,65 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+
+from config.database import connection_stats
+from users.models import User
+
+
+@pytest.mark.django_db
+class TestDatabaseConnectionStats:
+    def setup_method(self) -> None:
+        self.client = Client()
+        self.admin_user = User.objects.create(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="admin_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01012345678"
+        )
+        self.customer_user = User.objects.create(
+            role="consumer",
+            email="customer@customer.com",
+            password="create_test_customer",
+            username="customer_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01087654321"
+        )
+
+    def test_connection_stats_reports_reuse_settings(self) -> None:
+        stats = connection_stats()['default']
+
+        assert set(stats) >= {'vendor', 'conn_max_age', 'health_checks', 'pooled', 'connected'}
+        assert stats['pooled'] is False
+        assert 'pool' not in stats
+
+    def test_stats_endpoint_requires_admin(self) -> None:
+        self.client.force_login(self.customer_user)
+        assert self.client.get(reverse('db-stats')).status_code == 403
+
+        self.client.force_login(self.admin_user)
+        response = self.client.get(reverse('db-stats'))
+        assert response.status_code == 200
+        assert 'default' in response.json()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_bench_db_connections_restores_settings() -> None:
+    from django.db import connection
+
+    original = (connection.settings_dict['CONN_MAX_AGE'], dict(connection.settings_dict['OPTIONS']))
+    out = StringIO()
+
+    call_command('bench_db_connections', requests=3, warmup=1, stdout=out)
+
+    output = out.getvalue()
+    assert output.count('상태 [200]') >= 2
+    assert 'direct' in output and 'persistent' in output
+    assert 'pool' in output  # sqlite 에서는 건너뛰었다는 안내만 나온다
+    assert (connection.settings_dict['CONN_MAX_AGE'], connection.settings_dict['OPTIONS']) == original
@@ -0,0 +1,157 @@
+import time
+from typing import Any, Optional
+
+import pytest
+from django.contrib.sessions.models import Session
+from django.http import HttpRequest, HttpResponse
+from django.test import Client, RequestFactory, override_settings
+from django.urls import reverse
+
+from config.db_router import (
+    PIN_COOKIE_NAME,
+    ReplicaPinningMiddleware,
+    ReplicaRouter,
+    RoutingState,
+    _state,
+    primary_reads,
+    replica_reads,
+)
+from products.models import Product
+from users.models import User
+
+
+class TestReplicaRouter:
+    @pytest.fixture(autouse=True)
+    def replicas(self, settings: Any) -> None:
+        settings.DATABASE_REPLICAS = ['replica1']
+
+    def setup_method(self) -> None:
+        self.router = ReplicaRouter()
+
+    def _read_db(self, state: Optional[RoutingState], model: type = Product) -> Optional[str]:
+        token = _state.set(state)
+        try:
+            return self.router.db_for_read(model)
+        finally:
+            _state.reset(token)
+
+    def test_storefront_reads_go_to_replica(self) -> None:
+        state = RoutingState()
+        state.replica_reads = True
+        assert self._read_db(state) == 'replica1'
+
+    def test_reads_outside_storefront_views_stay_on_primary(self) -> None:
+        assert self._read_db(None) is None
+        assert self._read_db(RoutingState()) is None
+
+    def test_pinned_client_and_other_apps_read_primary(self) -> None:
+        pinned = RoutingState(pinned=True)
+        pinned.replica_reads = True
+        assert self._read_db(pinned) is None
+
+        state = RoutingState()
+        state.replica_reads = True
+        assert self._read_db(state, Session) is None
+        assert self._read_db(state, User) is None
+
+    def test_primary_reads_overrides_replica_view(self) -> None:
+        state = RoutingState()
+        token = _state.set(state)
+        try:
+            seen = []
+
+            @replica_reads
+            def view() -> None:
+                seen.append(self.router.db_for_read(Product))
+                with primary_reads():
+                    seen.append(self.router.db_for_read(Product))
+                seen.append(self.router.db_for_read(Product))
+
+            view()
+        finally:
+            _state.reset(token)
+        assert seen == ['replica1', None, 'replica1']
+        assert state.replica_reads is False
+
+    def test_writes_go_to_primary_and_mark_request(self) -> None:
+        state = RoutingState()
+        token = _state.set(state)
+        try:
+            assert self.router.db_for_write(User) == 'default'
+            assert state.wrote is False
+            assert self.router.db_for_write(Product) == 'default'
+            assert state.wrote is True
+        finally:
+            _state.reset(token)
+
+    def test_replicas_are_not_migrated(self) -> None:
+        assert self.router.allow_migrate('default', 'products') is True
+        assert self.router.allow_migrate('replica1', 'products') is False
+
+
+@pytest.mark.django_db
+class TestReplicaPinning:
+    def setup_method(self) -> None:
+        self.client = Client()
+        self.admin_user = User.objects.create(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="admin_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01012345678"
+        )
+
+    def test_reads_inside_transaction_stay_on_primary(self) -> None:
+        state = RoutingState()
+        state.replica_reads = True
+        token = _state.set(state)
+        try:
+            # 테스트는 트랜잭션 안에서 돌기 때문에 방금 쓴 데이터를 그대로 읽어야 한다
+            with override_settings(DATABASE_REPLICAS=['replica1']):
+                assert ReplicaRouter().db_for_read(Product) is None
+        finally:
+            _state.reset(token)
+
+    @override_settings(DATABASE_REPLICAS=['replica1'], DATABASE_REPLICA_PIN_SECONDS=30)
+    def test_product_write_pins_browser_to_primary(self) -> None:
+        self.client.force_login(self.admin_user)
+        form_data = {'name': '새 상품', 'description': '설명', 'price': 1000, 'stock': 1}
+
+        response = self.client.post(reverse('product-create'), form_data)
+
+        assert response.status_code == 302
+        cookie = response.cookies[PIN_COOKIE_NAME]
+        assert cookie['max-age'] == 30
+        assert float(cookie.value) > time.time()
+
+    @override_settings(DATABASE_REPLICAS=['replica1'])
+    def test_pin_cookie_marks_request_pinned(self) -> None:
+        seen = []
+
+        def get_response(request: HttpRequest) -> HttpResponse:
+            state = _state.get()
+            assert state is not None
+            seen.append(state.pinned)
+            return HttpResponse()
+
+        middleware = ReplicaPinningMiddleware(get_response)
+        factory = RequestFactory()
+        middleware(factory.get('/'))
+        factory.cookies[PIN_COOKIE_NAME] = str(time.time() + 10)
+        middleware(factory.get('/'))
+        factory.cookies[PIN_COOKIE_NAME] = str(time.time() - 10)
+        response = middleware(factory.get('/'))
+
+        assert seen == [False, True, False]
+        assert PIN_COOKIE_NAME not in response.cookies
+        assert _state.get() is None
+
+    def test_no_pin_cookie_without_replicas(self) -> None:
+        self.client.force_login(self.admin_user)
+        form_data = {'name': '새 상품', 'description': '설명', 'price': 1000, 'stock': 1}
+
+        response = self.client.post(reverse('product-create'), form_data)
+
+        assert PIN_COOKIE_NAME not in response.cookies
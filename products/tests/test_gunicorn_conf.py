@@ -0,0 +1,85 @@
+import runpy
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+from django.conf import settings
+from django.db import connections
+
+CONF_PATH = str(Path(settings.BASE_DIR) / 'gunicorn.conf.py')
+SETTINGS_PATH = str(Path(settings.BASE_DIR) / 'config' / 'settings.py')
+GUNICORN_ENV = (
+    'GUNICORN_WORKER_CLASS', 'GUNICORN_WORKERS', 'WEB_CONCURRENCY', 'GUNICORN_THREADS', 'GUNICORN_MAX_WORKERS',
+    'GUNICORN_PRELOAD', 'GUNICORN_MAX_REQUESTS', 'GUNICORN_MAX_REQUESTS_JITTER',
+)
+
+
+class TestGunicornConf:
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch: Any) -> None:
+        for name in GUNICORN_ENV:
+            monkeypatch.delenv(name, raising=False)
+
+    def load(self, cores: int = 4) -> dict[str, Any]:
+        with mock.patch('os.process_cpu_count', return_value=cores):
+            return runpy.run_path(CONF_PATH)
+
+    def test_sync_defaults_follow_cpu_count(self) -> None:
+        conf = self.load(cores=4)
+        assert conf['worker_class'] == 'gthread'
+        assert conf['workers'] == 9
+        assert conf['threads'] == 4
+        assert conf['preload_app'] is True
+        assert conf['max_requests_jitter'] == conf['max_requests'] // 10
+        assert conf['keepalive'] > 65
+
+    def test_async_worker_uses_one_worker_per_core(self, monkeypatch: Any) -> None:
+        monkeypatch.setenv('GUNICORN_WORKER_CLASS', 'uvicorn_worker.UvicornWorker')
+        conf = self.load(cores=4)
+        assert conf['workers'] == 4
+        assert conf['threads'] == 1
+
+    def test_worker_count_is_capped_and_overridable(self, monkeypatch: Any) -> None:
+        assert self.load(cores=64)['workers'] == 12
+
+        monkeypatch.setenv('WEB_CONCURRENCY', '5')
+        assert self.load(cores=64)['workers'] == 5
+        monkeypatch.setenv('GUNICORN_WORKERS', '2')
+        monkeypatch.setenv('GUNICORN_THREADS', '8')
+        conf = self.load(cores=64)
+        assert (conf['workers'], conf['threads']) == (2, 8)
+
+    def test_post_fork_closes_inherited_connections(self) -> None:
+        conf = self.load()
+        server = mock.Mock()
+        server.cfg.preload_app = True
+        inherited = mock.Mock()
+
+        with mock.patch.object(connections, 'all', return_value=[inherited]) as all_connections:
+            conf['post_fork'](server, mock.Mock())
+
+        all_connections.assert_called_once_with(initialized_only=True)
+        inherited.close.assert_called_once_with()
+        inherited.close_pool.assert_called_once_with()
+
+
+class TestServingModeSettings:
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch: Any) -> None:
+        for name in ('GUNICORN_WORKER_CLASS', 'DB_CONN_MAX_AGE', 'DB_POOL_ENABLED'):
+            monkeypatch.delenv(name, raising=False)
+
+    def conn_max_age(self) -> int:
+        max_age: int = runpy.run_path(SETTINGS_PATH)['DATABASES']['default']['CONN_MAX_AGE']
+        return max_age
+
+    def test_sync_workers_reuse_connections(self) -> None:
+        assert self.conn_max_age() == 60
+
+    def test_asgi_workers_do_not_reuse_connections_by_default(self, monkeypatch: Any) -> None:
+        monkeypatch.setenv('GUNICORN_WORKER_CLASS', 'uvicorn_worker.UvicornWorker')
+        assert self.conn_max_age() == 0
+
+        monkeypatch.setenv('DB_CONN_MAX_AGE', '30')
+        assert self.conn_max_age() == 30
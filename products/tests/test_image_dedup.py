@@ -0,0 +1,176 @@
+import hashlib
+import io
+from typing import Any
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client
+from django.urls import reverse
+from PIL import Image
+
+from products.models import Product, ProductGallery, ProductImage
+from products.services.gallery import ProductGalleryService
+from users.models import User
+
+
+def jpeg_bytes(color: str) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (4, 4), color).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+@pytest.mark.django_db
+class TestContentAddressedImages:
+    def setup_method(self) -> None:
+        self.client = Client()
+        self.admin_user = User.objects.create(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="admin_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01012345678"
+        )
+        self.first = self._create_product("첫 번째 상품")
+        self.second = self._create_product("두 번째 상품")
+        self.content = jpeg_bytes("red")
+
+    def _create_product(self, name: str) -> Product:
+        return Product.objects.create(
+            user=self.admin_user,
+            name=name,
+            description="상품 설명",
+            price=10000,
+            stock=10,
+            is_live=True,
+            is_sold=False
+        )
+
+    def _upload(self, name: str = "photo.JPG") -> SimpleUploadedFile:
+        return SimpleUploadedFile(name, self.content, content_type="image/jpeg")
+
+    def test_same_content_is_stored_once(self) -> None:
+        first_image, = ProductGalleryService.attach_images(self.first, [self._upload()])
+        second_image, = ProductGalleryService.attach_images(self.second, [self._upload("copy.jpg")])
+
+        sha256 = hashlib.sha256(self.content).hexdigest()
+        assert first_image == second_image
+        assert ProductImage.objects.count() == 1
+        image = ProductImage.objects.get()
+        assert image.sha256 == sha256
+        assert image.ref_count == 2
+        assert image.image.name == f"products/images/{sha256[:2]}/{sha256[2:4]}/{sha256}.jpg"
+
+    def test_duplicate_files_in_one_upload_link_once(self) -> None:
+        images = ProductGalleryService.attach_images(self.first, [self._upload(), self._upload()])
+        ProductGalleryService.attach_images(self.first, [self._upload()])
+
+        assert len(images) == 1
+        assert ProductGallery.objects.filter(product=self.first).count() == 1
+        assert ProductImage.objects.get().ref_count == 1
+
+    def test_concurrent_insert_of_same_image_reuses_existing_row(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        store_file = ProductGalleryService._store_file
+
+        def store_then_race(file: Any, sha256: str) -> ProductImage:
+            # 조회와 INSERT 사이에 다른 요청이 같은 이미지를 먼저 저장한 상황
+            product_image = store_file(file, sha256)
+            ProductImage.objects.create(sha256=sha256, image=product_image.image.name)
+            return product_image
+
+        monkeypatch.setattr(ProductGalleryService, '_store_file', staticmethod(store_then_race))
+        other_content = self.content
+        self.content = jpeg_bytes("blue")
+        images = ProductGalleryService.attach_images(
+            self.first, [self._upload(), SimpleUploadedFile("other.jpg", other_content, content_type="image/jpeg")]
+        )
+
+        assert ProductImage.objects.count() == 2
+        assert {image.pk for image in images} == set(ProductImage.objects.values_list('pk', flat=True))
+        assert set(ProductImage.objects.values_list('ref_count', flat=True)) == {1}
+
+    def test_unlink_keeps_image_shared_with_other_product(self) -> None:
+        image, = ProductGalleryService.attach_images(self.first, [self._upload()])
+        ProductGalleryService.attach_images(self.second, [self._upload()])
+        self.client.force_login(self.admin_user)
+
+        response = self.client.delete(
+            reverse('product-unlink-image', kwargs={'pk': self.first.pk, 'image_id': image.pk})
+        )
+
+        assert response.status_code == 200
+        image.refresh_from_db()
+        assert image.ref_count == 1
+        self.first.refresh_from_db()
+        self.second.refresh_from_db()
+        assert self.first.primary_image is None
+        assert self.second.primary_image == image
+
+        self.client.delete(reverse('product-unlink-image', kwargs={'pk': self.second.pk, 'image_id': image.pk}))
+        assert not ProductImage.objects.exists()
+
+    def test_legacy_delete_refuses_shared_image(self) -> None:
+        image, = ProductGalleryService.attach_images(self.first, [self._upload()])
+        ProductGalleryService.attach_images(self.second, [self._upload()])
+        self.client.force_login(self.admin_user)
+
+        response = self.client.delete(reverse('product-delete-image', kwargs={'image_id': image.pk}))
+
+        assert response.status_code == 409
+        assert ProductGallery.objects.filter(productimage=image).count() == 2
+
+    def test_legacy_delete_unlinks_image_of_single_product(self) -> None:
+        image, = ProductGalleryService.attach_images(self.first, [self._upload()])
+        other, = ProductGalleryService.attach_images(self.second, [
+            SimpleUploadedFile("other.jpg", jpeg_bytes("blue"), content_type="image/jpeg")
+        ])
+        self.client.force_login(self.admin_user)
+
+        response = self.client.delete(reverse('product-delete-image', kwargs={'image_id': image.pk}))
+
+        assert response.status_code == 200
+        assert not ProductImage.objects.filter(pk=image.pk).exists()
+        assert self.second.gallery_images == [other]
+
+    def test_purge_deletes_image_from_every_product(self) -> None:
+        image, = ProductGalleryService.attach_images(self.first, [self._upload()])
+        ProductGalleryService.attach_images(self.second, [self._upload()])
+        self.client.force_login(self.admin_user)
+
+        response = self.client.delete(reverse('product-purge-image', kwargs={'image_id': image.pk}))
+
+        assert response.status_code == 200
+        assert not ProductImage.objects.exists()
+        self.second.refresh_from_db()
+        assert self.second.primary_image is None
+
+    def test_product_delete_decrements_ref_count(self) -> None:
+        image, = ProductGalleryService.attach_images(self.first, [self._upload()])
+        ProductGalleryService.attach_images(self.second, [self._upload()])
+
+        self.first.delete()
+
+        image.refresh_from_db()
+        assert image.ref_count == 1
+
+    def test_m2m_add_and_remove_keep_ref_count(self) -> None:
+        image, = ProductGalleryService.attach_images(self.first, [self._upload()])
+
+        self.second.image.add(image)
+        image.refresh_from_db()
+        assert image.ref_count == 2
+
+        image.product_set.remove(self.first)
+        image.refresh_from_db()
+        assert image.ref_count == 1
+
+    def test_reupload_reuses_stored_file(self) -> None:
+        image, = ProductGalleryService.attach_images(self.first, [self._upload()])
+        stored_name = image.image.name
+        ProductGalleryService.unlink_image(self.first, image)
+
+        reuploaded, = ProductGalleryService.attach_images(self.second, [self._upload()])
+
+        assert reuploaded.pk != image.pk
+        assert reuploaded.image.name == stored_name
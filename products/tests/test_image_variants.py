@@ -0,0 +1,147 @@
+import io
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client
+from django.urls import reverse
+from PIL import Image
+
+from products.models import Product, ProductImage
+from products.services.gallery import ProductGalleryService
+from products.services.image_variants import ImageVariantService, _worker
+from users.models import User
+
+
+def make_upload(name: str, size: tuple[int, int]) -> SimpleUploadedFile:
+    buffer = io.BytesIO()
+    Image.effect_noise(size, 64).convert('RGB').save(buffer, 'JPEG', quality=95)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+
+@pytest.mark.django_db
+class TestImageVariants:
+    @pytest.fixture(autouse=True)
+    def sync_variants(self, settings: Any) -> None:
+        settings.PRODUCT_IMAGE_VARIANTS_SYNC = True
+
+    def setup_method(self) -> None:
+        cache.clear()
+        self.client = Client()
+        self.admin_user = User.objects.create(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="admin_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01012345678"
+        )
+        self.product = Product.objects.create(
+            user=self.admin_user,
+            name="파생 이미지 상품",
+            description="상품 설명",
+            price=10000,
+            stock=10,
+            is_live=True,
+            is_sold=False
+        )
+
+    def test_variants_are_generated_for_each_width_and_format(self) -> None:
+        image, = ProductGalleryService.attach_images(self.product, [make_upload("big.jpg", (1600, 1200))])
+
+        image.refresh_from_db()
+        for fmt in ('webp', 'jpeg'):
+            assert [variant['width'] for variant in image.variants[fmt]] == [320, 640, 1024]
+        smallest = image.variants['jpeg'][0]['name']
+        with image.image.storage.open(smallest) as variant_file:
+            assert Image.open(variant_file).size == (320, 240)
+        # 그리드 썸네일은 원본보다 한 자릿수 이상 작아야 한다
+        assert image.image.storage.size(smallest) * 10 < image.image.size
+
+    def test_small_image_is_not_upscaled(self) -> None:
+        image, = ProductGalleryService.attach_images(self.product, [make_upload("small.jpg", (200, 100))])
+
+        image.refresh_from_db()
+        assert [variant['width'] for variant in image.variants['webp']] == [200]
+
+    def test_invalid_image_keeps_original(self) -> None:
+        image, = ProductGalleryService.attach_images(self.product, [
+            SimpleUploadedFile("broken.jpg", b"file_content", content_type="image/jpeg")
+        ])
+
+        image.refresh_from_db()
+        assert image.variants == {}
+        assert image.thumbnail_url == image.image.url
+
+    @pytest.mark.parametrize('mode, fmt', [('CMYK', 'JPEG'), ('P', 'PNG'), ('LA', 'PNG'), ('P', 'GIF')])
+    def test_non_rgb_modes_are_normalized(self, mode: str, fmt: str) -> None:
+        buffer = io.BytesIO()
+        source = Image.new('RGBA', (400, 300), (255, 0, 0, 128))
+        if mode == 'P':
+            source = source.convert('RGB').convert('P')
+            source.info['transparency'] = 0
+        else:
+            source = source.convert(mode)
+        source.save(buffer, fmt)
+        upload = SimpleUploadedFile(f"mode.{fmt.lower()}", buffer.getvalue(), content_type=f"image/{fmt.lower()}")
+
+        image, = ProductGalleryService.attach_images(self.product, [upload])
+
+        image.refresh_from_db()
+        assert [variant['width'] for variant in image.variants['webp']] == [320]
+        assert [variant['width'] for variant in image.variants['jpeg']] == [320]
+
+    def test_encode_failure_skips_only_that_format(self) -> None:
+        original_save = Image.Image.save
+
+        def failing_save(image: Image.Image, fp: Any, format: Any = None, **params: Any) -> None:
+            if format == 'WEBP':
+                raise OSError("cannot write mode")
+            original_save(image, fp, format, **params)
+
+        with patch.object(Image.Image, 'save', failing_save):
+            image, = ProductGalleryService.attach_images(self.product, [make_upload("big.jpg", (800, 600))])
+
+        image.refresh_from_db()
+        assert 'webp' not in image.variants
+        assert [variant['width'] for variant in image.variants['jpeg']] == [320, 640]
+
+    def test_decompression_bomb_keeps_original(self) -> None:
+        with patch('products.services.image_variants.Image.open', side_effect=Image.DecompressionBombError("bomb")):
+            image, = ProductGalleryService.attach_images(self.product, [make_upload("big.jpg", (800, 600))])
+
+        image.refresh_from_db()
+        assert image.variants == {}
+
+    def test_storefront_card_emits_srcset(self) -> None:
+        self.client.get(reverse('home'))
+        image, = ProductGalleryService.attach_images(self.product, [make_upload("card.jpg", (800, 600))])
+        image = ProductImage.objects.get(pk=image.pk)
+
+        content = self.client.get(reverse('home')).content.decode()
+
+        assert 'type="image/webp"' in content
+        assert image.webp_srcset in content
+        assert "320w" in content and "640w" in content
+
+    def test_async_mode_queues_after_commit(self, settings: Any, django_capture_on_commit_callbacks: Any) -> None:
+        settings.PRODUCT_IMAGE_VARIANTS_SYNC = False
+
+        with patch.object(_worker, 'submit') as submit:
+            with django_capture_on_commit_callbacks(execute=True):
+                image, = ProductGalleryService.attach_images(self.product, [make_upload("queued.jpg", (400, 300))])
+                submit.assert_not_called()
+
+        submit.assert_called_once_with([image.pk])
+
+    def test_worker_thread_generates_variants(self) -> None:
+        image = ProductImage.objects.create(image=make_upload("worker.jpg", (400, 300)))
+
+        with patch.object(ImageVariantService, 'generate') as generate:
+            _worker.submit([image.pk])
+            _worker._queue.join()
+
+        generate.assert_called_once_with(image.pk)
@@ -0,0 +1,189 @@
+import io
+import os
+import time
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from typing import Any
+
+import pytest
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+
+from products.models import Product, ProductImage
+from products.services.gallery import ProductGalleryService
+from products.services.media_gc import MediaGarbageCollector
+from users.models import User
+
+
+def jpeg_upload(name: str, color: str) -> SimpleUploadedFile:
+    buffer = io.BytesIO()
+    Image.new("RGB", (400, 300), color).save(buffer, "JPEG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/jpeg")
+
+
+def age(path: Path, hours: float = 48) -> None:
+    old = time.time() - hours * 3600
+    os.utime(path, (old, old))
+
+
+@pytest.mark.django_db
+class TestMediaGarbageCollector:
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings: Any, tmp_path: Path) -> None:
+        settings.MEDIA_ROOT = str(tmp_path)
+        settings.PRODUCT_IMAGE_VARIANTS_SYNC = True
+        self.media = tmp_path
+
+    def setup_method(self) -> None:
+        self.admin_user = User.objects.create(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="admin_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01012345678"
+        )
+        self.product = Product.objects.create(
+            user=self.admin_user,
+            name="정리 대상 상품",
+            description="상품 설명",
+            price=10000,
+            stock=10,
+            is_live=True,
+            is_sold=False
+        )
+
+    def _age_everything(self) -> None:
+        for path in self.media.rglob('*'):
+            if path.is_file():
+                age(path)
+        ProductImage.objects.update(created_at=timezone.now() - timedelta(days=2))
+
+    def _orphan_file(self, name: str) -> Path:
+        path = self.media / 'products' / 'images' / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"orphan")
+        age(path)
+        return path
+
+    def test_orphan_rows_and_files_are_removed(self) -> None:
+        kept, = ProductGalleryService.attach_images(self.product, [jpeg_upload("kept.jpg", "red")])
+        other_product = Product.objects.create(
+            user=self.admin_user, name="삭제될 상품", description="설명", price=1000, stock=1
+        )
+        dropped, = ProductGalleryService.attach_images(other_product, [jpeg_upload("dropped.jpg", "blue")])
+        dropped.refresh_from_db()
+        other_product.delete()
+        stray = self._orphan_file('ff/ee/stray.jpg')
+        self._age_everything()
+        kept.refresh_from_db()
+        dropped_files = [str(dropped.image.name)] + [v['name'] for entries in dropped.variants.values() for v in entries]
+
+        collector = MediaGarbageCollector(default_storage, batch_size=2)
+        collector.collect_rows()
+        collector.collect_files()
+
+        assert list(ProductImage.objects.all()) == [kept]
+        assert not stray.exists()
+        for name in dropped_files:
+            assert not default_storage.exists(name)
+        assert default_storage.exists(str(kept.image.name))
+        for entries in kept.variants.values():
+            for variant in entries:
+                assert default_storage.exists(variant['name'])
+        assert collector.deleted_rows == 1
+        assert collector.deleted_files == len(dropped_files) + 1
+
+    def test_recent_rows_and_files_are_kept(self) -> None:
+        image = ProductImage.objects.create(image=jpeg_upload("fresh.jpg", "green"))
+
+        collector = MediaGarbageCollector(default_storage)
+        collector.collect_rows()
+        collector.collect_files()
+
+        assert ProductImage.objects.filter(pk=image.pk).exists()
+        assert default_storage.exists(str(image.image.name))
+
+    def test_dry_run_deletes_nothing(self) -> None:
+        ProductImage.objects.create(image=jpeg_upload("orphan.jpg", "green"))
+        stray = self._orphan_file('stray.jpg')
+        self._age_everything()
+
+        out = StringIO()
+        call_command('gc_media', '--dry-run', stdout=out)
+
+        assert ProductImage.objects.count() == 1
+        assert stray.exists()
+        assert "stray.jpg" in out.getvalue()
+
+    def test_resumes_after_checkpoint(self) -> None:
+        before = self._orphan_file('aa/00/before.jpg')
+        after = self._orphan_file('bb/00/after.jpg')
+        checkpoint = self.media / 'checkpoint'
+        checkpoint.write_text('products/images/aa/00/before.jpg')
+
+        call_command('gc_media', '--checkpoint', str(checkpoint), '--skip-rows', stdout=StringIO())
+
+        assert before.exists()
+        assert not after.exists()
+        assert not checkpoint.exists()
+
+    def test_file_referenced_after_snapshot_is_kept(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        orphan = self._orphan_file('ab/cd/reused.jpg')
+        name = 'products/images/ab/cd/reused.jpg'
+        referenced = MediaGarbageCollector._referenced
+
+        def snapshot_then_reupload(collector: MediaGarbageCollector, names: list[str]) -> set[str]:
+            # 참조 조회 직후 같은 내용이 다시 올라와 예전 파일에 새 행이 연결된 상황
+            result = referenced(collector, names)
+            ProductImage.objects.create(image=name)
+            return result
+
+        monkeypatch.setattr(MediaGarbageCollector, '_referenced', snapshot_then_reupload)
+        MediaGarbageCollector(default_storage).collect_files()
+
+        assert orphan.exists()
+
+    def test_reused_file_is_touched(self) -> None:
+        image, = ProductGalleryService.attach_images(self.product, [jpeg_upload("photo.jpg", "red")])
+        path = Path(default_storage.path(str(image.image.name)))
+        ProductGalleryService.unlink_image(self.product, image)
+        age(path)
+
+        ProductGalleryService.attach_images(self.product, [jpeg_upload("photo.jpg", "red")])
+
+        assert time.time() - path.stat().st_mtime < 60
+
+    def test_large_directory_is_listed_in_sorted_chunks(self) -> None:
+        names = [f'{index:03d}.jpg' for index in range(10)]
+        for name in reversed(names):
+            self._orphan_file(name)
+        self._orphan_file('ab/cd/nested.jpg')
+
+        collector = MediaGarbageCollector(default_storage, listing_chunk=3)
+        walked = list(collector._walk('products/images', ()))
+
+        assert walked == [f'products/images/{name}' for name in names] + ['products/images/ab/cd/nested.jpg']
+
+    def test_candidates_are_rechecked_in_one_query(self) -> None:
+        for index in range(5):
+            self._orphan_file(f'stray{index}.jpg')
+
+        with CaptureQueriesContext(connection) as queries:
+            MediaGarbageCollector(default_storage, batch_size=10).collect_files()
+
+        assert len(queries) == 2
+        assert not list((self.media / 'products' / 'images').glob('stray*'))
+
+    def test_default_checkpoint_is_outside_media_root(self, settings: Any) -> None:
+        # fixture 가 MEDIA_ROOT 를 바꾸므로 설정 파일의 기본 미디어 경로와 비교한다
+        checkpoint = Path(settings.GC_MEDIA_CHECKPOINT).resolve()
+
+        assert Path(settings.BASE_DIR, 'media').resolve() not in checkpoint.parents
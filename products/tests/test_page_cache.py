@@ -0,0 +1,131 @@
+from typing import Any
+
+import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from products.models import Product
+from products.services.gallery import ProductGalleryService
+from products.services.page_cache import StorefrontPageCache
+from users.models import User
+
+
+@pytest.mark.django_db
+class TestStorefrontPageCache:
+    @pytest.fixture(autouse=True)
+    def enable_page_cache(self, settings: Any) -> None:
+        settings.STOREFRONT_PAGE_CACHE_ENABLED = True
+
+    def setup_method(self) -> None:
+        cache.clear()
+        self.client = Client()
+        self.admin_user = User.objects.create(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="admin_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01012345678"
+        )
+        self.product = Product.objects.create(
+            user=self.admin_user,
+            name="페이지 캐시 상품",
+            description="상품 설명",
+            price=10000,
+            stock=10,
+            is_live=True,
+            is_sold=False
+        )
+        self.detail_url = reverse('products-detail', kwargs={'slug': self.product.slug})
+
+    def test_anonymous_repeat_request_is_served_from_cache(self) -> None:
+        first = self.client.get(reverse('home'))
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(reverse('home'))
+
+        assert len(queries) == 0
+        assert second.content == first.content
+        assert 'Cookie' in second['Vary']
+        assert StorefrontPageCache.stats() == {'hits': 1, 'misses': 1}
+
+    def test_session_cookie_bypasses_cache(self) -> None:
+        self.client.get(reverse('home'))
+
+        self.client.force_login(self.admin_user)
+        response = self.client.get(reverse('home'))
+
+        assert "ADMIN" in response.content.decode()
+        assert StorefrontPageCache.stats() == {'hits': 0, 'misses': 1}
+
+    def test_product_update_purges_detail_and_home(self) -> None:
+        self.client.get(self.detail_url)
+        self.client.get(reverse('home'))
+
+        admin_client = Client()
+        admin_client.force_login(self.admin_user)
+        admin_client.post(reverse('product-update', kwargs={'pk': self.product.pk}), {
+            'name': '수정된 상품',
+            'description': '상품 설명',
+            'price': 10000,
+            'stock': 10,
+            'is_live': True,
+            'is_sold': False
+        })
+
+        assert "수정된 상품" in self.client.get(self.detail_url).content.decode()
+        assert "수정된 상품" in self.client.get(reverse('home')).content.decode()
+        assert StorefrontPageCache.stats()['hits'] == 0
+
+    def test_image_delete_purges_detail(self) -> None:
+        image, = ProductGalleryService.attach_images(self.product, [
+            SimpleUploadedFile("page.jpg", b"file_content", content_type="image/jpeg")
+        ])
+        assert image.image.url in self.client.get(self.detail_url).content.decode()
+
+        admin_client = Client()
+        admin_client.force_login(self.admin_user)
+        admin_client.delete(reverse('product-delete-image', kwargs={'image_id': image.pk}))
+
+        assert image.image.url not in self.client.get(self.detail_url).content.decode()
+
+    def test_gallery_attach_purges_detail_after_commit(self, django_capture_on_commit_callbacks: Any) -> None:
+        with django_capture_on_commit_callbacks(execute=True):
+            ProductGalleryService.attach_images(self.product, [
+                SimpleUploadedFile("first.jpg", b"first", content_type="image/jpeg")
+            ])
+        self.client.get(self.detail_url)
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            second, = ProductGalleryService.attach_images(self.product, [
+                SimpleUploadedFile("second.jpg", b"second", content_type="image/jpeg")
+            ])
+        # 대표 이미지가 그대로면 상품 저장 시그널이 없으므로 커밋 전에는 캐시가 남아 있다
+        assert cache.get(StorefrontPageCache.detail_key(self.product.slug)) is not None
+
+        for callback in callbacks:
+            callback()
+        assert second.image.url in self.client.get(self.detail_url).content.decode()
+
+    def test_disabled_cache_is_bypassed(self, settings: Any) -> None:
+        settings.STOREFRONT_PAGE_CACHE_ENABLED = False
+
+        self.client.get(reverse('home'))
+        self.client.get(reverse('home'))
+
+        assert StorefrontPageCache.stats() == {'hits': 0, 'misses': 0}
+
+    def test_stats_endpoint_requires_admin(self) -> None:
+        self.client.get(reverse('home'))
+        self.client.get(reverse('home'))
+
+        response = self.client.get(reverse('product-page-cache-stats'))
+        assert response.status_code == 302
+
+        self.client.force_login(self.admin_user)
+        response = self.client.get(reverse('product-page-cache-stats'))
+        assert response.json() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5}
@@ -0,0 +1,103 @@
+import base64
+from datetime import timedelta
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from products.models import Product
+from products.services.pagination import KeysetPaginator
+from products.services.storefront import StorefrontService
+from users.models import User
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    def setup_method(self) -> None:
+        self.client = Client()
+        self.admin_user = User.objects.create(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="admin_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01012345678"
+        )
+
+    def _create_products(self, count: int, same_timestamp: bool = False) -> list[Product]:
+        now = timezone.now()
+        products = []
+        for i in range(count):
+            product = Product.objects.create(
+                user=self.admin_user,
+                name=f"상품 {i}",
+                description="상품 설명",
+                price=10000,
+                stock=10,
+                is_live=True,
+                is_sold=False
+            )
+            created_at = now if same_timestamp else now - timedelta(minutes=count - i)
+            Product.objects.filter(pk=product.pk).update(created_at=created_at)
+            products.append(product)
+        return products
+
+    def _walk(self, per_page: int) -> list[int]:
+        paginator = KeysetPaginator(Product.objects.all(), per_page)
+        seen: list[int] = []
+        page = paginator.page()
+        seen.extend(product.pk for product in page.items)
+        while page.has_next:
+            page = paginator.page(page.next_cursor)
+            seen.extend(product.pk for product in page.items)
+        return seen
+
+    def test_pages_cover_catalog_newest_first(self) -> None:
+        products = self._create_products(5)
+
+        assert self._walk(per_page=2) == [product.pk for product in reversed(products)]
+
+    def test_ties_on_created_at_are_broken_by_id(self) -> None:
+        products = self._create_products(5, same_timestamp=True)
+
+        assert self._walk(per_page=2) == sorted((product.pk for product in products), reverse=True)
+
+    def test_last_page_has_no_cursor(self) -> None:
+        self._create_products(2)
+
+        page = KeysetPaginator(Product.objects.all(), 2).page()
+        assert len(page.items) == 2
+        assert not page.has_next
+
+    def test_invalid_cursor_falls_back_to_first_page(self) -> None:
+        self._create_products(3)
+
+        paginator = KeysetPaginator(Product.objects.all(), 2)
+        assert paginator.page("not-a-cursor").items == paginator.page().items
+
+    @pytest.mark.parametrize('raw', [
+        b'["2024-01-01T00:00:00+00:00", 1e400]',
+        b'["2024-01-01T00:00:00+00:00", 9223372036854775808]',
+        b'["2024-01-01T00:00:00+00:00", 0]',
+        b'["2024-01-01T00:00:00", 1]',
+    ])
+    def test_crafted_cursor_is_rejected(self, raw: bytes) -> None:
+        cursor = base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+        assert KeysetPaginator.decode_cursor(cursor) is None
+        assert self.client.get(reverse('home'), {'cursor': cursor}).status_code == 200
+
+    def test_home_follows_cursor(self) -> None:
+        self._create_products(StorefrontService.PAGE_SIZE + 1)
+
+        response = self.client.get(reverse('home'))
+        assert response.status_code == 200
+        page = response.context['page']
+        assert len(response.context['products']) == StorefrontService.PAGE_SIZE
+        assert page.has_next
+
+        response = self.client.get(reverse('home'), {'cursor': page.next_cursor})
+        assert len(response.context['products']) == 1
+        assert not response.context['page'].has_next
@@ -1,8 +1,14 @@
+from unittest.mock import patch
+
 import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import IntegrityError, connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from products.models import Product
+from products.services.gallery import ProductGalleryService
 from users.models import User
 
 
@@ -21,11 +27,94 @@ class TestProductDetail:
 
     def test_product_detail_get(self) -> None:
         user = User.objects.get(username="create_test_user")
-        Product.objects.create(user_id=user.pk, name="test_product", description="test_product", is_live=True, is_sold=False, stock=10, price=10000)
-        url = reverse('products-detail', kwargs={'product_name': "test_product"})
+        product = Product.objects.create(user_id=user.pk, name="test_product", description="test_product", is_live=True, is_sold=False, stock=10, price=10000)
+        url = reverse('products-detail', kwargs={'slug': product.slug})
         response = self.client.get(url)
         assert response.status_code == 200
 
+    def test_product_detail_duplicate_names_get_unique_slugs(self) -> None:
+        user = User.objects.get(username="create_test_user")
+        first = Product.objects.create(user_id=user.pk, name="봄 자켓", description="설명", is_live=True, is_sold=False, stock=10, price=10000)
+        second = Product.objects.create(user_id=user.pk, name="봄 자켓", description="설명", is_live=True, is_sold=False, stock=10, price=10000)
+
+        assert first.slug == "봄-자켓"
+        assert second.slug == "봄-자켓-2"
+        response = self.client.get(reverse('products-detail', kwargs={'slug': second.slug}))
+        assert response.status_code == 200
+        assert response.context['products'] == second
+
+    def test_product_detail_legacy_name_url_redirects(self) -> None:
+        user = User.objects.get(username="create_test_user")
+        product = Product.objects.create(user_id=user.pk, name="test_product", description="test_product", is_live=True, is_sold=False, stock=10, price=10000)
+        Product.objects.create(user_id=user.pk, name="test_product", description="test_product", is_live=True, is_sold=False, stock=10, price=10000)
+
+        response = self.client.get(reverse('products-detail-legacy', kwargs={'product_name': "test_product"}))
+        assert response.status_code == 301
+        assert response['Location'] == reverse('products-detail', kwargs={'slug': product.slug})
+
+    def test_product_detail_legacy_name_url_not_found(self) -> None:
+        response = self.client.get(reverse('products-detail-legacy', kwargs={'product_name': "missing"}))
+        assert response.status_code == 404
+
+    def test_product_slug_ignores_unrelated_prefix_matches_in_one_query(self) -> None:
+        user = User.objects.get(username="create_test_user")
+        for slug in ("shoe", "shoe-rack", "shoe-7", "shoe-2x", "shoe-3-4"):
+            Product.objects.create(user_id=user.pk, name=slug, slug=slug, description="설명", stock=1, price=1000)
+
+        with CaptureQueriesContext(connection) as queries:
+            slug = Product._generate_unique_slug("shoe")
+
+        assert slug == "shoe-8"
+        assert len(queries) == 1
+
+    def test_product_slug_overflow_falls_back_to_random(self) -> None:
+        user = User.objects.get(username="create_test_user")
+        for slug in ("shoe", "shoe-999999999", "shoe-1000000000"):
+            Product.objects.create(user_id=user.pk, name=slug, slug=slug, description="설명", stock=1, price=1000)
+
+        product = Product.objects.create(user_id=user.pk, name="shoe", description="설명", stock=1, price=1000)
+
+        assert product.slug.startswith("shoe-")
+        assert product.slug not in ("shoe-999999999", "shoe-1000000000")
+
+    def test_product_slug_retries_on_concurrent_conflict(self) -> None:
+        user = User.objects.get(username="create_test_user")
+        Product.objects.create(user_id=user.pk, name="봄 자켓", description="설명", stock=10, price=10000)
+        # 다른 요청이 같은 slug 를 먼저 저장해 조회 결과가 이미 낡은 경우
+        with patch.object(Product, '_generate_unique_slug', side_effect=["봄-자켓", "봄-자켓-2"]):
+            second = Product.objects.create(user_id=user.pk, name="봄 자켓", description="설명", stock=10, price=10000)
+
+        assert second.slug == "봄-자켓-2"
+        assert Product.objects.count() == 2
+
+    def test_product_slug_gives_up_after_max_attempts(self) -> None:
+        user = User.objects.get(username="create_test_user")
+        Product.objects.create(user_id=user.pk, name="봄 자켓", description="설명", stock=10, price=10000)
+
+        with patch.object(Product, '_generate_unique_slug', return_value="봄-자켓") as generate:
+            with pytest.raises(IntegrityError):
+                Product.objects.create(user_id=user.pk, name="봄 자켓", description="설명", stock=10, price=10000)
+        assert generate.call_count == Product.SLUG_MAX_ATTEMPTS
+
+    def test_product_detail_legacy_name_url_too_long_skips_lookup(self) -> None:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('products-detail-legacy', kwargs={'product_name': "a" * 101}))
+        assert response.status_code == 404
+        assert not [q for q in queries if 'FROM "products"' in q['sql']]
+
+    def test_product_detail_gallery_is_prefetched(self) -> None:
+        user = User.objects.get(username="create_test_user")
+        product = Product.objects.create(user_id=user.pk, name="test_product", description="test_product", is_live=True, is_sold=False, stock=10, price=10000)
+        ProductGalleryService.attach_images(product, [
+            SimpleUploadedFile(f"image_{i}.jpg", b"file_content", content_type="image/jpeg") for i in range(3)
+        ])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('products-detail', kwargs={'slug': product.slug}))
+        assert response.status_code == 200
+        # 상품 + 갤러리 두 번의 쿼리로 끝나야 한다
+        assert len(queries) == 2
+
     # def test_product_detail_post_name_null_error(self) -> None:
     #     response = self.client.post("/products/add/", {
     #         "user_id": 1,
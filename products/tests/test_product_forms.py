@@ -1,12 +1,20 @@
+import io
 from typing import cast
 
 from django.core.files.uploadedfile import SimpleUploadedFile, UploadedFile
 from django.test import TestCase
 from django.utils.datastructures import MultiValueDict
+from PIL import Image
 
 from products.forms.product_form import ProductForm, ProductImageForm
 
 
+def tiny_png() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (2, 2)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
 class TestProductForm(TestCase):
     def test_product_form_valid_data(self) -> None:
         form_data = {
@@ -101,9 +109,9 @@ class TestProductForm(TestCase):
 class TestProductImageForm(TestCase):
     def test_product_image_form_valid_data(self) -> None:
         image = cast(UploadedFile, SimpleUploadedFile(
-            "test_image.jpg",
-            b"file_content",
-            content_type="image/jpeg"
+            "test_image.png",
+            tiny_png(),
+            content_type="image/png"
         ))
         files: MultiValueDict[str, UploadedFile] = MultiValueDict({'image': [image]})
         form = ProductImageForm(data={}, files=files)
@@ -116,14 +124,14 @@ class TestProductImageForm(TestCase):
 
     def test_product_image_form_multiple_images(self) -> None:
         image1 = cast(UploadedFile, SimpleUploadedFile(
-            "test_image1.jpg",
-            b"file_content1",
-            content_type="image/jpeg"
+            "test_image1.png",
+            tiny_png(),
+            content_type="image/png"
         ))
         image2 = cast(UploadedFile, SimpleUploadedFile(
-            "test_image2.jpg",
-            b"file_content2",
-            content_type="image/jpeg"
+            "test_image2.png",
+            tiny_png(),
+            content_type="image/png"
         ))
         files: MultiValueDict[str, UploadedFile] = MultiValueDict({'image': [image1, image2]})
         form = ProductImageForm(data={}, files=files)
@@ -137,6 +145,6 @@ class TestProductImageForm(TestCase):
         ))
         files: MultiValueDict[str, UploadedFile] = MultiValueDict({'image': [text_file]})
         form = ProductImageForm(data={}, files=files)
-        # FileField는 파일 타입을 자동으로 검증하지 않으므로 유효할 수 있음
-        # 실제 검증은 뷰에서 처리됨
-        self.assertTrue(form.is_valid())
+        # 파일 앞부분의 매직 바이트로 이미지 여부를 검증
+        self.assertFalse(form.is_valid())
+        self.assertIn('image', form.errors)
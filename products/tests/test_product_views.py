@@ -1,12 +1,42 @@
+import io
+from typing import Any
+
 import pytest
-from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.files.uploadedfile import SimpleUploadedFile, UploadedFile
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from PIL import Image
 
-from products.models import Product, ProductImage
+from products.models import Product, ProductGallery, ProductImage
+from products.services.gallery import ProductGalleryService
 from users.models import User
 
 
+def tiny_jpeg(color: str = "white") -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (2, 2), color).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+def jpeg_files(count: int, prefix: str) -> list[UploadedFile]:
+    # 크기를 달리해 내용이 겹치지 않게 한다 (같은 내용은 해시 중복 제거로 한 장이 된다)
+    files: list[UploadedFile] = []
+    for i in range(count):
+        buffer = io.BytesIO()
+        Image.new("RGB", (i + 1, len(prefix) + 1), "white").save(buffer, "JPEG")
+        files.append(SimpleUploadedFile(f"{prefix}_{i}.jpg", buffer.getvalue(), content_type="image/jpeg"))
+    return files
+
+
+def post_and_count_queries(client: Client, url: str, data: dict[str, Any]) -> int:
+    with CaptureQueriesContext(connection) as queries:
+        response = client.post(url, data)
+    assert response.status_code == 302
+    return len(queries)
+
+
 @pytest.mark.django_db
 class TestProductCreateView:
     def setup_method(self) -> None:
@@ -82,12 +112,12 @@ class TestProductCreateView:
         
         image1 = SimpleUploadedFile(
             "test_image1.jpg",
-            b"file_content1",
+            tiny_jpeg("red"),
             content_type="image/jpeg"
         )
         image2 = SimpleUploadedFile(
             "test_image2.jpg",
-            b"file_content2",
+            tiny_jpeg("blue"),
             content_type="image/jpeg"
         )
         
@@ -100,6 +130,8 @@ class TestProductCreateView:
         
         product = Product.objects.get(name='테스트 상품')
         assert product.image.count() == 2
+        assert [link.position for link in ProductGallery.objects.filter(product=product)] == [0, 1]
+        assert product.primary_image == product.gallery_images[0]
 
     def test_product_create_post_invalid_data(self) -> None:
         self.client.force_login(self.admin_user)
@@ -118,6 +150,40 @@ class TestProductCreateView:
         assert response.status_code == 200  # 폼 에러로 인해 다시 렌더링
         assert not Product.objects.filter(description='테스트 상품 설명').exists()
 
+    def test_product_create_image_queries_do_not_grow_with_image_count(self) -> None:
+        self.client.force_login(self.admin_user)
+        url = reverse('product-create')
+        form_data = {'description': '설명', 'price': 10000, 'stock': 1, 'is_live': True}
+        # 로그인 직후 첫 요청은 세션 저장 쿼리가 더해지므로 한 번 먼저 보낸다
+        post_and_count_queries(self.client, url, {**form_data, 'name': '준비'})
+
+        one = post_and_count_queries(self.client, url, {**form_data, 'name': '한 장', 'image': jpeg_files(1, 'one')})
+        five = post_and_count_queries(self.client, url, {**form_data, 'name': '다섯 장', 'image': jpeg_files(5, 'five')})
+
+        # 이미지 행과 갤러리 연결을 묶음 INSERT 로 넣으므로 파일 수와 무관하다
+        assert five == one
+        assert five <= 25
+        product = Product.objects.get(name='다섯 장')
+        assert [link.position for link in ProductGallery.objects.filter(product=product)] == [0, 1, 2, 3, 4]
+        assert set(ProductImage.objects.filter(productgallery__product=product).values_list('ref_count', flat=True)) == {1}
+
+    def test_product_create_rolls_back_when_attach_fails(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fail(*args: Any, **kwargs: Any) -> None:
+            raise RuntimeError("attach failed")
+
+        monkeypatch.setattr(ProductGalleryService, 'refresh_ref_counts', fail)
+        self.client.force_login(self.admin_user)
+        form_data = {
+            'name': '실패 상품', 'description': '설명', 'price': 10000, 'stock': 1, 'image': jpeg_files(3, 'fail'),
+        }
+
+        with pytest.raises(RuntimeError):
+            self.client.post(reverse('product-create'), form_data)
+
+        assert not Product.objects.filter(name='실패 상품').exists()
+        assert not ProductImage.objects.exists()
+        assert not ProductGallery.objects.exists()
+
 
 @pytest.mark.django_db
 class TestProductUpdateView:
@@ -210,7 +276,7 @@ class TestProductUpdateView:
         
         image = SimpleUploadedFile(
             "new_image.jpg",
-            b"new_file_content",
+            tiny_jpeg(),
             content_type="image/jpeg"
         )
         
@@ -223,6 +289,8 @@ class TestProductUpdateView:
         
         # 새 이미지가 추가되었는지 확인
         assert self.product.image.count() == 1
+        self.product.refresh_from_db()
+        assert self.product.primary_image == self.product.image.get()
 
     def test_product_update_post_invalid_data(self) -> None:
         self.client.force_login(self.admin_user)
@@ -244,6 +312,41 @@ class TestProductUpdateView:
         self.product.refresh_from_db()
         assert self.product.name == '기존 상품'  # 원래 이름 유지
 
+    def test_product_update_appends_images_with_constant_queries(self) -> None:
+        ProductGalleryService.attach_images(self.product, jpeg_files(2, 'existing'))
+        self.client.force_login(self.admin_user)
+        url = reverse('product-update', kwargs={'pk': self.product.pk})
+        form_data = {'name': '기존 상품', 'description': '설명', 'price': 5000, 'stock': 50, 'is_live': True}
+        post_and_count_queries(self.client, url, form_data)
+
+        one = post_and_count_queries(self.client, url, {**form_data, 'image': jpeg_files(1, 'add')})
+        four = post_and_count_queries(self.client, url, {**form_data, 'image': jpeg_files(4, 'more')})
+
+        assert four == one
+        positions = list(ProductGallery.objects.filter(product=self.product).values_list('position', flat=True))
+        assert positions == list(range(7))
+
+    def test_product_update_keeps_gallery_when_attach_fails(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        existing, = ProductGalleryService.attach_images(self.product, jpeg_files(1, 'keep'))
+
+        def fail(*args: Any, **kwargs: Any) -> None:
+            raise RuntimeError("attach failed")
+
+        monkeypatch.setattr(ProductGalleryService, 'sync_primary_image', fail)
+        self.client.force_login(self.admin_user)
+        form_data = {
+            'name': '바뀌면 안 되는 이름', 'description': '설명', 'price': 5000, 'stock': 50,
+            'image': jpeg_files(2, 'new'),
+        }
+
+        with pytest.raises(RuntimeError):
+            self.client.post(reverse('product-update', kwargs={'pk': self.product.pk}), form_data)
+
+        self.product.refresh_from_db()
+        assert self.product.name == '기존 상품'
+        assert list(self.product.image.all()) == [existing]
+        assert ProductImage.objects.count() == 1
+
     def test_product_update_nonexistent_product(self) -> None:
         self.client.force_login(self.admin_user)
         url = reverse('product-update', kwargs={'pk': 99999})
@@ -303,6 +406,24 @@ class TestDeleteProductImageView:
         assert response.json()['success'] is True
         assert not ProductImage.objects.filter(id=product_image.id).exists()
 
+    def test_delete_primary_image_promotes_next_image(self) -> None:
+        self.client.force_login(self.admin_user)
+
+        first, second = ProductGalleryService.attach_images(self.product, [
+            SimpleUploadedFile("first.jpg", b"file_content1", content_type="image/jpeg"),
+            SimpleUploadedFile("second.jpg", b"file_content2", content_type="image/jpeg"),
+        ])
+        self.product.refresh_from_db()
+        assert self.product.primary_image == first
+
+        url = reverse('product-delete-image', kwargs={'image_id': first.id})
+        response = self.client.delete(url)
+
+        assert response.status_code == 200
+        self.product.refresh_from_db()
+        assert self.product.primary_image == second
+        assert self.product.gallery_images == [second]
+
     def test_delete_image_unauthenticated(self) -> None:
         url = reverse('product-delete-image', kwargs={'image_id': 1})
         response = self.client.delete(url)
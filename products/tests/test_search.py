@@ -0,0 +1,79 @@
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+
+from products.models import Product
+from products.services.search import ProductSearchService
+from users.models import User
+
+
+@pytest.mark.django_db
+class TestProductSearch:
+    def setup_method(self) -> None:
+        cache.clear()
+        self.client = Client()
+        self.admin_user = User.objects.create(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="admin_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01012345678"
+        )
+
+    def _create_product(self, name: str, description: str = "상품 설명", **kwargs: bool) -> Product:
+        fields = {'is_live': True, 'is_sold': False, **kwargs}
+        return Product.objects.create(
+            user=self.admin_user,
+            name=name,
+            description=description,
+            price=10000,
+            stock=10,
+            **fields
+        )
+
+    def test_name_match_ranks_before_description_match(self) -> None:
+        by_description = self._create_product("봄 셔츠", description="자켓과 어울리는 셔츠")
+        by_name = self._create_product("오버핏 자켓")
+
+        results = list(ProductSearchService.search("자켓"))
+
+        assert results == [by_name, by_description]
+
+    def test_hidden_and_sold_products_are_excluded(self) -> None:
+        self._create_product("숨김 자켓", is_live=False)
+        self._create_product("품절 자켓", is_sold=True)
+
+        assert not ProductSearchService.search("자켓").exists()
+
+    def test_blank_query_returns_nothing(self) -> None:
+        self._create_product("자켓")
+
+        assert not ProductSearchService.search("   ").exists()
+
+    def test_like_wildcards_are_escaped(self) -> None:
+        assert ProductSearchService._like_pattern("50%_off") == "%50\\%\\_off%"
+
+    def test_search_view_paginates(self) -> None:
+        for number in range(ProductSearchService.PAGE_SIZE + 1):
+            self._create_product(f"니트 {number}")
+
+        response = self.client.get(reverse('product-search'), {'q': '니트'})
+        assert response.status_code == 200
+        assert response.context['page'].paginator.count == ProductSearchService.PAGE_SIZE + 1
+        assert len(response.context['products']) == ProductSearchService.PAGE_SIZE
+
+        response = self.client.get(reverse('product-search'), {'q': '니트', 'page': '2'})
+        assert len(response.context['products']) == 1
+
+    def test_benchmark_command_rolls_back(self) -> None:
+        out = StringIO()
+        call_command('bench_search', products=50, batch_size=20, repeat=1, queries=['자켓'], stdout=out)
+
+        assert "'자켓'" in out.getvalue()
+        assert not Product.objects.exists()
@@ -0,0 +1,71 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from products.models import Product
+from products.services.gallery import ProductGalleryService
+from products.services.storefront import StorefrontService
+from users.models import User
+
+
+@pytest.mark.django_db
+class TestStorefrontListing:
+    def setup_method(self) -> None:
+        self.client = Client()
+        self.admin_user = User.objects.create(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="admin_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01012345678"
+        )
+
+    def _create_products(self, count: int) -> None:
+        for i in range(count):
+            product = Product.objects.create(
+                user=self.admin_user,
+                name=f"상품 {i}",
+                description="상품 설명",
+                price=10000,
+                stock=10,
+                is_live=True,
+                is_sold=False
+            )
+            ProductGalleryService.attach_images(product, [
+                SimpleUploadedFile(f"image_{i}_{j}.jpg", b"file_content", content_type="image/jpeg")
+                for j in range(2)
+            ])
+
+    def _count_home_queries(self) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('home'))
+        assert response.status_code == 200
+        return len(queries)
+
+    def test_live_products_resolve_primary_image(self) -> None:
+        self._create_products(1)
+        Product.objects.create(
+            user=self.admin_user, name="판매 종료", description="설명", price=10000, stock=0, is_live=True, is_sold=True
+        )
+
+        products = list(StorefrontService.live_products())
+        assert len(products) == 1
+
+        expected = products[0].gallery_images[0]
+        with CaptureQueriesContext(connection) as queries:
+            assert products[0].primary_image == expected
+        assert len(queries) == 0
+
+    def test_home_query_count_is_constant(self) -> None:
+        self._create_products(2)
+        small_catalog = self._count_home_queries()
+
+        self._create_products(5)
+        large_catalog = self._count_home_queries()
+
+        assert small_catalog == large_catalog == 1
@@ -0,0 +1,83 @@
+import hashlib
+import io
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import Client
+from django.urls import reverse
+from PIL import Image
+
+from products.models import Product
+from products.upload_handlers import HashedTemporaryUploadedFile, detect_image_type
+from users.models import User
+
+
+def image_bytes(fmt: str, size: tuple[int, int] = (2, 2)) -> bytes:
+    buffer = io.BytesIO()
+    Image.effect_noise(size, 64).convert("RGB").save(buffer, fmt)
+    return buffer.getvalue()
+
+
+@pytest.mark.django_db
+class TestStreamingImageUploadHandler:
+    def setup_method(self) -> None:
+        self.client = Client()
+        self.admin_user = User.objects.create(
+            role="admin",
+            email="admin@admin.com",
+            password="create_test_admin",
+            username="admin_user",
+            personal_info_consent=True,
+            terms_of_use=True,
+            phone_number="01012345678"
+        )
+        self.client.force_login(self.admin_user)
+        self.form_data = {
+            'name': '업로드 상품',
+            'description': '상품 설명',
+            'price': 10000,
+            'stock': 10,
+            'is_live': True,
+            'is_sold': False
+        }
+
+    def test_detect_image_type(self) -> None:
+        assert detect_image_type(image_bytes("JPEG")) == "image/jpeg"
+        assert detect_image_type(image_bytes("PNG")) == "image/png"
+        assert detect_image_type(image_bytes("GIF")) == "image/gif"
+        assert detect_image_type(image_bytes("WEBP")) == "image/webp"
+        assert detect_image_type(b"RIFF\x00\x00\x00\x00WAVE") is None
+        assert detect_image_type(b"<?php echo 1;") is None
+
+    def test_upload_is_spooled_to_disk_and_hashed(self) -> None:
+        content = image_bytes("JPEG")
+        upload = SimpleUploadedFile("photo.jpg", content, content_type="image/jpeg")
+
+        with patch('products.views.admin.create_update.ProductGalleryService.attach_images') as attach_images:
+            response = self.client.post(reverse('product-create'), {**self.form_data, 'image': [upload]})
+
+        assert response.status_code == 302
+        files = attach_images.call_args.args[1]
+        assert isinstance(files[0], HashedTemporaryUploadedFile)
+        assert files[0].content_sha256 == hashlib.sha256(content).hexdigest()
+        assert files[0].image_type == "image/jpeg"
+
+    def test_non_image_upload_is_rejected(self) -> None:
+        upload = SimpleUploadedFile("photo.jpg", b"not an image", content_type="image/jpeg")
+
+        response = self.client.post(reverse('product-create'), {**self.form_data, 'image': [upload]})
+
+        assert response.status_code == 200
+        assert response.context['image_form'].errors['image']
+        assert not Product.objects.exists()
+
+    def test_request_over_size_cap_is_rejected(self, settings: Any) -> None:
+        settings.UPLOAD_MAX_REQUEST_SIZE = 1024
+        upload = SimpleUploadedFile("big.png", image_bytes("PNG", (200, 200)), content_type="image/png")
+
+        response = self.client.post(reverse('product-create'), {**self.form_data, 'image': [upload]})
+
+        assert response.status_code == 400
+        assert not Product.objects.exists()
@@ -0,0 +1,106 @@
+import hashlib
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.exceptions import RequestDataTooBig
+from django.core.files.uploadedfile import TemporaryUploadedFile, UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+
+# 파일 앞부분(매직 바이트)으로 판별하는 허용 이미지 형식
+IMAGE_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+)
+SIGNATURE_LENGTH = 12
+
+
+def detect_image_type(header: bytes) -> Optional[str]:
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'image/webp'
+    for signature, content_type in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return content_type
+    return None
+
+
+class HashedTemporaryUploadedFile(TemporaryUploadedFile):
+    content_sha256 = ''
+    image_type: Optional[str] = None
+
+
+def sniff_image_type(file: UploadedFile) -> Optional[str]:
+    # 이 핸들러를 거치지 않은 파일(직접 만든 UploadedFile 등)은 앞부분만 읽어 판별한다
+    if isinstance(file, HashedTemporaryUploadedFile):
+        return file.image_type
+    file.seek(0)
+    header = file.read(SIGNATURE_LENGTH)
+    file.seek(0)
+    return detect_image_type(header)
+
+
+def content_sha256(file: UploadedFile) -> str:
+    # 스트리밍 중 계산한 해시가 있으면 그대로 쓰고, 없으면 청크 단위로 읽어 계산한다
+    if isinstance(file, HashedTemporaryUploadedFile) and file.content_sha256:
+        return file.content_sha256
+    digest = hashlib.sha256()
+    for chunk in file.chunks():
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+class StreamingImageUploadHandler(FileUploadHandler):
+    """업로드 파일을 메모리에 모으지 않고 청크 단위로 바로 임시 파일에 쓰는 핸들러
+
+    쓰는 동안 SHA-256 해시를 계산하고 첫 청크의 매직 바이트로 이미지 형식을 판별해
+    파일 객체의 content_sha256, image_type 속성으로 넘긴다. 한 요청의 전체 업로드 크기가
+    UPLOAD_MAX_REQUEST_SIZE 를 넘으면 400 으로 중단한다.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(self, request: Any = None) -> None:
+        super().__init__(request)
+        self.received = 0
+        self.file: Optional[HashedTemporaryUploadedFile] = None
+        self.sha256 = hashlib.sha256()
+        self.header = b''
+
+    def handle_raw_input(
+        self, input_data: Any, META: Any, content_length: int, boundary: Any, encoding: Optional[str] = None
+    ) -> None:
+        if content_length > settings.UPLOAD_MAX_REQUEST_SIZE:
+            raise RequestDataTooBig("업로드 요청이 허용된 크기를 초과했습니다.")
+
+    def new_file(self, *args: Any, **kwargs: Any) -> None:
+        super().new_file(*args, **kwargs)
+        self.file = HashedTemporaryUploadedFile(
+            self.file_name or '', self.content_type, 0, self.charset, self.content_type_extra
+        )
+        self.sha256 = hashlib.sha256()
+        self.header = b''
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> None:
+        assert self.file is not None
+        self.received += len(raw_data)
+        if self.received > settings.UPLOAD_MAX_REQUEST_SIZE:
+            raise RequestDataTooBig("업로드 요청이 허용된 크기를 초과했습니다.")
+        if len(self.header) < SIGNATURE_LENGTH:
+            self.header += raw_data[:SIGNATURE_LENGTH - len(self.header)]
+        self.sha256.update(raw_data)
+        self.file.write(raw_data)
+        return None
+
+    def file_complete(self, file_size: int) -> Optional[UploadedFile]:
+        assert self.file is not None
+        self.file.seek(0)
+        self.file.size = file_size
+        self.file.content_sha256 = self.sha256.hexdigest()
+        self.file.image_type = detect_image_type(self.header)
+        return self.file
+
+    def upload_interrupted(self) -> None:
+        if self.file is not None:
+            self.file.close()
@@ -1,16 +1,33 @@
 from django.urls import path
 
+from products.views.admin.bulk import ProductExportView, ProductImportView
 from products.views.admin.create_update import ProductCreateView, ProductUpdateView
-from products.views.admin.delete_image import DeleteProductImageView
+from products.views.admin.delete_image import (
+    DeleteProductImageView,
+    PurgeProductImageView,
+)
 from products.views.admin.detail_or_list import ProductListView
-from products.views.products import ProductsDetailView
+from products.views.admin.page_cache import PageCacheStatsView
+from products.views.category import CategoryProductListView
+from products.views.products import LegacyProductRedirectView, ProductsDetailView
+from products.views.search import ProductSearchView
 
 urlpatterns = [
-    path("<str:product_name>", ProductsDetailView.as_view(), name="products-detail"),
+    path("search/", ProductSearchView.as_view(), name="product-search"),
+    path("category/<int:category_id>/", CategoryProductListView.as_view(), name="products-category"),
+    path("detail/<str:slug>/", ProductsDetailView.as_view(), name="products-detail"),
+    path("<str:product_name>", LegacyProductRedirectView.as_view(), name="products-detail-legacy"),
     
     # 어드민 URL
     path("admin_page/", ProductListView.as_view(), name="product-list"),
     path("admin/create/", ProductCreateView.as_view(), name="product-create"),
     path("admin/<int:pk>/update/", ProductUpdateView.as_view(), name="product-update"),
     path("admin/image/<int:image_id>/delete/", DeleteProductImageView.as_view(), name="product-delete-image"),
+    path(
+        "admin/<int:pk>/image/<int:image_id>/delete/", DeleteProductImageView.as_view(), name="product-unlink-image"
+    ),
+    path("admin/image/<int:image_id>/purge/", PurgeProductImageView.as_view(), name="product-purge-image"),
+    path("admin/import/", ProductImportView.as_view(), name="product-import"),
+    path("admin/export/", ProductExportView.as_view(), name="product-export"),
+    path("admin/page-cache/stats/", PageCacheStatsView.as_view(), name="product-page-cache-stats"),
 ]
\ No newline at end of file
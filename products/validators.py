@@ -0,0 +1,26 @@
+from decimal import Decimal
+from typing import Optional, Union
+
+from django.core.exceptions import ValidationError
+
+# ProductForm.clean_* 와 대량 등록(bulk_import)이 함께 쓰는 상품 필드 검증 규칙
+Number = Union[int, float, Decimal]
+
+
+def validate_price(price: Number) -> None:
+    if price <= 0:
+        raise ValidationError("가격은 0보다 커야 합니다.")
+
+
+def validate_stock(stock: int) -> None:
+    if stock < 0:
+        raise ValidationError("재고는 0 이상이어야 합니다.")
+
+
+def validate_sale_price(sale_price: Optional[Number], price: Optional[Number]) -> None:
+    if sale_price is None:
+        return
+    if sale_price <= 0:
+        raise ValidationError("할인가격은 0보다 커야 합니다.")
+    if price and sale_price >= price:
+        raise ValidationError("할인가격은 정가보다 낮아야 합니다.")
@@ -0,0 +1,76 @@
+import io
+import json
+import os
+from typing import IO, Iterator, cast
+
+from django.db import DatabaseError
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.shortcuts import render
+from django.utils import timezone
+from django.views import View
+
+from config.db_router import mark_written
+from products.services.bulk_import import (
+    FORMATS,
+    ProductImportService,
+    export_rows,
+    read_rows,
+)
+from users.models import User
+from users.utils.permission import AdminPermission
+
+
+class ProductImportView(AdminPermission, View):
+    def get(self, request: HttpRequest) -> HttpResponse:
+        return render(request, 'products/admin/product_import.html', {'title': '상품 일괄 등록'})
+
+    def post(self, request: HttpRequest) -> HttpResponse | StreamingHttpResponse:
+        upload = request.FILES.get('file')
+        if upload is None:
+            context = {'title': '상품 일괄 등록', 'error': '가져올 파일을 선택해주세요.'}
+            return render(request, 'products/admin/product_import.html', context, status=400)
+        fmt = request.POST.get('format') or ''
+        if fmt not in FORMATS:
+            fmt = 'jsonl' if os.path.splitext(upload.name or '')[1] in ('.jsonl', '.ndjson') else 'csv'
+
+        service = ProductImportService(cast(User, request.user))
+        # 쓰기는 미들웨어를 지난 뒤 응답을 흘려보내면서 일어나므로 지금 db_pin 쿠키를 받게 한다
+        mark_written()
+
+        def events() -> Iterator[str]:
+            # 업로드는 임시 파일에 있으므로 한 줄씩 읽으며 배치마다 진행 상황을 한 줄(JSON)씩 보낸다
+            stream = io.TextIOWrapper(cast(IO[bytes], upload.file), encoding='utf-8-sig', newline='')
+            reported = 0
+            try:
+                for progress in service.iter_batches(read_rows(stream, fmt)):
+                    for batch_error in progress.batch_errors[reported:]:
+                        yield json.dumps({'batch_error': batch_error.as_dict()}, ensure_ascii=False) + '\n'
+                    reported = len(progress.batch_errors)
+                    yield json.dumps({
+                        'processed': progress.processed, 'created': progress.created, 'failed': progress.failed,
+                    }) + '\n'
+            except DatabaseError as error:
+                # 응답이 이미 나가고 있으므로 연결 오류 등은 마지막 줄로 알리고 멈춘다
+                yield json.dumps(
+                    {'done': True, 'aborted': str(error).strip(), **service.result.as_dict()}, ensure_ascii=False
+                ) + '\n'
+                return
+            yield json.dumps({'done': True, **service.result.as_dict()}, ensure_ascii=False) + '\n'
+
+        response = StreamingHttpResponse(events(), content_type='application/x-ndjson; charset=utf-8')
+        # nginx 가 응답을 모아 두지 않고 바로 흘려보내도록 한다
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+
+class ProductExportView(AdminPermission, View):
+    CONTENT_TYPES = {'csv': 'text/csv; charset=utf-8', 'jsonl': 'application/x-ndjson; charset=utf-8'}
+
+    def get(self, request: HttpRequest) -> StreamingHttpResponse:
+        fmt = request.GET.get('format', 'csv')
+        if fmt not in FORMATS:
+            fmt = 'csv'
+        response = StreamingHttpResponse(export_rows(fmt), content_type=self.CONTENT_TYPES[fmt])
+        filename = f"products-{timezone.localdate():%Y%m%d}.{fmt}"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
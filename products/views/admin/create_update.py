@@ -1,11 +1,13 @@
 from typing import cast
 
+from django.db import transaction
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views import View
 
 from products.forms.product_form import ProductForm, ProductImageForm
-from products.models import Product, ProductImage
+from products.models import Product
+from products.services.gallery import ProductGalleryService
 from users.models import User
 from users.utils.permission import AdminPermission
 
@@ -26,16 +28,15 @@ class ProductCreateView(AdminPermission, View):
         image_form = ProductImageForm(request.POST, request.FILES)
         
         if form.is_valid() and image_form.is_valid():
-            product = form.save(commit=False)
-            product.user = cast(User, request.user)
-            product.save()
-            
-            # 이미지 처리 (이미지가 있는 경우에만)
-            images = request.FILES.getlist('image')
-            if images:
-                for image in images:
-                    product_image = ProductImage.objects.create(image=image)
-                    product.image.add(product_image)
+            # 이미지 저장이 실패하면 상품도 만들지 않도록 한 트랜잭션으로 묶는다
+            with transaction.atomic():
+                product = form.save(commit=False)
+                product.user = cast(User, request.user)
+                product.save()
+
+                # 이미지 처리 (이미지가 있는 경우에만)
+                images = request.FILES.getlist('image')
+                ProductGalleryService.attach_images(product, images)
             
             return redirect('product-list')
         
@@ -66,14 +67,12 @@ class ProductUpdateView(AdminPermission, View):
         image_form = ProductImageForm(request.POST, request.FILES)
         
         if form.is_valid() and image_form.is_valid():
-            form.save()
-            
-            # 새 이미지 추가 (이미지가 있는 경우에만)
-            images = request.FILES.getlist('image')
-            if images:
-                for image in images:
-                    product_image = ProductImage.objects.create(image=image)
-                    product.image.add(product_image)
+            with transaction.atomic():
+                form.save()
+
+                # 새 이미지 추가 (이미지가 있는 경우에만)
+                images = request.FILES.getlist('image')
+                ProductGalleryService.attach_images(product, images)
             
             return redirect('product-list')
         
@@ -1,17 +1,34 @@
+from typing import Optional
 
 from django.http import Http404, HttpRequest, JsonResponse
 from django.shortcuts import get_object_or_404
 from django.views import View
 
-from products.models import ProductImage
+from products.models import Product, ProductImage
+from products.services.gallery import ProductGalleryService
 from users.utils.permission import AdminPermission
 
 
 class DeleteProductImageView(AdminPermission, View):
-    def delete(self, request: HttpRequest, image_id: int) -> JsonResponse:
+    def delete(self, request: HttpRequest, image_id: int, pk: Optional[int] = None) -> JsonResponse:
         try:
             image = get_object_or_404(ProductImage, id=image_id)
-            image.delete()
+            if pk is None:
+                # 상품을 지정하지 않은 예전 경로: 이미지를 쓰는 상품이 하나뿐일 때만 그 상품에서 떼어낸다
+                product_ids = list(Product.objects.filter(image=image).values_list('pk', flat=True)[:2])
+                if len(product_ids) > 1:
+                    return JsonResponse(
+                        {'success': False, 'message': '여러 상품이 함께 쓰는 이미지입니다. 상품별로 삭제해 주세요.'},
+                        status=409,
+                    )
+                if product_ids:
+                    ProductGalleryService.unlink_image(Product.objects.get(pk=product_ids[0]), image)
+                else:
+                    ProductGalleryService.delete_image(image)
+            else:
+                # 여러 상품이 공유하는 이미지이므로 해당 상품과의 연결만 끊는다
+                product = get_object_or_404(Product, pk=pk)
+                ProductGalleryService.unlink_image(product, image)
             return JsonResponse({'success': True, 'message': '이미지가 삭제되었습니다.'})
         except Http404:
             return JsonResponse({'success': False, 'message': '이미지를 찾을 수 없습니다.'}, status=404)
@@ -19,3 +36,12 @@ class DeleteProductImageView(AdminPermission, View):
             return JsonResponse({'success': False, 'message': f'삭제 중 오류가 발생했습니다: {str(e)}'}, status=500)
 
 
+class PurgeProductImageView(AdminPermission, View):
+    def delete(self, request: HttpRequest, image_id: int) -> JsonResponse:
+        # 이미지를 쓰는 모든 상품에서 지우는 명시적인 관리자 작업
+        image = ProductImage.objects.filter(id=image_id).first()
+        if image is None:
+            return JsonResponse({'success': False, 'message': '이미지를 찾을 수 없습니다.'}, status=404)
+        product_count = Product.objects.filter(image=image).count()
+        ProductGalleryService.delete_image(image)
+        return JsonResponse({'success': True, 'message': f'{product_count}개 상품에서 이미지가 삭제되었습니다.'})
@@ -3,14 +3,20 @@ from django.shortcuts import render
 from django.views import View
 
 from products.models import Product
+from products.services.pagination import KeysetPaginator
+from products.services.storefront import StorefrontService
 from users.utils.permission import AdminPermission
 
 
 class ProductListView(AdminPermission, View):
+    PAGE_SIZE = 50
+
     def get(self, request: HttpRequest) -> HttpResponse:
-        products = Product.objects.all().order_by('-created_at')
+        products = StorefrontService.with_primary_image(Product.objects.all())
+        page = KeysetPaginator(products, self.PAGE_SIZE).page(request.GET.get('cursor'))
         context = {
-            'products': products,
+            'products': page.items,
+            'page': page,
             'title': '상품 목록'
         }
         return render(request, 'products/admin/product_create.html', context)
@@ -0,0 +1,15 @@
+from django.http import HttpRequest, JsonResponse
+from django.views import View
+
+from products.services.page_cache import StorefrontPageCache
+from users.utils.permission import AdminPermission
+
+
+class PageCacheStatsView(AdminPermission, View):
+    def get(self, request: HttpRequest) -> JsonResponse:
+        stats = StorefrontPageCache.stats()
+        total = stats['hits'] + stats['misses']
+        return JsonResponse({
+            **stats,
+            'hit_rate': round(stats['hits'] / total, 4) if total else 0.0,
+        })
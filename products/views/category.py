@@ -0,0 +1,25 @@
+from django.http import Http404, HttpRequest, HttpResponse
+from django.shortcuts import render
+from django.utils.decorators import method_decorator
+from django.views import View
+
+from categories.services.tree import CategoryTree
+from config.db_router import replica_reads
+from products.services.storefront import StorefrontService
+
+
+@method_decorator(replica_reads, name='get')
+class CategoryProductListView(View):
+    def get(self, request: HttpRequest, category_id: int) -> HttpResponse:
+        category = CategoryTree.get(category_id)
+        if category is None:
+            raise Http404("카테고리를 찾을 수 없습니다.")
+
+        page = StorefrontService.category_products_page(category_id, request.GET.get('cursor'))
+        context = {
+            'category': category,
+            'ancestors': CategoryTree.ancestors(category_id),
+            'products': page.items,
+            'page': page,
+        }
+        return render(request, 'products/category.html', context)
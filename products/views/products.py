@@ -1,13 +1,41 @@
+from asgiref.sync import sync_to_async
+from django.http import Http404
 from django.http.request import HttpRequest
 from django.http.response import HttpResponse
-from django.shortcuts import get_object_or_404, render
+from django.shortcuts import redirect, render
+from django.utils.decorators import method_decorator
 from django.views.generic.base import View
 
+from config.db_router import replica_reads
 from products.models import Product
+from products.services.page_cache import StorefrontPageCache, storefront_page_cache
+from products.services.storefront import StorefrontService
 
 
+@method_decorator(replica_reads, name='get')
+@method_decorator(
+    storefront_page_cache(lambda request, slug: StorefrontPageCache.detail_key(slug)), name='get'
+)
 class ProductsDetailView(View):
-    def get(self, request: HttpRequest, product_name: str) -> HttpResponse:
-        products = get_object_or_404(Product, name=product_name)
+    async def get(self, request: HttpRequest, slug: str) -> HttpResponse:
+        try:
+            products = await StorefrontService.with_gallery(Product.objects.all()).aget(slug=slug)
+        except Product.DoesNotExist:
+            raise Http404("상품을 찾을 수 없습니다.")
         context = {"products": products}
-        return render(request, "products/detail.html", context)
\ No newline at end of file
+        # 템플릿이 request.user(세션 조회)를 읽으므로 렌더링은 스레드에서 한다
+        return await sync_to_async(render)(request, "products/detail.html", context)
+
+
+class LegacyProductRedirectView(View):
+    """상품명 기반의 예전 상세 URL 을 slug URL 로 영구 이동"""
+
+    def get(self, request: HttpRequest, product_name: str) -> HttpResponse:
+        # 상품명 최대 길이를 넘는 경로는 조회하지 않는다
+        max_length = Product._meta.get_field('name').max_length or 100
+        if len(product_name) > max_length:
+            raise Http404("상품을 찾을 수 없습니다.")
+        product = Product.objects.filter(name=product_name).order_by('id').only('slug').first()
+        if product is None:
+            raise Http404("상품을 찾을 수 없습니다.")
+        return redirect('products-detail', slug=product.slug, permanent=True)
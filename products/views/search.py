@@ -0,0 +1,19 @@
+from django.core.paginator import Paginator
+from django.http import HttpRequest, HttpResponse
+from django.shortcuts import render
+from django.views import View
+
+from products.services.search import ProductSearchService
+
+
+class ProductSearchView(View):
+    def get(self, request: HttpRequest) -> HttpResponse:
+        query = ProductSearchService.normalize(request.GET.get('q', ''))
+        paginator = Paginator(ProductSearchService.search(query), ProductSearchService.PAGE_SIZE)
+        page = paginator.get_page(request.GET.get('page'))
+        context = {
+            'query': query,
+            'page': page,
+            'products': page.object_list,
+        }
+        return render(request, 'products/search.html', context)
@@ -0,0 +1,14 @@
+from typing import Any
+
+from django.http import HttpRequest
+from django.utils.functional import SimpleLazyObject
+
+from users.services.principal import PrincipalService
+
+
+def principal(request: HttpRequest) -> dict[str, Any]:
+    """템플릿이 request.user 대신 세션의 권한 요약으로 로그인/관리자 메뉴를 그리게 한다
+
+    로그인하지 않았으면 거짓이고, 쓰지 않는 템플릿에서는 만들지 않도록 처음 읽을 때 만든다.
+    """
+    return {'principal': SimpleLazyObject(lambda: PrincipalService.get(request))}
@@ -0,0 +1,66 @@
+import statistics
+import time
+from typing import Any, Callable
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from users.models import User
+from users.services.username import UsernameAllocator
+
+
+def legacy_next_free(base: str) -> str:
+    # 이전 방식: 충돌할 때마다 exists() 쿼리를 한 번씩 보낸다
+    username = base
+    counter = 1
+    while User.objects.filter(username=username).exists():
+        username = f"{base}_{counter}"
+        counter += 1
+    return username
+
+
+class Command(BaseCommand):
+    help = '같은 이름의 사용자를 대량으로 만들어 소셜 가입 username 할당 시간을 측정합니다 (측정 후 롤백)'
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument('--base', default='kim')
+        parser.add_argument('--collisions', type=int, default=5_000, help='base, base_1 ... 로 미리 만들 사용자 수')
+        parser.add_argument('--batch-size', type=int, default=2_000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--skip-legacy', action='store_true', help='이전 방식(충돌마다 쿼리) 측정을 건너뛴다')
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        with transaction.atomic():
+            self._seed(options['base'], options['collisions'], options['batch_size'])
+            self._measure('allocator', UsernameAllocator.next_free, options['base'], options['repeat'])
+            if not options['skip_legacy']:
+                self._measure('legacy', legacy_next_free, options['base'], 1)
+            transaction.set_rollback(True)
+
+    def _seed(self, base: str, count: int, batch_size: int) -> None:
+        started = time.perf_counter()
+        usernames = [base] + [f'{base}_{number}' for number in range(1, count)]
+        for offset in range(0, count, batch_size):
+            User.objects.bulk_create([
+                User(
+                    username=username,
+                    email=f'bench_username_{offset + index}@example.com',
+                    personal_info_consent=True,
+                    terms_of_use=True,
+                )
+                for index, username in enumerate(usernames[offset:offset + batch_size])
+            ])
+        self.stdout.write(f'{count}명 생성: {time.perf_counter() - started:.1f}s ({connection.vendor})')
+
+    def _measure(self, label: str, allocate: Callable[[str], str], base: str, repeat: int) -> None:
+        timings = []
+        for _ in range(repeat):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                username = allocate(base)
+                timings.append((time.perf_counter() - started) * 1000)
+        self.stdout.write(
+            f'{label:<10} {username}  평균 {statistics.mean(timings):8.2f}ms  '
+            f'최소 {min(timings):8.2f}ms  쿼리 {len(queries)}회'
+        )
@@ -0,0 +1,65 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+from users.models import User
+
+FIELDS = ('username', 'email')
+
+
+class AvailabilityService:
+    """회원가입 중 아이디/이메일 사용 가능 여부 조회
+
+    요청한 값을 한 번의 쿼리로 확인하고 결과를 USER_AVAILABILITY_CACHE_SECONDS 동안 캐시해
+    입력 중 같은 값을 다시 물어도 DB 에 가지 않는다. 사용자가 저장되거나 삭제되면
+    시그널로 해당 값의 캐시를 바로 고친다.
+    """
+
+    KEY_PREFIX = 'availability'
+
+    @classmethod
+    def _key(cls, field: str, value: str) -> str:
+        # 이메일이 캐시 키에 그대로 남지 않도록 해시한다
+        return f'{cls.KEY_PREFIX}:{field}:{hashlib.sha256(value.encode()).hexdigest()[:32]}'
+
+    @staticmethod
+    def _available(values: dict[str, str], rows: list[tuple[str, str]]) -> dict[str, bool]:
+        return {
+            field: not any(row[FIELDS.index(field)] == value for row in rows)
+            for field, value in values.items()
+        }
+
+    @staticmethod
+    def _lookup(values: dict[str, str]) -> Q:
+        condition = Q()
+        for field, value in values.items():
+            condition |= Q(**{field: value})
+        return condition
+
+    @classmethod
+    async def acheck(cls, values: dict[str, str]) -> dict[str, bool]:
+        """{필드: 값} 을 받아 {필드: 사용 가능 여부} 를 돌려준다"""
+        keys = {field: cls._key(field, value) for field, value in values.items()}
+        cached = await cache.aget_many(list(keys.values()))
+        result = {field: cached[key] for field, key in keys.items() if key in cached}
+
+        missing = {field: value for field, value in values.items() if field not in result}
+        if missing:
+            # 아이디와 이메일은 각각 unique 라 많아야 두 행이다
+            queryset = User.objects.filter(cls._lookup(missing)).values_list(*FIELDS)[:len(missing)]
+            fresh = cls._available(missing, [row async for row in queryset])
+            await cache.aset_many(
+                {keys[field]: available for field, available in fresh.items()},
+                settings.USER_AVAILABILITY_CACHE_SECONDS,
+            )
+            result.update(fresh)
+        return result
+
+    @classmethod
+    def mark(cls, user: User, available: bool) -> None:
+        cache.set_many(
+            {cls._key(field, getattr(user, field)): available for field in FIELDS if getattr(user, field)},
+            settings.USER_AVAILABILITY_CACHE_SECONDS,
+        )
@@ -0,0 +1,129 @@
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, Optional, cast
+
+from django.core.cache import cache
+from google.auth import jwt
+
+from config.http_client import http_client
+
+logger = logging.getLogger(__name__)
+
+MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+
+class GoogleCertCache:
+    """Google ID 토큰 서명 인증서(kid -> PEM) 캐시
+
+    Cache-Control max-age 동안 프로세스 메모리와 공유 캐시에 보관해 로그인마다 인증서를 받지 않는다.
+    만료 REFRESH_MARGIN 초 전(max-age 가 짧으면 절반이 지난 뒤)부터는 요청 스레드를 막지 않고
+    백그라운드에서 미리 갱신한다.
+    토큰의 kid 가 캐시에 없으면 (키 교체 직후) MIN_FORCED_REFRESH_INTERVAL 에 한 번만 바로 다시 받는다.
+    """
+
+    CERTS_URL = 'https://www.googleapis.com/oauth2/v1/certs'
+    CACHE_KEY = 'google_oauth2:certs'
+    DEFAULT_MAX_AGE = 3600
+    REFRESH_MARGIN = 300
+    MIN_FORCED_REFRESH_INTERVAL = 60
+
+    _lock = threading.Lock()
+    _certs: Dict[str, str] = {}
+    _expires_at = 0.0
+    _refresh_at = 0.0
+    _refreshing = False
+    _forced_at = 0.0
+
+    @staticmethod
+    def _max_age(cache_control: str) -> int:
+        match = MAX_AGE_RE.search(cache_control or '')
+        return int(match.group(1)) if match else GoogleCertCache.DEFAULT_MAX_AGE
+
+    @classmethod
+    def _use(cls, certs: Dict[str, str], expires_at: float, refresh_at: float) -> None:
+        cls._certs, cls._expires_at, cls._refresh_at = certs, expires_at, refresh_at
+
+    @classmethod
+    def _fetch(cls) -> Dict[str, str]:
+        response = http_client.get(cls.CERTS_URL)
+        response.raise_for_status()
+        certs = cast(Dict[str, str], response.json())
+        max_age = cls._max_age(response.headers.get('Cache-Control', ''))
+        expires_at = time.time() + max_age
+        refresh_at = expires_at - min(cls.REFRESH_MARGIN, max_age / 2)
+        cls._use(certs, expires_at, refresh_at)
+        cache.set(cls.CACHE_KEY, {'certs': certs, 'expires_at': expires_at, 'refresh_at': refresh_at}, max_age)
+        return certs
+
+    @classmethod
+    def _load_shared(cls) -> bool:
+        shared: Optional[Dict[str, Any]] = cache.get(cls.CACHE_KEY)
+        if shared and shared['expires_at'] > time.time():
+            cls._use(shared['certs'], shared['expires_at'], shared['refresh_at'])
+            return True
+        return False
+
+    @classmethod
+    def _refresh_in_background(cls) -> None:
+        with cls._lock:
+            if cls._refreshing:
+                return
+            cls._refreshing = True
+
+        def refresh() -> None:
+            try:
+                # 다른 프로세스가 이미 갱신했으면 받아 오지 않는다
+                if not cls._load_shared() or time.time() >= cls._refresh_at:
+                    cls._fetch()
+            except Exception:
+                logger.exception("Google 인증서 백그라운드 갱신 실패")
+            finally:
+                cls._refreshing = False
+
+        threading.Thread(target=refresh, name='google-certs', daemon=True).start()
+
+    @classmethod
+    def certs(cls) -> Dict[str, str]:
+        now = time.time()
+        if now >= cls._expires_at and not cls._load_shared():
+            with cls._lock:
+                # 같은 프로세스의 다른 스레드가 먼저 받아 왔을 수 있다
+                if time.time() >= cls._expires_at:
+                    cls._fetch()
+        elif now >= cls._refresh_at:
+            certs = cls._certs
+            cls._refresh_in_background()
+            return certs
+        return cls._certs
+
+    @classmethod
+    def certs_for(cls, key_id: Optional[str]) -> Dict[str, str]:
+        certs = cls.certs()
+        if key_id and key_id not in certs:
+            with cls._lock:
+                if key_id not in cls._certs and time.time() - cls._forced_at >= cls.MIN_FORCED_REFRESH_INTERVAL:
+                    cls._forced_at = time.time()
+                    cls._fetch()
+            certs = cls._certs
+        return certs
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._use({}, 0.0, 0.0)
+        cls._forced_at = 0.0
+        cache.delete(cls.CACHE_KEY)
+
+
+def verify_id_token(token: str, audience: str, clock_skew_in_seconds: int = 10) -> Dict[str, Any]:
+    """캐시한 인증서로 서명, 만료, aud 를 로컬에서 검증하고 페이로드를 돌려준다. 실패하면 ValueError"""
+    header: Dict[str, Any] = jwt.decode_header(token)  # type: ignore[no-untyped-call]
+    key_id = header.get('kid')
+    payload = jwt.decode(  # type: ignore[no-untyped-call]
+        token,
+        certs=GoogleCertCache.certs_for(key_id),
+        audience=audience,
+        clock_skew_in_seconds=clock_skew_in_seconds,
+    )
+    return cast(Dict[str, Any], payload)
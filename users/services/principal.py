@@ -0,0 +1,88 @@
+import time
+import uuid
+from typing import Any, Optional, cast
+
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.core.cache import cache
+from django.http import HttpRequest
+
+from users.models import User
+
+# 권한 판단에 쓰는 값과, 바뀌면 세션에 저장한 요약을 버려야 하는 값
+FLAGS = ('is_active', 'is_staff', 'is_superuser')
+INVALIDATING_FIELDS = frozenset(('role', 'password', *FLAGS))
+
+
+class PrincipalService:
+    """로그인 사용자의 권한 요약(id, role, 권한 플래그)을 세션에 저장해 권한 확인마다 users 를 읽지 않는다
+
+    요약에는 사용자별 버전 토큰을 함께 저장하고, role/비밀번호/권한 플래그가 바뀌면 시그널로
+    공유 캐시의 토큰을 바꿔 다음 요청에서 DB 로 다시 만든다. 이때 request.user 를 읽으므로
+    비밀번호 변경으로 무효가 된 세션도 평소처럼 로그아웃된다.
+    토큰은 워커끼리 공유해야 하므로 USER_PRINCIPAL_CACHE_ENABLED(공유 캐시일 때 기본값)가 꺼져 있으면
+    저장하지 않고 매번 request.user 로 판단한다. queryset.update() 처럼 시그널이 없는 변경에 대비해
+    USER_PRINCIPAL_MAX_AGE 초가 지난 요약도 다시 만든다.
+    """
+
+    SESSION_KEY = '_principal'
+    VERSION_KEY_PREFIX = 'principal:version'
+
+    @classmethod
+    def _version_key(cls, user_id: Any) -> str:
+        return f'{cls.VERSION_KEY_PREFIX}:{user_id}'
+
+    @classmethod
+    def _version(cls, user_id: Any) -> str:
+        key = cls._version_key(user_id)
+        # 다른 요청이 먼저 만들었으면 그 토큰을 쓴다
+        cache.add(key, uuid.uuid4().hex, None)
+        return str(cache.get(key))
+
+    @classmethod
+    def invalidate(cls, user_id: Any) -> None:
+        cache.set(cls._version_key(user_id), uuid.uuid4().hex, None)
+
+    @staticmethod
+    def build(user: User, version: str = '') -> dict[str, Any]:
+        return {
+            'id': str(user.pk),
+            'role': user.role,
+            **{flag: getattr(user, flag) for flag in FLAGS},
+            'version': version,
+            'checked_at': time.time(),
+        }
+
+    @classmethod
+    def _is_fresh(cls, principal: Any, user_id: Any) -> bool:
+        return (
+            isinstance(principal, dict)
+            and principal.get('id') == str(user_id)
+            and time.time() - principal.get('checked_at', 0) < settings.USER_PRINCIPAL_MAX_AGE
+            and principal.get('version') == cache.get(cls._version_key(user_id))
+        )
+
+    @classmethod
+    def get(cls, request: HttpRequest) -> Optional[dict[str, Any]]:
+        """로그인하지 않았으면 None"""
+        session = getattr(request, 'session', None)
+        if session is None or not settings.USER_PRINCIPAL_CACHE_ENABLED:
+            # 세션이 없는 요청(RequestFactory 등)이나 공유 캐시가 없을 때는 매번 사용자에게서 만든다
+            user = cast(User, request.user)
+            return cls.build(user) if user.is_authenticated else None
+
+        user_id = session.get(SESSION_KEY)
+        if user_id is None:
+            return None
+        principal = session.get(cls.SESSION_KEY)
+        if cls._is_fresh(principal, user_id):
+            return cast(dict[str, Any], principal)
+
+        # 사용자를 읽기 전에 토큰을 가져와야 그 사이의 변경이 다음 요청에서 반영된다
+        version = cls._version(user_id)
+        user = cast(User, request.user)
+        if not user.is_authenticated:
+            return None
+        principal = cls.build(user, version)
+        session[cls.SESSION_KEY] = principal
+        return principal
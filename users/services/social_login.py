@@ -1,41 +1,27 @@
 
 import logging
-from typing import Any, Dict, Optional, Tuple, cast
+from typing import Any, Dict, Optional, Tuple
 
 import requests
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.db import transaction
-from google.auth.transport import requests as google_requests
-from google.oauth2 import id_token
 
+from config.http_client import http_client
 from users.models import User
+from users.services.google_certs import verify_id_token
+from users.services.username import UsernameAllocator
 
 logger = logging.getLogger(__name__)
 
 
 class GoogleLoginService:
 
-    @staticmethod
-    def _generate_unique_username(email: str) -> str:
-        base_username = email.split('@')[0]
-        username = base_username
-        counter = 1
-        
-        while User.objects.filter(username=username).exists():
-            username = f"{base_username}_{counter}"
-            counter += 1
-
-        return username
-
     @staticmethod
     def verify_google_token(credential: str) -> Optional[Dict[str, Any]]:
         try:
-            request = google_requests.Request()  # type: ignore
-            idinfo = cast(Dict[str, Any], id_token.verify_oauth2_token(  # type: ignore
-                credential, 
-                request, 
-                settings.GOOGLE_OAUTH2_CLIENT_ID
-            ))
+            # 서명 인증서는 캐시해 두고 로컬에서 검증하므로 로그인마다 Google 에 요청하지 않는다
+            idinfo = verify_id_token(credential, settings.GOOGLE_OAUTH2_CLIENT_ID)
             
             if idinfo['iss'] not in ['accounts.google.com', 'https://accounts.google.com']:
                 raise ValueError('Wrong issuer.')
@@ -76,10 +62,10 @@ class GoogleLoginService:
                     pass
                 
                 # 3. 새 사용자 생성
-                username = GoogleLoginService._generate_unique_username(email)
-                user = User.objects.create_user(
+                # username 은 이메일 앞부분, 이미 있으면 _1, _2 ... 를 붙인다
+                user = UsernameAllocator.create_user(
+                    email.split('@')[0],
                     #TODO: 추후 배송수령인 데이터 이용
-                    username=username,
                     email=email,
                     password=None,  # 소셜 로그인은 비밀번호 없음
                     google_id=google_id,
@@ -118,46 +104,61 @@ class GoogleLoginService:
 
 
 class KakaoLoginService:
+    TOKEN_URL = 'https://kauth.kakao.com/oauth/token'
+    USER_INFO_URL = 'https://kapi.kakao.com/v2/user/me'
 
     @staticmethod
-    def _generate_unique_username(nickname: str) -> str:
-        base_username = nickname
-        username = base_username
-        counter = 1
-        
-        while User.objects.filter(username=username).exists():
-            username = f"{base_username}_{counter}"
-            counter += 1
-            
-        return username
+    def _parse_user_info(response: requests.Response) -> Optional[Dict[str, Any]]:
+        if response.status_code != 200:
+            logger.error(f"Kakao API error: {response.status_code} - {response.text}")
+            return None
+        data = response.json()
+        if isinstance(data, dict):
+            return data
+        logger.error(f"Kakao API returned unexpected data type: {type(data)}")
+        return None
 
-    @staticmethod
-    def get_kakao_user_info(access_token: str) -> Optional[Dict[str, Any]]:
+    @classmethod
+    def get_kakao_user_info(cls, access_token: str) -> Optional[Dict[str, Any]]:
         try:
             # 카카오 사용자 정보 API 호출
-            headers = {
-                'Authorization': f'Bearer {access_token}'
-            }
-            response = requests.get(
-                'https://kapi.kakao.com/v2/user/me',
-                headers=headers
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                if isinstance(data, dict):
-                    return data
-                else:
-                    logger.error(f"Kakao API returned unexpected data type: {type(data)}")
-                    return None
-            else:
-                logger.error(f"Kakao API error: {response.status_code} - {response.text}")
-                return None
-                
+            response = http_client.get(cls.USER_INFO_URL, headers={'Authorization': f'Bearer {access_token}'})
+            return cls._parse_user_info(response)
+        except Exception as e:
+            logger.error(f"Kakao user info error: {e}")
+            return None
+
+    @classmethod
+    async def aget_kakao_user_info(cls, access_token: str) -> Optional[Dict[str, Any]]:
+        try:
+            response = await http_client.aget(cls.USER_INFO_URL, headers={'Authorization': f'Bearer {access_token}'})
+            return cls._parse_user_info(response)
         except Exception as e:
             logger.error(f"Kakao user info error: {e}")
             return None
 
+    @classmethod
+    async def aexchange_code(cls, code: str) -> Tuple[Optional[str], Optional[str]]:
+        """인가 코드를 액세스 토큰으로 교환한다. (액세스 토큰, 오류 메시지) 를 돌려준다
+
+        연결 실패나 timeout 은 requests.RequestException 으로 올린다.
+        """
+        response = await http_client.apost(cls.TOKEN_URL, data={
+            'grant_type': 'authorization_code',
+            'client_id': settings.KAKAO_REST_API_KEY,
+            'client_secret': settings.KAKAO_CLIENT_SECRET,
+            'redirect_uri': settings.KAKAO_REDIRECT_URI,
+            'code': code
+        })
+        if response.status_code != 200:
+            logger.error(f"Kakao token error: {response.status_code} - {response.text}")
+            return None, "액세스 토큰 획득에 실패했습니다."
+
+        access_token = response.json().get('access_token')
+        if not access_token:
+            return None, "액세스 토큰이 없습니다."
+        return access_token, None
+
     @staticmethod
     def get_or_create_user(kakao_user_info: Dict[str, Any]) -> User:
         try:
@@ -189,10 +190,8 @@ class KakaoLoginService:
                         pass
                 
                 # 3. 새 사용자 생성 (닉네임을 username으로 사용)
-                username = KakaoLoginService._generate_unique_username(nickname) if nickname else f"kakao_{kakao_id}"
-                
-                user = User.objects.create_user(
-                    username=username,
+                user = UsernameAllocator.create_user(
+                    nickname or f"kakao_{kakao_id}",
                     email=email or f"kakao_{kakao_id}@kakao.com",  # 이메일이 없으면 임시 이메일 생성
                     password=None,  # 소셜 로그인은 비밀번호 없음
                     kakao_id=kakao_id,
@@ -228,3 +227,15 @@ class KakaoLoginService:
             return user, None
         except Exception as e:
             return None, str(e)
+
+    @classmethod
+    async def aauthenticate_user(cls, access_token: str) -> Tuple[Optional[User], Optional[str]]:
+        try:
+            kakao_user_info = await cls.aget_kakao_user_info(access_token)
+            if not kakao_user_info:
+                return None, "카카오 사용자 정보 조회에 실패했습니다."
+
+            user = await sync_to_async(cls.get_or_create_user)(kakao_user_info)
+            return user, None
+        except Exception as e:
+            return None, str(e)
@@ -0,0 +1,62 @@
+import re
+import secrets
+from typing import Any
+
+from django.db import IntegrityError, transaction
+from django.db.models import BigIntegerField, Case, Count, Max, Q, When
+from django.db.models.functions import Cast, Substr
+
+from users.models import User
+
+
+class UsernameAllocator:
+    """소셜 가입자의 username 을 base, base_1, base_2 ... 중 비어 있는 것으로 정한다
+
+    base 와 base_<숫자> 를 username 인덱스(접두사 검색)로 한 번에 집계해 가장 큰 접미사 + 1 을 쓴다.
+    동시에 같은 이름으로 가입해 저장이 부딪히면 다시 집계해 MAX_ATTEMPTS 번까지 재시도한다.
+    접미사가 SUFFIX_DIGITS 자리를 넘게 되면 임의 번호로 대신한다.
+    """
+
+    MAX_ATTEMPTS = 5
+    SUFFIX_DIGITS = 9
+
+    @classmethod
+    def _base(cls, base: str) -> str:
+        # 접미사가 붙어도 username 최대 길이를 넘지 않게 한다
+        max_length = User._meta.get_field('username').max_length or 150
+        return base[:max_length - cls.SUFFIX_DIGITS - 1]
+
+    @classmethod
+    def next_free(cls, base: str) -> str:
+        base = cls._base(base)
+        prefix = f'{base}_'
+        suffix = Cast(Substr('username', len(prefix) + 1), BigIntegerField())
+        counts = User.objects.filter(
+            Q(username=base)
+            | Q(username__startswith=prefix, username__regex=rf'^{re.escape(prefix)}[0-9]{{1,{cls.SUFFIX_DIGITS}}}$')
+        ).aggregate(
+            base_taken=Count('pk', filter=Q(username=base)),
+            # 숫자 접미사 행에서만 형변환한다
+            max_suffix=Max(Case(When(~Q(username=base), then=suffix))),
+        )
+        if not counts['base_taken']:
+            return base
+        suffix_number = (counts['max_suffix'] or 0) + 1
+        if suffix_number >= 10 ** cls.SUFFIX_DIGITS:
+            # 가장 큰 접미사를 누군가 선점하면 다음 번호는 집계에 잡히지 않으므로 임의 번호를 쓴다
+            suffix_number = secrets.randbelow(10 ** cls.SUFFIX_DIGITS)
+        return f"{prefix}{suffix_number}"
+
+    @classmethod
+    def create_user(cls, base: str, **fields: Any) -> User:
+        """비어 있는 username 으로 사용자를 만든다. username 이 아닌 제약 위반은 그대로 올린다"""
+        attempts = 0
+        while True:
+            username = cls.next_free(base)
+            try:
+                with transaction.atomic():
+                    return User.objects.create_user(username=username, **fields)
+            except IntegrityError:
+                attempts += 1
+                if attempts >= cls.MAX_ATTEMPTS or not User.objects.filter(username=username).exists():
+                    raise
@@ -0,0 +1,38 @@
+from typing import Any, Optional
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from users.models import User
+from users.services.availability import FIELDS, AvailabilityService
+from users.services.principal import INVALIDATING_FIELDS, PrincipalService
+
+
+@receiver(post_save, sender=User)
+def mark_username_and_email_taken(
+    sender: type[User], instance: User, update_fields: Optional[frozenset[str]] = None, **kwargs: Any
+) -> None:
+    # 로그인 시각 갱신처럼 아이디/이메일을 건드리지 않는 저장은 건너뛴다
+    if update_fields is None or update_fields & set(FIELDS):
+        # 가입이 롤백되면 이름이 사용 중으로 남지 않도록 커밋된 뒤에 반영한다
+        transaction.on_commit(lambda: AvailabilityService.mark(instance, available=False))
+
+
+@receiver(post_delete, sender=User)
+def mark_username_and_email_available(sender: type[User], instance: User, **kwargs: Any) -> None:
+    transaction.on_commit(lambda: AvailabilityService.mark(instance, available=True))
+
+
+@receiver(post_save, sender=User)
+def invalidate_principal(
+    sender: type[User], instance: User, created: bool, update_fields: Optional[frozenset[str]] = None, **kwargs: Any
+) -> None:
+    # 세션에 저장한 권한 요약은 role, 비밀번호, 권한 플래그가 바뀔 수 있는 저장에서만 버린다
+    if not created and (update_fields is None or update_fields & INVALIDATING_FIELDS):
+        PrincipalService.invalidate(instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def invalidate_deleted_principal(sender: type[User], instance: User, **kwargs: Any) -> None:
+    PrincipalService.invalidate(instance.pk)
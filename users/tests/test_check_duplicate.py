@@ -1,6 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import patch
+
 import pytest
-from django.test import Client
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import Client, RequestFactory
+from django.test.utils import CaptureQueriesContext
 
+from config.rate_limit import RateLimiter, client_ip
 from users.models import User
 
 
@@ -8,6 +16,7 @@ from users.models import User
 class TestCheckDuplicateView:
 
     def setup_method(self) -> None:
+        cache.clear()
         self.client = Client()
 
     def test_check_username_available(self) -> None:
@@ -172,3 +181,121 @@ class TestCheckDuplicateView:
         assert data['username']['message'] == '사용 가능한 아이디입니다.'
         assert data['email']['available'] is True
         assert data['email']['message'] == '사용 가능한 이메일입니다.'
+
+
+@pytest.mark.django_db
+class TestCheckDuplicateThroughput:
+
+    def setup_method(self) -> None:
+        cache.clear()
+        self.client = Client()
+        self.params = {'username': 'existing_user', 'email': 'new@example.com'}
+        User.objects.create_user(
+            username='existing_user',
+            email='existing@example.com',
+            password='testpass',
+            personal_info_consent=True,
+            terms_of_use=True
+        )
+
+    def test_both_fields_in_one_query_then_cached(self) -> None:
+        with CaptureQueriesContext(connection) as first:
+            self.client.get('/users/check-duplicate/', self.params)
+        with CaptureQueriesContext(connection) as second:
+            response = self.client.get('/users/check-duplicate/', self.params)
+
+        assert len(first) == 1
+        assert len(second) == 0
+        data = response.json()
+        assert data['username']['available'] is False
+        assert data['email']['available'] is True
+
+    def test_new_signup_updates_cached_result(self, django_capture_on_commit_callbacks: Any) -> None:
+        self.client.get('/users/check-duplicate/', self.params)
+        with django_capture_on_commit_callbacks(execute=True):
+            User.objects.create_user(
+                username='someone',
+                email='new@example.com',
+                password='testpass',
+                personal_info_consent=True,
+                terms_of_use=True
+            )
+
+        response = self.client.get('/users/check-duplicate/', self.params)
+
+        assert response.json()['email']['available'] is False
+
+    def test_rolled_back_signup_does_not_mark_taken(self) -> None:
+        self.client.get('/users/check-duplicate/', self.params)
+        with pytest.raises(RuntimeError), transaction.atomic():
+            User.objects.create_user(
+                username='someone',
+                email='new@example.com',
+                password='testpass',
+                personal_info_consent=True,
+                terms_of_use=True
+            )
+            raise RuntimeError("signup failed")
+
+        response = self.client.get('/users/check-duplicate/', self.params)
+
+        assert response.json()['email']['available'] is True
+
+    def test_rate_limited_per_ip(self, settings: Any) -> None:
+        settings.CHECK_DUPLICATE_BURST = 2
+        settings.CHECK_DUPLICATE_RATE = 0.1
+
+        statuses = [self.client.get('/users/check-duplicate/', self.params).status_code for _ in range(3)]
+        other_ip = self.client.get('/users/check-duplicate/', self.params, HTTP_X_REAL_IP='10.0.0.2')
+
+        assert statuses == [200, 200, 429]
+        assert other_ip.status_code == 200
+
+        limited = self.client.get('/users/check-duplicate/', self.params)
+        assert limited.status_code == 429
+        assert int(limited['Retry-After']) >= 1
+
+
+class TestRateLimiter:
+
+    def setup_method(self) -> None:
+        cache.clear()
+
+    def test_burst_then_average_rate(self) -> None:
+        limiter = RateLimiter('test', rate=1, capacity=2)
+        with patch('config.rate_limit.time.time', return_value=1000.0):
+            assert [limiter.take('ip') for _ in range(3)] == [0, 0, 3.0]
+        # 다음 창에서는 직전 창의 두 요청이 지난 비율만큼 줄어든다
+        with patch('config.rate_limit.time.time', return_value=1002.0):
+            assert limiter.take('ip') == 1.0
+        with patch('config.rate_limit.time.time', return_value=1003.0):
+            assert limiter.take('ip') == 0
+            assert limiter.take('ip') == 1.0
+        with patch('config.rate_limit.time.time', return_value=1004.0):
+            assert limiter.take('ip') == 0
+
+    def test_concurrent_requests_are_counted_atomically(self) -> None:
+        limiter = RateLimiter('test', rate=0.001, capacity=10)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: limiter.take('ip'), range(50)))
+
+        assert results.count(0) == 10
+
+    def test_dummy_cache_does_not_limit(self, settings: Any) -> None:
+        settings.CACHES = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+        limiter = RateLimiter('test', rate=1, capacity=1)
+        assert [limiter.take('ip') for _ in range(3)] == [0, 0, 0]
+
+
+class TestClientIp:
+
+    def test_header_is_used_only_from_trusted_proxy(self, settings: Any) -> None:
+        settings.RATE_LIMIT_TRUSTED_PROXIES = ['172.16.0.0/12']
+        rf = RequestFactory()
+
+        proxied = rf.get('/', REMOTE_ADDR='172.18.0.5', HTTP_X_REAL_IP='203.0.113.7')
+        direct = rf.get('/', REMOTE_ADDR='198.51.100.9', HTTP_X_REAL_IP='203.0.113.7')
+
+        assert client_ip(proxied) == '203.0.113.7'
+        # 프록시를 거치지 않은 요청은 헤더를 바꿔 가며 새 버킷을 받을 수 없다
+        assert client_ip(direct) == '198.51.100.9'
@@ -0,0 +1,139 @@
+import json
+import time
+from typing import Any, Iterator
+from unittest.mock import patch
+
+import pytest
+import requests
+import rsa
+from django.core.cache import cache
+from google.auth import crypt, jwt
+
+from config.http_client import http_client
+from users.services.google_certs import GoogleCertCache, verify_id_token
+from users.services.social_login import GoogleLoginService
+
+AUDIENCE = 'test-client'
+
+
+def make_key(key_id: str) -> tuple[crypt.RSASigner, str]:
+    # 테스트용 RSA 키: 인증서 대신 PKCS#1 공개키 PEM 도 검증기가 받아 준다
+    public_key, private_key = rsa.newkeys(1024)
+    signer = crypt.RSASigner.from_string(private_key.save_pkcs1().decode(), key_id=key_id)  # type: ignore[no-untyped-call]
+    return signer, public_key.save_pkcs1().decode()
+
+
+def make_token(signer: crypt.RSASigner, **claims: Any) -> str:
+    now = int(time.time())
+    payload = {
+        'iss': 'https://accounts.google.com',
+        'aud': AUDIENCE,
+        'sub': '12345',
+        'email': 'google@example.com',
+        'iat': now,
+        'exp': now + 600,
+        **claims,
+    }
+    token: bytes = jwt.encode(signer, payload)  # type: ignore[no-untyped-call]
+    return token.decode()
+
+
+def certs_response(certs: dict[str, str], max_age: int = 3600) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(certs).encode()
+    response.headers['Cache-Control'] = f'public, max-age={max_age}, must-revalidate, no-transform'
+    return response
+
+
+class TestGoogleCertCache:
+    @pytest.fixture(autouse=True)
+    def keys(self) -> Iterator[None]:
+        cache.clear()
+        GoogleCertCache.clear()
+        self.signer, self.public_pem = make_key('key-1')
+        yield
+        GoogleCertCache.clear()
+
+    def fetch(self, *responses: requests.Response) -> Any:
+        return patch.object(http_client, 'get', side_effect=list(responses))
+
+    def test_verifies_locally_after_first_fetch(self) -> None:
+        token = make_token(self.signer)
+        with self.fetch(certs_response({'key-1': self.public_pem})) as get:
+            for _ in range(3):
+                assert verify_id_token(token, AUDIENCE)['sub'] == '12345'
+
+        get.assert_called_once_with(GoogleCertCache.CERTS_URL)
+
+    def test_shared_cache_is_used_by_other_processes(self) -> None:
+        with self.fetch(certs_response({'key-1': self.public_pem})):
+            GoogleCertCache.certs()
+        # 다른 워커 프로세스: 메모리 캐시는 비어 있고 공유 캐시만 있다
+        GoogleCertCache._use({}, 0.0, 0.0)
+
+        with self.fetch() as get:
+            assert verify_id_token(make_token(self.signer), AUDIENCE)['email'] == 'google@example.com'
+        get.assert_not_called()
+
+    def test_max_age_is_honoured(self) -> None:
+        now = time.time()
+        with self.fetch(certs_response({'key-1': self.public_pem}, max_age=120), certs_response({})) as get:
+            GoogleCertCache.certs()
+            assert GoogleCertCache._expires_at == pytest.approx(now + 120, abs=5)
+
+            with patch('users.services.google_certs.time.time', return_value=now + 121):
+                assert GoogleCertCache.certs() == {}
+        assert get.call_count == 2
+
+    def test_refreshes_in_background_before_expiry(self) -> None:
+        with self.fetch(
+            certs_response({'key-1': self.public_pem}, max_age=GoogleCertCache.REFRESH_MARGIN + 10),
+            certs_response({'key-1': self.public_pem, 'key-2': 'next'}),
+        ) as get:
+            GoogleCertCache.certs()
+            assert get.call_count == 1
+            with patch('users.services.google_certs.time.time', return_value=GoogleCertCache._refresh_at + 1):
+                # 만료 전이라 기존 인증서를 바로 돌려주고 갱신은 뒤에서 한다
+                assert set(GoogleCertCache.certs()) == {'key-1'}
+            deadline = time.time() + 5
+            while 'key-2' not in GoogleCertCache._certs and time.time() < deadline:
+                time.sleep(0.01)
+
+        assert get.call_count == 2
+        assert set(GoogleCertCache.certs()) == {'key-1', 'key-2'}
+
+    def test_unknown_key_id_triggers_one_refetch(self) -> None:
+        new_signer, new_pem = make_key('key-2')
+        with self.fetch(
+            certs_response({'key-1': self.public_pem}),
+            certs_response({'key-1': self.public_pem, 'key-2': new_pem}),
+        ) as get:
+            GoogleCertCache.certs()
+            assert verify_id_token(make_token(new_signer), AUDIENCE)['sub'] == '12345'
+        assert get.call_count == 2
+
+        # 모르는 kid 가 계속 와도 최소 간격 안에서는 다시 받지 않는다
+        unknown_signer, _ = make_key('key-3')
+        with self.fetch() as get, pytest.raises(ValueError):
+            verify_id_token(make_token(unknown_signer), AUDIENCE)
+        get.assert_not_called()
+
+    @pytest.mark.parametrize('claims', [{'aud': 'other-client'}, {'iat': 1, 'exp': 2}])
+    def test_invalid_tokens_are_rejected(self, claims: dict[str, Any]) -> None:
+        with self.fetch(certs_response({'key-1': self.public_pem})):
+            with pytest.raises(ValueError):
+                verify_id_token(make_token(self.signer, **claims), AUDIENCE)
+
+    def test_forged_signature_is_rejected(self) -> None:
+        forger, _ = make_key('key-1')
+        with self.fetch(certs_response({'key-1': self.public_pem})):
+            assert GoogleLoginService.verify_google_token(make_token(forger)) is None
+
+    def test_google_login_service_uses_cached_certs(self, settings: Any) -> None:
+        settings.GOOGLE_OAUTH2_CLIENT_ID = AUDIENCE
+        with self.fetch(certs_response({'key-1': self.public_pem})):
+            idinfo = GoogleLoginService.verify_google_token(make_token(self.signer))
+
+        assert idinfo is not None
+        assert idinfo['sub'] == '12345'
@@ -0,0 +1,187 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+from unittest.mock import patch
+
+import pytest
+import requests
+from asgiref.sync import async_to_sync
+from django.test import Client
+from django.urls import reverse
+
+from config.http_client import HttpClient
+from users.models import User
+from users.services.social_login import KakaoLoginService
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # keep-alive 를 쓰려면 HTTP/1.1 로 응답해야 한다
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self) -> None:
+        server: StubServer = self.server  # type: ignore[assignment]
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode() if length else ''
+        server.calls.append((self.command, self.path, self.client_address[1], body))
+
+        if self.path == '/slow':
+            time.sleep(1)
+            self._send_json(200, {})
+        elif self.path == '/flaky' and server.failures_left > 0:
+            server.failures_left -= 1
+            self._send_json(503, {})
+        elif self.path == '/oauth/token':
+            self._send_json(200, {'access_token': 'stub-token'})
+        elif self.path == '/v2/user/me':
+            self._send_json(200, {
+                'id': 777,
+                'kakao_account': {'email': 'stub@kakao.com', 'profile': {'nickname': '스텁사용자'}},
+            })
+        elif self.path == '/cookie':
+            self.send_response(200)
+            self.send_header('Set-Cookie', 'sid=secret; Path=/')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        else:
+            self._send_json(200, {'path': self.path})
+
+    do_GET = _handle
+    do_POST = _handle
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.calls: list[tuple[str, str, int, str]] = []
+        self.failures_left = 0
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+
+@pytest.fixture
+def stub_server() -> Iterator[StubServer]:
+    server = StubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestHttpClient:
+    def setup_method(self) -> None:
+        self.client = HttpClient(connect_timeout=1, read_timeout=0.3, retries=2, backoff_factor=0)
+
+    def teardown_method(self) -> None:
+        self.client.close()
+
+    def test_connections_are_reused(self, stub_server: StubServer) -> None:
+        for _ in range(3):
+            assert self.client.get(f'{stub_server.url}/ping').json() == {'path': '/ping'}
+
+        client_ports = {port for _, _, port, _ in stub_server.calls}
+        assert len(stub_server.calls) == 3
+        assert len(client_ports) == 1
+
+    def test_read_timeout(self, stub_server: StubServer) -> None:
+        client = HttpClient(connect_timeout=1, read_timeout=0.3, retries=0)
+        started = time.monotonic()
+        # 재시도 어댑터를 거치면 읽기 timeout 도 ConnectionError 로 감싸져 올라온다
+        with pytest.raises(requests.RequestException, match='Read timed out'):
+            client.get(f'{stub_server.url}/slow')
+        assert time.monotonic() - started < 1
+        client.close()
+
+    def test_get_retries_unavailable_responses(self, stub_server: StubServer) -> None:
+        stub_server.failures_left = 2
+
+        response = self.client.get(f'{stub_server.url}/flaky')
+
+        assert response.status_code == 200
+        assert len(stub_server.calls) == 3
+
+    def test_post_is_not_retried_on_unavailable_response(self, stub_server: StubServer) -> None:
+        stub_server.failures_left = 2
+
+        response = self.client.post(f'{stub_server.url}/flaky', data={'code': 'once'})
+
+        assert response.status_code == 503
+        assert len(stub_server.calls) == 1
+
+    def test_connect_error_is_raised_after_retries(self) -> None:
+        # 아무도 듣지 않는 포트
+        server = StubServer()
+        url = server.url
+        server.server_close()
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            self.client.post(f'{url}/oauth/token')
+
+    def test_async_variant_shares_the_pool(self, stub_server: StubServer) -> None:
+        self.client.get(f'{stub_server.url}/ping')
+        response = async_to_sync(self.client.aget)(f'{stub_server.url}/ping')
+
+        assert response.json() == {'path': '/ping'}
+        assert len({port for _, _, port, _ in stub_server.calls}) == 1
+
+    def test_session_does_not_keep_cookies(self, stub_server: StubServer) -> None:
+        response = self.client.get(f'{stub_server.url}/cookie')
+
+        assert response.cookies.get('sid') == 'secret'
+        assert len(self.client.session.cookies) == 0
+
+
+@pytest.mark.django_db
+class TestKakaoLoginAgainstStub:
+    @pytest.fixture(autouse=True)
+    def kakao_urls(self, stub_server: StubServer) -> Iterator[None]:
+        with patch.object(KakaoLoginService, 'TOKEN_URL', f'{stub_server.url}/oauth/token'), \
+                patch.object(KakaoLoginService, 'USER_INFO_URL', f'{stub_server.url}/v2/user/me'):
+            yield
+
+    def test_exchange_code(self, stub_server: StubServer) -> None:
+        access_token, error = async_to_sync(KakaoLoginService.aexchange_code)('auth-code')
+
+        assert (access_token, error) == ('stub-token', None)
+        method, path, _, body = stub_server.calls[0]
+        assert (method, path) == ('POST', '/oauth/token')
+        assert 'code=auth-code' in body
+
+    def test_callback_logs_in_user(self, stub_server: StubServer) -> None:
+        client = Client()
+
+        response = client.get(reverse('kakao-callback'), {'code': 'auth-code'})
+
+        assert response.status_code == 302
+        user = User.objects.get(kakao_id='777')
+        assert user.email == 'stub@kakao.com'
+        assert client.session['_auth_user_id'] == str(user.pk)
+        assert [path for _, path, _, _ in stub_server.calls] == ['/oauth/token', '/v2/user/me']
+
+    def test_callback_reports_unreachable_kakao(self) -> None:
+        server = StubServer()
+        url = server.url
+        server.server_close()
+
+        with patch.object(KakaoLoginService, 'TOKEN_URL', f'{url}/oauth/token'):
+            response = Client().get(reverse('kakao-callback'), {'code': 'auth-code'})
+
+        assert response.status_code == 502
+        assert not response.json()['success']
@@ -42,7 +42,7 @@ class TestKakaoCallbackView:
         assert not data['success']
         assert data['message'] == '인증 코드가 없습니다.'
     
-    @patch('requests.post')
+    @patch('requests.Session.request')
     def test_kakao_callback_token_request_failure(self, mock_post: Any, client: Client, kakao_callback_url: str) -> None:
         mock_response = Mock()
         mock_response.status_code = 400
@@ -55,7 +55,7 @@ class TestKakaoCallbackView:
         assert not data['success']
         assert data['message'] == '액세스 토큰 획득에 실패했습니다.'
     
-    @patch('requests.post')
+    @patch('requests.Session.request')
     def test_kakao_callback_missing_access_token(self, mock_post: Any, client: Client, kakao_callback_url: str) -> None:
         mock_response = Mock()
         mock_response.status_code = 200
@@ -70,8 +70,8 @@ class TestKakaoCallbackView:
         assert data['message'] == '액세스 토큰이 없습니다.'
     
     @pytest.mark.django_db
-    @patch('requests.post')
-    @patch('users.services.social_login.KakaoLoginService.authenticate_user')
+    @patch('requests.Session.request')
+    @patch('users.services.social_login.KakaoLoginService.aauthenticate_user')
     def test_kakao_callback_authentication_failure(self, mock_authenticate: Any, mock_post: Any, client: Client, kakao_callback_url: str) -> None:
         # 토큰 요청 성공 모킹
         mock_response = Mock()
@@ -90,8 +90,8 @@ class TestKakaoCallbackView:
         assert data['message'] == '인증 실패'
     
     @pytest.mark.django_db
-    @patch('requests.post')
-    @patch('users.services.social_login.KakaoLoginService.authenticate_user')
+    @patch('requests.Session.request')
+    @patch('users.services.social_login.KakaoLoginService.aauthenticate_user')
     def test_kakao_callback_success_with_consent_redirect(self, mock_authenticate: Any, mock_post: Any, client: Client, kakao_callback_url: str) -> None:
         # 동의가 완료되지 않은 사용자 생성
         user = User.objects.create_user(
@@ -116,8 +116,8 @@ class TestKakaoCallbackView:
         assert response['Location'] == '/'
     
     @pytest.mark.django_db
-    @patch('requests.post')
-    @patch('users.services.social_login.KakaoLoginService.authenticate_user')
+    @patch('requests.Session.request')
+    @patch('users.services.social_login.KakaoLoginService.aauthenticate_user')
     def test_kakao_callback_success_with_home_redirect(self, mock_authenticate: Any, mock_post: Any, client: Client, kakao_callback_url: str, test_user: 'User') -> None:
         # 토큰 요청 성공 모킹
         mock_response = Mock()
@@ -133,8 +133,8 @@ class TestKakaoCallbackView:
         assert response.status_code == 302
         assert response['Location'] == '/'
     
-    @patch('requests.post')
-    @patch('users.services.social_login.KakaoLoginService.authenticate_user')
+    @patch('requests.Session.request')
+    @patch('users.services.social_login.KakaoLoginService.aauthenticate_user')
     def test_kakao_callback_server_error(self, mock_authenticate: Any, mock_post: Any, client: Client, kakao_callback_url: str) -> None:
         # 토큰 요청에서 예외 발생
         mock_post.side_effect = Exception("Network error")
@@ -1,8 +1,15 @@
+from typing import Any
+
 import pytest
+from django.core.cache import cache
+from django.db import connection
 from django.test import RequestFactory
 from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 
 from users.models import User
+from users.services.principal import PrincipalService
 from users.utils.permission import AdminPermission
 
 
@@ -27,4 +34,136 @@ class TestPermission:
 
         permission = AdminPermission()
         permission.request = request
-        assert permission.test_func()
\ No newline at end of file
+        assert permission.test_func()
+
+@pytest.mark.django_db
+class TestCachedPrincipal:
+    @pytest.fixture(autouse=True)
+    def shared_cache(self, settings: Any) -> None:
+        # 테스트는 한 프로세스라 locmem 도 공유 캐시처럼 동작한다
+        settings.USER_PRINCIPAL_CACHE_ENABLED = True
+
+    def setup_method(self) -> None:
+        cache.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='principal_admin',
+            email='principal@test.com',
+            password='testtest',
+            phone_number='00000000001',
+            personal_info_consent=True,
+            terms_of_use=True,
+            role='admin'
+        )
+        self.client.login(email='principal@test.com', password='testtest')
+        self.url = reverse('product-page-cache-stats')
+
+    def user_queries(self) -> list[str]:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+        self.status_code = response.status_code
+        return [q['sql'] for q in queries if '"users"' in q['sql']]
+
+    def test_admin_requests_skip_users_table_after_first(self) -> None:
+        assert len(self.user_queries()) == 1
+        assert self.status_code == 200
+
+        assert self.user_queries() == []
+        assert self.status_code == 200
+
+    def test_admin_html_page_skips_users_table_after_first(self) -> None:
+        self.url = reverse('product-create')
+        self.user_queries()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        assert response.status_code == 200
+        assert 'ADMIN' in response.content.decode()
+        assert [q['sql'] for q in queries if '"users"' in q['sql']] == []
+
+    def test_anonymous_page_shows_login_menu(self) -> None:
+        self.client.logout()
+        content = self.client.get(reverse('home')).content.decode()
+
+        assert 'LOGIN' in content
+        assert 'ADMIN' not in content
+
+    def test_role_change_invalidates_principal(self) -> None:
+        self.user_queries()
+        self.user.role = User.Role.CONSUMER
+        self.user.save(update_fields=['role'])
+
+        assert len(self.user_queries()) == 1
+        assert self.status_code == 403
+
+    def test_last_login_update_keeps_principal(self) -> None:
+        self.user_queries()
+        self.user.save(update_fields=['last_login'])
+
+        assert self.user_queries() == []
+
+    def test_password_change_logs_out_other_sessions(self) -> None:
+        self.user_queries()
+        self.user.set_password('changed')
+        self.user.save()
+
+        self.user_queries()
+        # 세션 해시가 맞지 않아 로그아웃되고 로그인 페이지로 보낸다
+        assert self.status_code == 302
+
+    def test_principal_expires_after_max_age(self, settings: Any) -> None:
+        self.user_queries()
+        settings.USER_PRINCIPAL_MAX_AGE = 0
+
+        assert len(self.user_queries()) == 1
+
+    def test_lost_version_rebuilds_from_database(self) -> None:
+        self.user_queries()
+        cache.clear()
+
+        assert len(self.user_queries()) == 1
+        assert self.user_queries() == []
+
+    def test_anonymous_is_rejected_without_user_lookup(self) -> None:
+        self.client.logout()
+
+        assert self.user_queries() == []
+        assert self.status_code == 302
+
+    def test_inactive_principal_is_rejected(self) -> None:
+        self.user_queries()
+        session = self.client.session
+        session[PrincipalService.SESSION_KEY] = {**session[PrincipalService.SESSION_KEY], 'is_active': False}
+        session.save()
+
+        self.user_queries()
+        assert self.status_code == 403
+
+
+@pytest.mark.django_db
+class TestPrincipalWithoutSharedCache:
+    def setup_method(self) -> None:
+        cache.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='principal_admin',
+            email='principal@test.com',
+            password='testtest',
+            phone_number='00000000001',
+            personal_info_consent=True,
+            terms_of_use=True,
+            role='admin'
+        )
+        self.client.login(email='principal@test.com', password='testtest')
+        self.url = reverse('product-page-cache-stats')
+
+    def test_role_is_checked_live_and_session_is_untouched(self, settings: Any) -> None:
+        settings.USER_PRINCIPAL_CACHE_ENABLED = False
+
+        assert self.client.get(self.url).status_code == 200
+        assert PrincipalService.SESSION_KEY not in self.client.session
+
+        self.user.role = User.Role.CONSUMER
+        self.user.save(update_fields=['role'])
+        assert self.client.get(self.url).status_code == 403
@@ -0,0 +1,173 @@
+import runpy
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+from django.conf import settings as django_settings
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django_session_timeout.middleware import SESSION_TIMEOUT_KEY
+
+from config.session_db import SessionStore as DBSessionStore
+from config.session_db import clear_expired_in_batches
+from config.session_store import SessionStore
+from users.models import User
+
+SETTINGS_PATH = str(Path(django_settings.BASE_DIR) / 'config' / 'settings.py')
+
+
+def stored(session_key: str) -> dict[str, Any]:
+    data: dict[str, Any] = SessionStore().decode(Session.objects.get(session_key=session_key).session_data)
+    return data
+
+
+@pytest.mark.django_db
+class TestSessionStore:
+
+    def setup_method(self) -> None:
+        cache.clear()
+        self.session = SessionStore()
+        self.session['user'] = 'a'
+        self.session[SESSION_TIMEOUT_KEY] = time.time()
+        self.session.create()
+        key = self.session.session_key
+        assert key is not None
+        self.key = key
+
+    def reload(self) -> SessionStore:
+        session = SessionStore(self.key)
+        session.load()
+        return session
+
+    def test_activity_only_change_stays_in_cache(self) -> None:
+        persisted_at = self.session[SESSION_TIMEOUT_KEY]
+        session = self.reload()
+        session[SESSION_TIMEOUT_KEY] = persisted_at + 30
+
+        with CaptureQueriesContext(connection) as queries:
+            session.save()
+
+        assert len(queries) == 0
+        assert stored(self.key)[SESSION_TIMEOUT_KEY] == persisted_at
+        assert self.reload()[SESSION_TIMEOUT_KEY] == persisted_at + 30
+
+    def test_activity_is_persisted_after_interval(self, settings: Any) -> None:
+        session = self.reload()
+        session[SESSION_TIMEOUT_KEY] += settings.SESSION_PERSIST_INTERVAL + 1
+        session.save()
+
+        assert stored(self.key)[SESSION_TIMEOUT_KEY] == session[SESSION_TIMEOUT_KEY]
+
+    def test_other_changes_are_persisted_immediately(self) -> None:
+        session = self.reload()
+        session['user'] = 'b'
+        session[SESSION_TIMEOUT_KEY] += 1
+        session.save()
+
+        assert stored(self.key)['user'] == 'b'
+
+    def test_cache_miss_falls_back_to_database(self) -> None:
+        session = self.reload()
+        session[SESSION_TIMEOUT_KEY] += 30
+        session.save()
+        cache.clear()
+
+        session = self.reload()
+        assert session['user'] == 'a'
+        assert session[SESSION_TIMEOUT_KEY] == self.session[SESSION_TIMEOUT_KEY]
+        # DB 에서 다시 읽은 뒤에도 활동 시각만 바뀌면 캐시에만 쓴다
+        session[SESSION_TIMEOUT_KEY] += 30
+        with CaptureQueriesContext(connection) as queries:
+            session.save()
+        assert len(queries) == 0
+
+    def test_delete_removes_cache_and_row(self) -> None:
+        self.reload().delete()
+
+        assert not Session.objects.filter(session_key=self.key).exists()
+        assert self.reload().is_empty()
+
+
+@pytest.mark.django_db
+class TestClearExpired:
+
+    def test_deletes_only_expired_sessions_in_batches(self) -> None:
+        now = timezone.now()
+        for index in range(5):
+            Session.objects.create(session_key=f'expired{index}', session_data='', expire_date=now - timedelta(seconds=1))
+        Session.objects.create(session_key='alive', session_data='', expire_date=now + timedelta(hours=1))
+
+        with CaptureQueriesContext(connection) as queries:
+            deleted = clear_expired_in_batches(Session, batch_size=2)
+
+        assert deleted == 5
+        assert list(Session.objects.values_list('session_key', flat=True)) == ['alive']
+        assert len([q for q in queries if q['sql'].startswith('DELETE')]) == 3
+
+    @pytest.mark.parametrize('store', [SessionStore, DBSessionStore])
+    def test_clear_expired_uses_batches(self, store: Any, settings: Any) -> None:
+        settings.SESSION_CLEANUP_BATCH_SIZE = 1
+        for index in range(2):
+            Session.objects.create(session_key=f'expired{index}', session_data='', expire_date=timezone.now() - timedelta(seconds=1))
+
+        with CaptureQueriesContext(connection) as queries:
+            store.clear_expired()
+
+        assert not Session.objects.exists()
+        assert len([q for q in queries if q['sql'].startswith('DELETE')]) == 2
+
+    def test_clearsessions_uses_default_engine(self, settings: Any) -> None:
+        assert settings.SESSION_ENGINE == 'config.session_db'
+        Session.objects.create(session_key='expired', session_data='', expire_date=timezone.now() - timedelta(seconds=1))
+
+        call_command('clearsessions')
+
+        assert not Session.objects.exists()
+
+
+@pytest.mark.django_db
+class TestSessionActivityGranularity:
+
+    def setup_method(self) -> None:
+        cache.clear()
+        self.client = Client()
+        User.objects.create_user(username='test', email='test@test.com', password='testtest', phone_number='00000000000', personal_info_consent=True, terms_of_use=True)
+
+    def test_requests_within_granularity_do_not_write_session(self, settings: Any) -> None:
+        settings.SESSION_ENGINE = 'config.session_store'
+        self.client.login(email='test@test.com', password='testtest')
+        self.client.get('/')
+
+        with CaptureQueriesContext(connection) as queries:
+            for _ in range(3):
+                assert self.client.get('/').status_code == 200
+
+        assert not [q for q in queries if 'django_session' in q['sql']]
+
+
+class TestSessionEngineSettings:
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch: Any) -> None:
+        for name in ('SESSION_CACHE_ENABLED', 'SESSION_CACHE_ALIAS', 'CACHE_URL'):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv('SESSION_CACHE_ENABLED', 'true')
+
+    @pytest.mark.parametrize('cache_url', ['locmemcache://sessions', 'dummycache://'])
+    def test_process_local_cache_is_refused(self, monkeypatch: Any, cache_url: str) -> None:
+        monkeypatch.setenv('CACHE_URL', cache_url)
+
+        with pytest.raises(ImproperlyConfigured):
+            runpy.run_path(SETTINGS_PATH)
+
+    def test_shared_cache_enables_write_behind_store(self, monkeypatch: Any) -> None:
+        monkeypatch.setenv('CACHE_URL', 'pymemcache://127.0.0.1:11211')
+
+        assert runpy.run_path(SETTINGS_PATH)['SESSION_ENGINE'] == 'config.session_store'
@@ -8,6 +8,7 @@ from django.test import Client
 from django.urls import reverse
 
 from users.services.social_login import GoogleLoginService, KakaoLoginService
+from users.services.username import UsernameAllocator
 
 if TYPE_CHECKING:
     from users.models import User
@@ -172,7 +173,7 @@ class TestSocialLoginService:
     @pytest.mark.django_db
     def test_google_generate_unique_username(self) -> None:
         # 기존 사용자가 없는 경우
-        username = GoogleLoginService._generate_unique_username('test@example.com')
+        username = UsernameAllocator.next_free('test')
         assert username == 'test'
         
         # 기존 사용자가 있는 경우
@@ -182,7 +183,7 @@ class TestSocialLoginService:
             personal_info_consent=True,
             terms_of_use=True
         )
-        username = GoogleLoginService._generate_unique_username('test@example.com')
+        username = UsernameAllocator.next_free('test')
         assert username == 'test_1'
         
         # 여러 기존 사용자가 있는 경우
@@ -192,10 +193,10 @@ class TestSocialLoginService:
             personal_info_consent=True,
             terms_of_use=True
         )
-        username = GoogleLoginService._generate_unique_username('test@example.com')
+        username = UsernameAllocator.next_free('test')
         assert username == 'test_2'
     
-    @patch('google.oauth2.id_token.verify_oauth2_token')
+    @patch('users.services.social_login.verify_id_token')
     def test_google_verify_token_success(self, mock_verify: Any) -> None:
         mock_verify.return_value = {
             'iss': 'accounts.google.com',
@@ -211,7 +212,7 @@ class TestSocialLoginService:
         assert result['sub'] == '12345'
         assert result['email'] == 'test@example.com'
     
-    @patch('google.oauth2.id_token.verify_oauth2_token')
+    @patch('users.services.social_login.verify_id_token')
     def test_google_verify_token_wrong_issuer(self, mock_verify: Any) -> None:
         mock_verify.return_value = {
             'iss': 'evil.com',
@@ -223,7 +224,7 @@ class TestSocialLoginService:
         
         assert result is None
     
-    @patch('google.oauth2.id_token.verify_oauth2_token')
+    @patch('users.services.social_login.verify_id_token')
     def test_google_verify_token_value_error(self, mock_verify: Any) -> None:
         mock_verify.side_effect = ValueError("Invalid token")
         
@@ -231,7 +232,7 @@ class TestSocialLoginService:
         
         assert result is None
     
-    @patch('google.oauth2.id_token.verify_oauth2_token')
+    @patch('users.services.social_login.verify_id_token')
     def test_google_verify_token_general_exception(self, mock_verify: Any) -> None:
         mock_verify.side_effect = Exception("Network error")
         
@@ -367,7 +368,7 @@ class TestSocialLoginService:
     @pytest.mark.django_db
     def test_kakao_generate_unique_username(self) -> None:
         # 기존 사용자가 없는 경우
-        username = KakaoLoginService._generate_unique_username('카카오사용자')
+        username = UsernameAllocator.next_free('카카오사용자')
         assert username == '카카오사용자'
         
         # 기존 사용자가 있는 경우
@@ -377,11 +378,11 @@ class TestSocialLoginService:
             personal_info_consent=True,
             terms_of_use=True
         )
-        username = KakaoLoginService._generate_unique_username('카카오사용자')
+        username = UsernameAllocator.next_free('카카오사용자')
         assert username == '카카오사용자_1'
     
     @pytest.mark.django_db
-    @patch('requests.get')
+    @patch('requests.Session.request')
     def test_kakao_get_user_info_success(self, mock_get: Any) -> None:
         from unittest.mock import Mock
         mock_response = Mock()
@@ -405,7 +406,7 @@ class TestSocialLoginService:
         assert result['kakao_account']['email'] == 'test@kakao.com'
     
     @pytest.mark.django_db
-    @patch('requests.get')
+    @patch('requests.Session.request')
     def test_kakao_get_user_info_failure(self, mock_get: Any) -> None:
         from unittest.mock import Mock
         mock_response = Mock()
@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+
+from users.models import User
+from users.services.username import UsernameAllocator
+
+
+def make_users(*usernames: str) -> None:
+    User.objects.bulk_create([
+        User(username=username, email=f'{index}@example.com', personal_info_consent=True, terms_of_use=True)
+        for index, username in enumerate(usernames)
+    ])
+
+
+@pytest.mark.django_db
+class TestUsernameAllocator:
+
+    def test_free_base_is_used_as_is(self) -> None:
+        assert UsernameAllocator.next_free('kim') == 'kim'
+
+    def test_next_suffix_after_largest(self) -> None:
+        make_users('kim', 'kim_1', 'kim_7')
+        assert UsernameAllocator.next_free('kim') == 'kim_8'
+
+    def test_unrelated_names_are_ignored(self) -> None:
+        # 숫자가 아닌 접미사, LIKE/정규식 특수문자가 들어간 비슷한 이름은 세지 않는다
+        make_users('a_b', 'aXb_3', 'a_b_x', 'a_b_1x', 'a_b_2_3', 'a.b_9')
+        assert UsernameAllocator.next_free('a_b') == 'a_b_1'
+        assert UsernameAllocator.next_free('a.b') == 'a.b'
+
+    def test_collisions_cost_a_single_query(self) -> None:
+        make_users('kim', *[f'kim_{number}' for number in range(1, 2001)])
+
+        with CaptureQueriesContext(connection) as queries:
+            username = UsernameAllocator.next_free('kim')
+
+        assert username == 'kim_2001'
+        assert len(queries) == 1
+
+    def test_long_base_leaves_room_for_suffix(self) -> None:
+        base = 'k' * 200
+        username = UsernameAllocator.next_free(base)
+        make_users(username)
+
+        assert len(UsernameAllocator.next_free(base)) <= 150
+
+    def test_create_user_retries_when_name_is_taken_concurrently(self) -> None:
+        make_users('kim')
+        next_free = UsernameAllocator.next_free
+        # 첫 집계 뒤 다른 요청이 같은 이름을 먼저 저장한 상황
+        with patch.object(UsernameAllocator, 'next_free', side_effect=['kim', next_free('kim')]) as allocate:
+            user = UsernameAllocator.create_user(
+                'kim', email='new@example.com', personal_info_consent=False, terms_of_use=False
+            )
+
+        assert user.username == 'kim_1'
+        assert allocate.call_count == 2
+
+    def test_other_integrity_errors_are_raised(self) -> None:
+        make_users('kim')
+        with pytest.raises(IntegrityError):
+            UsernameAllocator.create_user('lee', email='0@example.com', personal_info_consent=False, terms_of_use=False)
+        assert not User.objects.filter(username='lee').exists()
+
+    def test_largest_suffix_taken_falls_back_to_random(self) -> None:
+        # 가장 큰 접미사를 선점해도 같은 이름으로 가입을 막을 수 없다
+        make_users('kim', 'kim_999999999', 'kim_1000000000')
+
+        user = UsernameAllocator.create_user(
+            'kim', email='new@example.com', personal_info_consent=False, terms_of_use=False
+        )
+
+        assert user.username.startswith('kim_')
+        assert user.username not in ('kim_999999999', 'kim_1000000000')
+        assert len(user.username) <= len('kim_') + UsernameAllocator.SUFFIX_DIGITS
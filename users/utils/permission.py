@@ -1,14 +1,14 @@
-from typing import cast
-
 from django.contrib.auth.mixins import UserPassesTestMixin
 from django.http import HttpRequest
 
 from users.models import User
+from users.services.principal import PrincipalService
 
 
 class AdminPermission(UserPassesTestMixin):
     request: HttpRequest
     
     def test_func(self) -> bool:
-        user = cast(User, self.request.user)
-        return user.is_authenticated and user.role == 'admin'
+        # 세션에 저장한 권한 요약으로 판단해 users 테이블을 읽지 않는다
+        principal = PrincipalService.get(self.request)
+        return principal is not None and principal['is_active'] and principal['role'] == User.Role.ADMIN
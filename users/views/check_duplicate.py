@@ -1,47 +1,42 @@
+import math
+
+from django.conf import settings
 from django.http import HttpRequest, JsonResponse
 from django.views import View
 
-from users.models import User
+from config.rate_limit import RateLimiter, client_ip
+from users.services.availability import AvailabilityService
+
+MESSAGES = {
+    'username': ('사용 가능한 아이디입니다.', '이미 존재하는 아이디입니다.'),
+    'email': ('사용 가능한 이메일입니다.', '이미 가입된 이메일입니다.'),
+}
 
 
 class CheckDuplicateView(View):
-    def get(self, request: HttpRequest) -> JsonResponse:
-        username = request.GET.get('username', '').strip()
-        email = request.GET.get('email', '').strip()
-        
-        result = {
-            'username': {
-                'available': True,
-                'message': ''
-            },
-            'email': {
-                'available': True,
-                'message': ''
+    async def get(self, request: HttpRequest) -> JsonResponse:
+        # 로그인 없이 열려 있고 입력할 때마다 불리므로 IP 별로 호출 수를 제한한다
+        limiter = RateLimiter('check-duplicate', settings.CHECK_DUPLICATE_RATE, settings.CHECK_DUPLICATE_BURST)
+        retry_after = await limiter.atake(client_ip(request))
+        if retry_after:
+            response = JsonResponse({
+                'success': False,
+                'message': '요청이 너무 많습니다. 잠시 후 다시 시도해주세요.'
+            }, status=429)
+            response['Retry-After'] = str(math.ceil(retry_after))
+            return response
+
+        values = {field: request.GET.get(field, '').strip() for field in MESSAGES}
+        values = {field: value for field, value in values.items() if value}
+
+        result = {field: {'available': True, 'message': ''} for field in MESSAGES}
+        # 아이디와 이메일을 한 번의 쿼리(또는 캐시)로 확인한다
+        availability = await AvailabilityService.acheck(values) if values else {}
+        for field, available in availability.items():
+            available_message, taken_message = MESSAGES[field]
+            result[field] = {
+                'available': available,
+                'message': available_message if available else taken_message
             }
-        }
-        
-        if username:
-            if User.objects.filter(username=username).exists():
-                result['username'] = {
-                    'available': False,
-                    'message': '이미 존재하는 아이디입니다.'
-                }
-            else:
-                result['username'] = {
-                    'available': True,
-                    'message': '사용 가능한 아이디입니다.'
-                }
-        
-        if email:
-            if User.objects.filter(email=email).exists():
-                result['email'] = {
-                    'available': False,
-                    'message': '이미 가입된 이메일입니다.'
-                }
-            else:
-                result['email'] = {
-                    'available': True,
-                    'message': '사용 가능한 이메일입니다.'
-                }
-        
+
         return JsonResponse(result)
@@ -1,6 +1,5 @@
 import requests
-from django.conf import settings
-from django.contrib.auth import login
+from django.contrib.auth import alogin
 from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.shortcuts import redirect
 from django.utils.decorators import method_decorator
@@ -15,7 +14,7 @@ from users.services.social_login import KakaoLoginService
 class KakaoCallbackView(View):
     """카카오 로그인 콜백 처리 뷰"""
     
-    def get(self, request: HttpRequest) -> HttpResponse:
+    async def get(self, request: HttpRequest) -> HttpResponse:
         try:
             # 인증 코드 받기
             code = request.GET.get('code')
@@ -26,35 +25,23 @@ class KakaoCallbackView(View):
                     'message': '인증 코드가 없습니다.'
                 }, status=400)
             
-            # 인증 코드를 액세스 토큰으로 교환
-            token_response = requests.post(
-                'https://kauth.kakao.com/oauth/token',
-                data={
-                    'grant_type': 'authorization_code',
-                    'client_id': settings.KAKAO_REST_API_KEY,
-                    'client_secret': settings.KAKAO_CLIENT_SECRET,
-                    'redirect_uri': settings.KAKAO_REDIRECT_URI,
-                    'code': code
-                }
-            )
-            
-            if token_response.status_code != 200:
+            # 인증 코드를 액세스 토큰으로 교환 (카카오 응답을 기다리는 동안 워커를 붙잡지 않는다)
+            try:
+                access_token, error = await KakaoLoginService.aexchange_code(code)
+            except requests.RequestException:
                 return JsonResponse({
                     'success': False,
-                    'message': '액세스 토큰 획득에 실패했습니다.'
-                }, status=400)
-            
-            token_data = token_response.json()
-            access_token = token_data.get('access_token')
-            
+                    'message': '카카오 인증 서버에 연결하지 못했습니다. 잠시 후 다시 시도해주세요.'
+                }, status=502)
+
             if not access_token:
                 return JsonResponse({
                     'success': False,
-                    'message': '액세스 토큰이 없습니다.'
+                    'message': error
                 }, status=400)
-            
+
             # 카카오 로그인 서비스로 인증 처리
-            user, error = KakaoLoginService.authenticate_user(access_token)
+            user, error = await KakaoLoginService.aauthenticate_user(access_token)
             
             if error:
                 return JsonResponse({
@@ -64,7 +51,7 @@ class KakaoCallbackView(View):
             
             if user:
                 # 사용자 로그인
-                login(request, user)
+                await alogin(request, user)
                 
                 # 안전한 리다이렉트 URL 결정
                 next_url = request.GET.get('next', '/')